@@ -0,0 +1,125 @@
+"""
+bench_arrival.py
+----------------
+Membandingkan latensi deteksi kedatangan antara loop polling 1 Hz (cara lama
+di goto/fly_to/execute_waypoints) dan ArrivalWatcher berbasis listener.
+
+Menggunakan fake vehicle lokal, jadi tidak butuh SITL:
+    python benchmarks/bench_arrival.py --legs 10
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from irc_mission.arrival import ArrivalWatcher  # noqa: E402
+from irc_mission.geo import get_distance  # noqa: E402
+
+DEG_PER_METER = 1 / 1.113195e5
+
+
+class Location:
+    def __init__(self, lat, lon, alt):
+        self.lat, self.lon, self.alt = lat, lon, alt
+
+
+class FakeLocations:
+    """Meniru vehicle.location: menyimpan posisi dan memanggil listener."""
+
+    def __init__(self):
+        self.global_relative_frame = Location(-6.5, 106.7, 10)
+        self._listeners = []
+
+    def add_attribute_listener(self, name, fn):
+        self._listeners.append(fn)
+
+    def remove_attribute_listener(self, name, fn):
+        self._listeners.remove(fn)
+
+    def publish(self, location):
+        self.global_relative_frame = location
+        for fn in list(self._listeners):
+            fn(self, "global_relative_frame", location)
+
+
+class FakeVehicle:
+    """Terbang lurus ke target dengan kecepatan konstan, update posisi pada `rate_hz`."""
+
+    def __init__(self, speed=10.0, rate_hz=20.0):
+        self.location = FakeLocations()
+        self.speed = speed
+        self.period = 1.0 / rate_hz
+        self.arrived_at = None
+        self._thread = None
+
+    def simple_goto(self, target, threshold):
+        self.arrived_at = None
+        self._thread = threading.Thread(target=self._fly, args=(target, threshold), daemon=True)
+        self._thread.start()
+
+    def _fly(self, target, threshold):
+        step = self.speed * self.period * DEG_PER_METER
+        while True:
+            time.sleep(self.period)
+            pos = self.location.global_relative_frame
+            d_lat, d_lon = target.lat - pos.lat, target.lon - pos.lon
+            remaining = (d_lat ** 2 + d_lon ** 2) ** 0.5
+            if remaining <= step:
+                new = Location(target.lat, target.lon, target.alt)
+            else:
+                k = step / remaining
+                new = Location(pos.lat + d_lat * k, pos.lon + d_lon * k, target.alt)
+            if self.arrived_at is None and get_distance(new, target) <= threshold:
+                self.arrived_at = time.monotonic()
+            self.location.publish(new)
+            if new.lat == target.lat and new.lon == target.lon:
+                return
+
+
+def polling_wait(vehicle, target, threshold):
+    """Salinan loop lama tanpa print."""
+    while True:
+        if get_distance(vehicle.location.global_relative_frame, target) <= threshold:
+            return
+        time.sleep(1)
+
+
+def run(legs, leg_length, threshold, waiter):
+    vehicle = FakeVehicle()
+    latencies = []
+    for i in range(legs):
+        pos = vehicle.location.global_relative_frame
+        sign = 1 if i % 2 == 0 else -1
+        # Panjang leg divariasikan agar momen tiba tidak sinkron dengan jadwal polling
+        length = leg_length + 3.7 * (i % 5)
+        target = Location(pos.lat + sign * length * DEG_PER_METER, pos.lon, pos.alt)
+        vehicle.simple_goto(target, threshold)
+        waiter(vehicle, target, threshold)
+        detected = time.monotonic()
+        vehicle._thread.join()
+        latencies.append(detected - vehicle.arrived_at)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--legs", type=int, default=10)
+    parser.add_argument("--leg-length", type=float, default=10.0)
+    parser.add_argument("--threshold", type=float, default=1.5)
+    args = parser.parse_args()
+
+    def event_wait(vehicle, target, threshold):
+        ArrivalWatcher(vehicle).wait_until_arrived(target, threshold)
+
+    for name, waiter in (("polling 1 Hz", polling_wait), ("ArrivalWatcher", event_wait)):
+        lat = run(args.legs, args.leg_length, args.threshold, waiter)
+        print(f"{name:16s} rata-rata {sum(lat) / len(lat) * 1000:8.1f} ms | "
+              f"maks {max(lat) * 1000:8.1f} ms | total terbuang {sum(lat):6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
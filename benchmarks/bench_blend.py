@@ -0,0 +1,112 @@
+"""
+bench_blend.py
+--------------
+Mengukur mode look-ahead execute_waypoints() di SimVehicle: total waktu misi
+dan deviasi jalur dari garis lurus antar target, dibanding goto biasa yang
+berhenti di setiap sudut.
+
+Rute diambil dari contoh modul 03 (kotak, bintang, zigzag) dengan hover
+dihapus, karena look-ahead hanya berlaku di sudut tanpa hover. Butuh dronekit
+(tanpa SITL):
+    python benchmarks/bench_blend.py
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import math
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from irc_mission import SimClock, arm_and_takeoff, execute_waypoints  # noqa: E402
+from irc_mission.distance import local_offset  # noqa: E402
+from irc_mission.geo import get_offset_location  # noqa: E402
+from irc_mission.sim import SimVehicle  # noqa: E402
+
+EXAMPLES = ROOT / "modules" / "03-mission" / "examples"
+
+CONFIGS = [
+    ("goto biasa", {}),
+    ("radius 2m", {"acceptance_radius": 2.0}),
+    ("radius 4m", {"acceptance_radius": 4.0}),
+    ("radius 6m", {"acceptance_radius": 6.0}),
+    ("ttg 1.0s", {"time_to_go": 1.0}),
+    ("ttg 1.5s", {"time_to_go": 1.5}),
+]
+
+
+def load_example(filename, name):
+    spec = importlib.util.spec_from_file_location(filename[:-3], EXAMPLES / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, name)
+
+
+def load_routes():
+    square = [{"name": label, "d_north": dn, "d_east": de, "altitude": 10}
+              for dn, de, label, _ in load_example("02_square_pattern.py", "SQUARE_LEGS")]
+    star = [dict(wp, hover=0) for wp in load_example("03_multi_waypoint.py", "WAYPOINTS")]
+    zigzag = [{"name": label, "d_north": dn, "d_east": de, "altitude": alt}
+              for dn, de, alt, label in load_example("05_altitude_change.py", "MISSION_WAYPOINTS")]
+    return [("kotak", square), ("bintang", star), ("zigzag", zigzag)]
+
+
+def segment_distance(p, a, b):
+    """Jarak titik p ke segmen a-b dalam bidang lokal (meter)."""
+    ax, ay = b[0] - a[0], b[1] - a[1]
+    length2 = ax * ax + ay * ay
+    u = 0.0 if length2 == 0 else max(0.0, min(1.0, ((p[0] - a[0]) * ax + (p[1] - a[1]) * ay) / length2))
+    return math.hypot(p[0] - a[0] - u * ax, p[1] - a[1] - u * ay)
+
+
+def fly(route, options):
+    vehicle = SimVehicle()
+    clock = SimClock(vehicle)
+    with contextlib.redirect_stdout(io.StringIO()):
+        arm_and_takeoff(vehicle, 10, clock=clock)
+
+    start = vehicle.location.global_relative_frame
+    def local(location):
+        return local_offset(start.lat, start.lon, location.lat, location.lon)
+
+    # Rute nominal: target dirangkai dari target sebelumnya
+    polyline = [local(start)]
+    current = start
+    for wp in route:
+        current = get_offset_location(current, wp["d_north"], wp["d_east"], wp["altitude"])
+        polyline.append(local(current))
+
+    track = []
+    vehicle.location.add_attribute_listener(
+        "global_relative_frame", lambda _loc, _name, value: track.append(local(value)))
+    t0 = vehicle.time
+    with contextlib.redirect_stdout(io.StringIO()):
+        execute_waypoints(vehicle, route, clock=clock, **options)
+    duration = vehicle.time - t0
+
+    deviations = [min(segment_distance(p, a, b) for a, b in zip(polyline, polyline[1:]))
+                  for p in track]
+    return duration, max(deviations), sum(deviations) / len(deviations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.parse_args()
+
+    for route_name, route in load_routes():
+        print(f"\nRute {route_name} ({len(route)} waypoint)")
+        print(f"  {'mode':<12} {'waktu':>8} {'hemat':>7} {'dev maks':>9} {'dev rata2':>10}")
+        baseline = None
+        for label, options in CONFIGS:
+            duration, dev_max, dev_mean = fly(route, options)
+            baseline = baseline or duration
+            saved = (baseline - duration) / baseline * 100
+            print(f"  {label:<12} {duration:>7.1f}s {saved:>6.1f}% {dev_max:>8.2f}m {dev_mean:>9.2f}m")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+bench_connection.py
+-------------------
+Menguji deteksi link putus dan reconnect di tengah misi: SimVehicle
+diputus linknya (drop_link) pada waktu dan durasi acak saat terbang, lalu
+dibandingkan execute_waypoints() biasa dengan LinkMonitor (misi berhenti di
+leg yang terputus) dan ConnectionManager.execute_waypoints() (reconnect lalu
+melanjutkan leg yang sama).
+
+Memakai jam virtual, butuh dronekit (tanpa SITL):
+    python benchmarks/bench_connection.py --runs 10 --timeout 3
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from irc_mission import SimClock, arm_and_takeoff, execute_waypoints  # noqa: E402
+from irc_mission.connection import ConnectionManager, LinkLost, LinkMonitor  # noqa: E402
+from irc_mission.metrics import LatencyHistogram, get_histogram  # noqa: E402
+from irc_mission.sim import SimVehicle  # noqa: E402
+
+ROUTE = [
+    {"name": "A", "d_north": 40, "d_east": 0, "altitude": 10},
+    {"name": "B", "d_north": 0, "d_east": 40, "altitude": 10},
+    {"name": "C", "d_north": -40, "d_east": 0, "altitude": 10, "hover": 3},
+    {"name": "D", "d_north": 0, "d_east": -40, "altitude": 10},
+]
+
+
+def schedule_drop(vehicle, at, seconds):
+    """Putus link `seconds` detik begitu waktu simulasi melewati `at`."""
+    def on_location(_vehicle, _name, _location):
+        if vehicle.time >= at and not dropped:
+            dropped.append(vehicle.time)
+            vehicle.drop_link(seconds)
+
+    dropped = []
+    vehicle.location.add_attribute_listener("global_relative_frame", on_location)
+
+
+def fly(rng, timeout, resume, drop=True):
+    """Satu sortie. Return (waktu selesai, jumlah leg selesai, jeda HEARTBEAT saat dinyatakan putus)."""
+    vehicle = SimVehicle()
+    clock = SimClock(vehicle)
+    with contextlib.redirect_stdout(io.StringIO()):
+        arm_and_takeoff(vehicle, 10, clock=clock, report=False)
+    if drop:
+        schedule_drop(vehicle, vehicle.time + rng.uniform(5, 25), rng.uniform(5, 15))
+
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        if resume:
+            with ConnectionManager("sim", cache_dir=None, heartbeat_timeout=timeout,
+                                   connect_fn=lambda: vehicle, clock=clock) as manager:
+                manager.connect()
+                manager.execute_waypoints(ROUTE, clock=clock)
+                completed = len(ROUTE)
+        else:
+            with LinkMonitor(vehicle, timeout=timeout, clock=clock) as link:
+                try:
+                    execute_waypoints(vehicle, ROUTE, clock=clock, link=link)
+                    completed = len(ROUTE)
+                except LinkLost as exc:
+                    completed = exc.leg - 1
+    detected = [float(line.rsplit(" ", 1)[1].rstrip("s")) for line in out.getvalue().splitlines()
+                if line.startswith("[LINK] Putus:")]
+    return vehicle.time, completed, detected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=3.0, help="batas HEARTBEAT (detik)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    baseline = fly(random.Random(args.seed), args.timeout, resume=False, drop=False)[0]
+    detection = LatencyHistogram("deteksi")
+    aborted, resumed, overhead = [], [], []
+    for run in range(args.runs):
+        _, completed, _ = fly(random.Random(args.seed + run), args.timeout, resume=False)
+        aborted.append(completed)
+        end, completed, detected = fly(random.Random(args.seed + run), args.timeout, resume=True)
+        resumed.append(completed)
+        overhead.append(end - baseline)
+        for gap in detected:
+            detection.record(gap)
+
+    print(f"Rute {len(ROUTE)} leg, batas HEARTBEAT {args.timeout:.1f}s, {args.runs} sortie dengan link putus 5-15s")
+    print(f"  tanpa reconnect      : rata-rata {sum(aborted) / len(aborted):.1f}/{len(ROUTE)} leg selesai")
+    print(f"  ConnectionManager    : rata-rata {sum(resumed) / len(resumed):.1f}/{len(ROUTE)} leg selesai, "
+          f"tambahan waktu {sum(overhead) / len(overhead):.1f}s (maks {max(overhead):.1f}s)")
+    print(f"  {detection.format('s')}")
+    print(f"  {get_histogram('link.heartbeat').format('s')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+bench_distance.py
+-----------------
+Tabel akurasi dan kecepatan model jarak di irc_mission.distance.
+
+Referensi akurasi adalah geodesik WGS84 (rumus invers Vincenty). Galat
+ditampilkan dalam persen untuk beberapa lintang dan panjang leg, termasuk
+rumus lama tanpa koreksi cos(lintang):
+    python benchmarks/bench_distance.py
+"""
+
+import argparse
+import math
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from irc_mission.distance import (  # noqa: E402
+    WGS84_A, WGS84_F, distance_function, ecef_distance, equirectangular_distance,
+    haversine_distance,
+)
+from irc_mission.geo import get_distance_flat  # noqa: E402
+
+
+class Point:
+    __slots__ = ("lat", "lon", "alt")
+
+    def __init__(self, lat, lon, alt=0.0):
+        self.lat, self.lon, self.alt = lat, lon, alt
+
+
+def vincenty(p1, p2):
+    """Jarak geodesik WGS84 (meter), rumus invers Vincenty."""
+    a, f = WGS84_A, WGS84_F
+    b = a * (1 - f)
+    u1 = math.atan((1 - f) * math.tan(math.radians(p1.lat)))
+    u2 = math.atan((1 - f) * math.tan(math.radians(p2.lat)))
+    big_l = math.radians(p2.lon - p1.lon)
+    lam = big_l
+    sin_u1, cos_u1 = math.sin(u1), math.cos(u1)
+    sin_u2, cos_u2 = math.sin(u2), math.cos(u2)
+    for _ in range(200):
+        sin_lam, cos_lam = math.sin(lam), math.cos(lam)
+        sin_sigma = math.hypot(cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+        if sin_sigma == 0:
+            return 0.0
+        cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+        sigma = math.atan2(sin_sigma, cos_sigma)
+        sin_alpha = cos_u1 * cos_u2 * sin_lam / sin_sigma
+        cos2_alpha = 1 - sin_alpha ** 2
+        cos_2sm = cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha if cos2_alpha else 0.0
+        c = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+        lam_prev = lam
+        lam = big_l + (1 - c) * f * sin_alpha * (
+            sigma + c * sin_sigma * (cos_2sm + c * cos_sigma * (-1 + 2 * cos_2sm ** 2)))
+        if abs(lam - lam_prev) < 1e-13:
+            break
+    u_sq = cos2_alpha * (a * a - b * b) / (b * b)
+    big_a = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+    big_b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+    d_sigma = big_b * sin_sigma * (cos_2sm + big_b / 4 * (
+        cos_sigma * (-1 + 2 * cos_2sm ** 2)
+        - big_b / 6 * cos_2sm * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sm ** 2)))
+    return b * big_a * (sigma - d_sigma)
+
+
+def offset(p, d_north, d_east):
+    """Titik geser sederhana (hanya untuk membuat pasangan uji)."""
+    d_lat = d_north / 111_000
+    d_lon = d_east / (111_000 * math.cos(math.radians(p.lat)))
+    return Point(p.lat + d_lat, p.lon + d_lon)
+
+
+def accuracy_table():
+    models = [
+        ("lama", get_distance_flat),
+        ("equirect", equirectangular_distance),
+        ("haversine", haversine_distance),
+        ("ecef", ecef_distance),
+    ]
+    legs = [("20m T", 0, 20), ("20m TL", 14.1, 14.1), ("1km TL", 707, 707), ("10km TL", 7071, 7071)]
+    print("Galat relatif terhadap geodesik WGS84 (%)")
+    print("(ref_lat = equirectangular dengan konstanta dihitung sekali di titik awal)")
+    names = [name for name, _ in models] + ["ref_lat"]
+    print(f"{'lintang':>7} {'leg':>8} | " + " ".join(f"{name:>10}" for name in names))
+    for lat in (0, 15, 30, 45, 60, 75):
+        start = Point(lat + 0.001, 106.7)
+        fns = [fn for _, fn in models] + [distance_function("equirectangular", ref_lat=start.lat)]
+        for leg_name, dn, de in legs:
+            end = offset(start, dn, de)
+            ref = vincenty(start, end)
+            errors = [(fn(start, end) - ref) / ref * 100 for fn in fns]
+            print(f"{lat:>6}° {leg_name:>8} | " + " ".join(f"{e:>+10.4f}" for e in errors))
+
+
+def speed_table(number):
+    start = Point(-6.5569, 106.7308, 10)
+    end = offset(start, 35, 20)
+    end.alt = 12
+    models = [
+        ("lama", get_distance_flat),
+        ("equirect", equirectangular_distance),
+        ("equirect ref_lat", distance_function("equirectangular", ref_lat=start.lat)),
+        ("haversine", haversine_distance),
+        ("ecef", ecef_distance),
+    ]
+    print(f"\nWaktu per panggilan ({number} panggilan, terbaik dari 5)")
+    for name, fn in models:
+        best = min(timeit.repeat(lambda: fn(start, end), number=number, repeat=5))
+        print(f"  {name:18s} {best / number * 1e9:8.0f} ns")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=200000)
+    args = parser.parse_args()
+    accuracy_table()
+    speed_table(args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+bench_flightlog.py
+------------------
+Mengukur penulisan flight log dan waktu mengambil satu leg dari log survey
+panjang: baca berurutan file telemetri (read_telemetry) vs FlightLog.leg().
+
+Membutuhkan NumPy:
+    python benchmarks/bench_flightlog.py --legs 5000 --samples-per-leg 200
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from irc_mission.flightlog import FlightLog, FlightLogWriter, import_telemetry  # noqa: E402
+from irc_mission.telemetry import MAGIC, RECORD, read_telemetry  # noqa: E402
+
+
+def write_flightlog(path, legs, per_leg):
+    start = time.perf_counter()
+    with FlightLogWriter(path, chunk_size=8192) as log:
+        append = log.append
+        t = 0.0
+        for leg in range(1, legs + 1):
+            for i in range(per_leg):
+                append(t, leg, 4, -6.5569 + i * 1e-6, 106.7308 + leg * 1e-6, 15.0, per_leg - i)
+                t += 0.1
+    return time.perf_counter() - start
+
+
+def write_telemetry(path, source):
+    """Salin isi flight log ke format telemetry.py (record yang sama, header berbeda)."""
+    with FlightLog(source) as log, open(path, "wb") as f:
+        fmt = RECORD.format.encode("ascii")
+        f.write(MAGIC + len(fmt).to_bytes(2, "little") + fmt)
+        for start in range(0, len(log), 1 << 16):
+            f.write(log.records[start:start + (1 << 16)].tobytes())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--legs", type=int, default=5000)
+    parser.add_argument("--samples-per-leg", type=int, default=200)
+    parser.add_argument("--leg", type=int, default=37, help="leg yang diambil")
+    args = parser.parse_args()
+
+    total = args.legs * args.samples_per_leg
+    with tempfile.TemporaryDirectory() as tmp:
+        flog = os.path.join(tmp, "survey.flog")
+        tlm = os.path.join(tmp, "survey.tlm")
+
+        t_write = write_flightlog(flog, args.legs, args.samples_per_leg)
+        size_mb = os.path.getsize(flog) / 1e6
+        print(f"{total:,} sampel, {args.legs} leg, {size_mb:.1f} MB")
+        print(f"FlightLogWriter.append : {t_write:6.2f} s ({total / t_write:12,.0f} sampel/s)")
+
+        write_telemetry(tlm, flog)
+        start = time.perf_counter()
+        rows = [row for row in read_telemetry(tlm) if row[1] == args.leg]
+        t_scan = time.perf_counter() - start
+
+        os.remove(flog + ".idx.npz")
+        start = time.perf_counter()
+        with FlightLog(flog) as log:
+            pass
+        t_rebuild = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with FlightLog(flog) as log:
+            leg = log.leg(args.leg)
+            mean_alt = float(leg["alt"].mean())
+        t_slice = time.perf_counter() - start
+
+        start = time.perf_counter()
+        import_telemetry(tlm, flog)
+        t_import = time.perf_counter() - start
+
+    print(f"leg {args.leg}: {len(rows)} sampel via scan, {len(leg)} via index (alt rata-rata {mean_alt:.1f} m)")
+    print(f"scan read_telemetry    : {t_scan * 1000:10.1f} ms")
+    print(f"FlightLog.leg()        : {t_slice * 1000:10.3f} ms (buka + slice + rata-rata)")
+    print(f"bangun ulang index     : {t_rebuild * 1000:10.1f} ms")
+    print(f"import_telemetry       : {t_import * 1000:10.1f} ms")
+    print(f"percepatan ambil leg   : {t_scan / t_slice:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+bench_geodesy.py
+----------------
+Membandingkan throughput perhitungan rute per titik (loop Python memakai
+rumus get_offset_location/get_distance) dengan versi vektor di geodesy.py.
+
+Membutuhkan NumPy:
+    python benchmarks/bench_geodesy.py --points 10000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np  # noqa: E402
+
+from irc_mission import geodesy  # noqa: E402
+from irc_mission.distance import offset_degrees  # noqa: E402
+from irc_mission.geo import get_distance  # noqa: E402
+
+
+class Point:
+    __slots__ = ("lat", "lon", "alt")
+
+    def __init__(self, lat, lon, alt):
+        self.lat, self.lon, self.alt = lat, lon, alt
+
+
+def loop_route(lat0, lon0, d_north, d_east, altitude):
+    """Cara lama: satu titik per iterasi (tanpa objek LocationGlobalRelative)."""
+    current = Point(lat0, lon0, 0.0)
+    points = []
+    for dn, de, alt in zip(d_north, d_east, altitude):
+        d_lat, d_lon = offset_degrees(current.lat, dn, de)
+        current = Point(current.lat + d_lat, current.lon + d_lon, alt)
+        points.append(current)
+    legs = [get_distance(a, b) for a, b in zip(points, points[1:])]
+    total, cumulative = 0.0, [0.0]
+    for leg in legs:
+        total += leg
+        cumulative.append(total)
+    return points, cumulative
+
+
+def vector_route(lat0, lon0, d_north, d_east, altitude):
+    lat, lon, alt = geodesy.chain_offsets(lat0, lon0, d_north, d_east, altitude)
+    cumulative = geodesy.cumulative_distances(lat, lon)
+    geodesy.bearings(lat, lon)
+    return lat, lon, cumulative
+
+
+def best_of(fn, repeat, *args):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--points", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    d_north = rng.uniform(-30, 30, args.points)
+    d_east = rng.uniform(-30, 30, args.points)
+    altitude = rng.uniform(8, 20, args.points)
+    lat0, lon0 = -6.5569, 106.7308
+
+    t_loop, (points, cum_loop) = best_of(
+        loop_route, args.repeat, lat0, lon0, d_north.tolist(), d_east.tolist(), altitude.tolist())
+    t_vec, (lat, lon, cum_vec) = best_of(
+        vector_route, args.repeat, lat0, lon0, d_north, d_east, altitude)
+
+    max_err = max(abs(lat[-1] - points[-1].lat), abs(lon[-1] - points[-1].lon))
+    print(f"{args.points} titik | selisih koordinat maks {max_err:.2e} deg | "
+          f"selisih jarak total {abs(cum_vec[-1] - cum_loop[-1]):.2e} m")
+    print(f"loop Python : {t_loop * 1000:8.2f} ms ({args.points / t_loop:12,.0f} titik/s)")
+    print(f"NumPy       : {t_vec * 1000:8.2f} ms ({args.points / t_vec:12,.0f} titik/s)"
+          f" (termasuk bearing)")
+    print(f"percepatan  : {t_loop / t_vec:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+bench_geofence.py
+-----------------
+Mengukur latensi Geofence.check() dengan ratusan fence: index grid + slab
+dibanding ray casting naif ke semua fence, lalu menerbangkan SimVehicle
+menembus fence eksklusi untuk melihat reaksi GeofenceMonitor.
+
+Bagian pertama tidak butuh dronekit; bagian SimVehicle butuh dronekit (tanpa SITL):
+    python benchmarks/bench_geofence.py --fences 100 500 --checks 20000
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from irc_mission.distance import local_offset  # noqa: E402
+from irc_mission.geofence import EXCLUDE, Fence, Geofence  # noqa: E402
+from irc_mission.metrics import LatencyHistogram  # noqa: E402
+
+HOME = (-6.5569, 106.7308)
+FIELD = 2000.0  # sisi area inklusi (meter)
+
+
+def make_fences(count, rng):
+    """Satu fence inklusi besar dan `count` fence eksklusi poligon 12 sisi acak."""
+    fences = [Fence.from_local(HOME, [(-FIELD / 2, -FIELD / 2), (-FIELD / 2, FIELD / 2),
+                                      (FIELD / 2, FIELD / 2), (FIELD / 2, -FIELD / 2)],
+                               name="lapangan")]
+    for k in range(count):
+        cn, ce = rng.uniform(-FIELD / 2, FIELD / 2), rng.uniform(-FIELD / 2, FIELD / 2)
+        radius = rng.uniform(5, 25)
+        points = [(cn + radius * math.cos(a), ce + radius * math.sin(a))
+                  for a in (2 * math.pi * j / 12 for j in range(12))]
+        fences.append(Fence.from_local(HOME, points, kind=EXCLUDE, name=f"nfz{k}", ceiling=100))
+    return fences
+
+
+def naive_check(fences, lat, lon, alt):
+    """Ray casting langsung di koordinat derajat ke setiap fence, tanpa index."""
+    included = False
+    for fence in fences:
+        if not fence.altitude_applies(alt):
+            continue
+        inside = False
+        vertices = fence.vertices
+        for (y1, x1), (y2, x2) in zip(vertices, vertices[1:] + vertices[:1]):
+            if (y1 > lat) != (y2 > lat) and x1 + (lat - y1) * (x2 - x1) / (y2 - y1) > lon:
+                inside = not inside
+        if inside and fence.kind == EXCLUDE:
+            return "exclusion", fence.name
+        included = included or inside
+    return None if included else ("outside", None)
+
+
+def bench_checks(counts, checks, rng):
+    print(f"{'fence':>6} {'naif':>10} {'index':>10} {'p99 index':>10} {'percepatan':>11}")
+    for count in counts:
+        fences = make_fences(count, rng)
+        geofence = Geofence(fences, ceiling=120)
+        points = [(HOME[0] + rng.uniform(-0.009, 0.009), HOME[1] + rng.uniform(-0.009, 0.009),
+                   rng.uniform(5, 50)) for _ in range(checks)]
+
+        start = time.perf_counter()
+        naive = [naive_check(fences, *p) for p in points]
+        t_naive = (time.perf_counter() - start) / checks
+
+        histogram = LatencyHistogram("check")
+        indexed = []
+        for p in points:
+            t0 = time.perf_counter_ns()
+            indexed.append(geofence.check(*p))
+            histogram.record_ns(time.perf_counter_ns() - t0)
+        t_index = histogram.mean
+
+        mismatch = sum((a is None) != (b is None) for a, b in zip(naive, indexed))
+        print(f"{count:>6} {t_naive * 1e6:>8.1f}us {t_index * 1e6:>8.1f}us "
+              f"{histogram.percentile(99) * 1e6:>8.1f}us {t_naive / t_index:>10.1f}x"
+              + (f"  ({mismatch} beda hasil)" if mismatch else ""))
+
+
+def bench_sim():
+    from irc_mission import SimClock, arm_and_takeoff, execute_waypoints
+    from irc_mission.geofence import GeofenceBreach, GeofenceMonitor
+    from irc_mission.sim import SimVehicle
+
+    vehicle = SimVehicle(home_lat=HOME[0], home_lon=HOME[1])
+    clock = SimClock(vehicle)
+    # Dinding eksklusi melintang di utara 30..40 m
+    wall = Fence.from_local(HOME, [(30, -50), (30, 50), (40, 50), (40, -50)], kind=EXCLUDE, name="dinding")
+    geofence = Geofence([wall], ceiling=50)
+    route = [{"name": "A", "d_north": 0, "d_east": 10, "altitude": 10},
+             {"name": "B", "d_north": 60, "d_east": 0, "altitude": 10}]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        arm_and_takeoff(vehicle, 10, clock=clock)
+    with GeofenceMonitor(vehicle, geofence, action="RTL", clock=clock) as monitor:
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                execute_waypoints(vehicle, route, clock=clock, geofence=monitor)
+            print("\nSimVehicle: misi selesai tanpa pelanggaran (tidak diharapkan)")
+            return
+        except GeofenceBreach as exc:
+            breach, message = exc.breach, str(exc)
+    north = local_offset(HOME[0], HOME[1], breach["lat"], HOME[1])[0]
+    print(f"\nSimVehicle: {message} di north={north:.2f}m (batas 30m), mode -> {breach['action']}")
+    clock.sleep(2)
+    print(f"  mode setelah 2s: {vehicle.mode.name}")
+    print(f"  {monitor.latency.format()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--fences", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--checks", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-sim", action="store_true", help="lewati bagian SimVehicle")
+    args = parser.parse_args()
+
+    bench_checks(args.fences, args.checks, random.Random(args.seed))
+    if not args.no_sim:
+        bench_sim()
+
+
+if __name__ == "__main__":
+    main()
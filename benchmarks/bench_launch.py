@@ -0,0 +1,78 @@
+"""
+bench_launch.py
+---------------
+Mengukur waktu di darat sampai ketinggian takeoff tercapai: urutan lama
+arm_and_takeoff (polling is_armable/arm tiap 1 detik, switch_mode setelah
+armable, polling ketinggian) dibanding pipeline yang tumpang tindih.
+
+SimVehicle dijalankan dengan waktu siap EKF/GPS dan jeda konfirmasi mode
+acak, memakai jam virtual. Butuh dronekit (tanpa SITL):
+    python benchmarks/bench_launch.py --runs 20
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from irc_mission import SimClock, arm_and_takeoff, switch_mode  # noqa: E402
+from irc_mission.control import LAUNCH_PHASES  # noqa: E402
+from irc_mission.sim import SimVehicle  # noqa: E402
+
+ALTITUDE = 10
+
+
+def sequential_takeoff(vehicle, target_altitude, clock):
+    """Salinan urutan lama tanpa telemetri."""
+    while not vehicle.is_armable:
+        clock.sleep(1)
+    switch_mode(vehicle, "GUIDED", clock=clock)
+    vehicle.armed = True
+    while not vehicle.armed:
+        clock.sleep(1)
+    vehicle.simple_takeoff(target_altitude)
+    while vehicle.location.global_relative_frame.alt < target_altitude * 0.95:
+        clock.sleep(1)
+
+
+def make_vehicle(rng):
+    return SimVehicle(armable_after=rng.uniform(1.0, 8.0), mode_delay=rng.uniform(0.2, 1.2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    old, new = [], []
+    phase_totals = dict.fromkeys(LAUNCH_PHASES, 0.0)
+    for run in range(args.runs):
+        for results, pipeline in ((old, False), (new, True)):
+            vehicle = make_vehicle(random.Random(args.seed + run))
+            clock = SimClock(vehicle)
+            with contextlib.redirect_stdout(io.StringIO()):
+                if pipeline:
+                    phases = arm_and_takeoff(vehicle, ALTITUDE, clock=clock)
+                    for name in LAUNCH_PHASES:
+                        phase_totals[name] += phases[name][1] - phases[name][0]
+                else:
+                    sequential_takeoff(vehicle, ALTITUDE, clock)
+            results.append(vehicle.time)
+
+    saved = [a - b for a, b in zip(old, new)]
+    print(f"{'cara':<14} {'rata2':>8} {'maks':>8}")
+    print(f"{'berurutan':<14} {sum(old) / len(old):>7.2f}s {max(old):>7.2f}s")
+    print(f"{'pipeline':<14} {sum(new) / len(new):>7.2f}s {max(new):>7.2f}s")
+    print(f"hemat rata-rata {sum(saved) / len(saved):.2f}s per sortie (maks {max(saved):.2f}s)")
+    print("\nRata-rata durasi fase pipeline:")
+    for name in LAUNCH_PHASES:
+        print(f"  {name:<8} {phase_totals[name] / args.runs:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+bench_plan.py
+-------------
+Mengukur compile_plan() untuk rute survey panjang: compile pertama (validasi,
+target, panjang leg, perkiraan waktu/energi) dibanding memuat dari cache.
+
+Tidak butuh dronekit:
+    python benchmarks/bench_plan.py --waypoints 1000 10000 50000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from irc_mission.plan import compile_plan  # noqa: E402
+
+HOME = (-6.5569, 106.7308, 0.0)
+
+
+def survey(count):
+    return [
+        {"name": f"S{i}", "d_north": 40 if i % 2 else -40, "d_east": 5, "altitude": 20,
+         "hover": 2 if i % 10 == 0 else 0}
+        for i in range(1, count + 1)
+    ]
+
+
+def timed(route, cache_dir):
+    start = time.perf_counter()
+    plan = compile_plan(route, HOME, cache_dir=cache_dir)
+    return plan, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--waypoints", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    print(f"{'waypoint':>9} {'compile':>9} {'cache':>9} {'percepatan':>11} {'jarak':>9} {'waktu':>8}")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for count in args.waypoints:
+            route = survey(count)
+            plan, t_compile = timed(route, cache_dir)
+            cached, t_cache = timed(route, cache_dir)
+            assert cached.cached and cached.key == plan.key
+            print(f"{count:>9} {t_compile * 1000:>7.1f}ms {t_cache * 1000:>7.1f}ms "
+                  f"{t_compile / t_cache:>10.1f}x {plan.distance / 1000:>7.1f}km {plan.duration / 60:>6.0f}min")
+
+
+if __name__ == "__main__":
+    main()
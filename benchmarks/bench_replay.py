@@ -0,0 +1,82 @@
+"""
+bench_replay.py
+---------------
+Merekam misi survey panjang di SimVehicle, lalu me-replay rekaman itu dengan
+beberapa threshold tiba untuk melihat pergeseran keputusan dan kecepatan replay.
+
+Butuh NumPy dan dronekit (tanpa SITL):
+    python benchmarks/bench_replay.py --waypoints 1500 --thresholds 1.5 2.0 3.0
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from irc_mission import SimClock, arm_and_takeoff, execute_waypoints, land  # noqa: E402
+from irc_mission.flightlog import FlightLogWriter  # noqa: E402
+from irc_mission.replay import replay_mission  # noqa: E402
+from irc_mission.sim import SimVehicle  # noqa: E402
+
+
+def survey(count):
+    """Rute zig-zag sederhana, setiap waypoint ketiga hover 2 detik."""
+    return [
+        {"name": f"S{i}", "d_north": 20 if i % 2 else -20, "d_east": 10, "altitude": 10,
+         "hover": 2 if i % 3 == 0 else 0}
+        for i in range(1, count + 1)
+    ]
+
+
+def record(path, waypoints, threshold):
+    vehicle = SimVehicle()
+    clock = SimClock(vehicle)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), FlightLogWriter(path, sample_interval=0.1) as log:
+        arm_and_takeoff(vehicle, 10, clock=clock, telemetry=log)
+        execute_waypoints(vehicle, waypoints, default_threshold=threshold, clock=clock, telemetry=log)
+        land(vehicle, clock=clock, telemetry=log)
+    return log.count, vehicle.time, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--waypoints", type=int, default=1500)
+    parser.add_argument("--record-threshold", type=float, default=1.5)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[1.5, 2.0, 3.0, 0.5])
+    args = parser.parse_args()
+
+    waypoints = survey(args.waypoints)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "survey.flog")
+        count, duration, wall = record(path, waypoints, args.record_threshold)
+        print(f"Rekaman: {count:,} sampel, {duration / 3600:.2f} jam simulasi "
+              f"(threshold {args.record_threshold} m, dibuat dalam {wall:.1f}s)")
+
+        print(f"{'threshold':>9} {'selesai':>8} {'leg':>6} {'geser rata2':>12} "
+              f"{'jarak maks':>11} {'replay':>8} {'jam/detik':>10}")
+        for threshold in args.thresholds:
+            def mission(vehicle, clock, threshold=threshold):
+                arm_and_takeoff(vehicle, 10)
+                execute_waypoints(vehicle, waypoints, default_threshold=threshold)
+                land(vehicle)
+
+            report = replay_mission(path, mission)
+            legs = [leg for leg in report["legs"]
+                    if leg["arrival_t"] is not None and leg["recorded_end"] is not None]
+            shift = sum(leg["arrival_t"] - leg["recorded_end"] for leg in legs) / max(len(legs), 1)
+            max_dist = max((leg["dist"] for leg in legs), default=float("nan"))
+            hours_per_s = report["duration"] / 3600 / report["wall"]
+            print(f"{threshold:>9.1f} {'ya' if report['finished'] else 'tidak':>8} "
+                  f"{len(report['legs']):>6} {shift:>+11.2f}s {max_dist:>10.2f}m "
+                  f"{report['wall']:>7.2f}s {hours_per_s:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+bench_route.py
+--------------
+Mengukur optimize_route() pada titik inspeksi acak: panjang rute urutan asli,
+nearest neighbour, dan setelah 2-opt/Or-opt, beserta waktu hitungnya.
+
+Rute contoh modul 03 juga ikut diukur. Tidak butuh dronekit:
+    python benchmarks/bench_route.py --sizes 200 1000 5000
+"""
+
+import argparse
+import importlib.util
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from irc_mission.routing import optimize_route  # noqa: E402
+
+EXAMPLES = ROOT / "modules" / "03-mission" / "examples"
+
+
+def load_example(filename, name):
+    spec = importlib.util.spec_from_file_location(filename[:-3], EXAMPLES / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, name)
+
+
+def random_points(count, extent, seed):
+    """Titik acak dalam kotak extent x extent meter, sebagai offset relatif berantai."""
+    rng = random.Random(seed)
+    previous = (0.0, 0.0)
+    route = []
+    for i in range(count):
+        point = (rng.uniform(0, extent), rng.uniform(0, extent))
+        route.append({"name": f"P{i + 1}", "d_north": point[0] - previous[0],
+                      "d_east": point[1] - previous[1], "altitude": rng.choice((10, 15, 20))})
+        previous = point
+    return route
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000, 5000])
+    parser.add_argument("--extent", type=float, default=2000.0, help="sisi area (meter)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    routes = [("bintang (03)", load_example("03_multi_waypoint.py", "WAYPOINTS")),
+              ("zigzag (05)", load_example("05_altitude_change.py", "MISSION_WAYPOINTS"))]
+    routes += [(f"acak {n}", random_points(n, args.extent, args.seed)) for n in args.sizes]
+
+    print(f"{'rute':<18} {'asli':>11} {'NN':>10} {'optimasi':>10} {'hemat':>7} {'putaran':>8} {'waktu':>8}")
+    for label, route in routes:
+        for return_home in (False, True):
+            _, report = optimize_route(route, return_home=return_home)
+            name = label + (" +home" if return_home else "")
+            print(f"{name:<18} {report['original']:>10.0f}m {report['seeded']:>9.0f}m "
+                  f"{report['optimized']:>9.0f}m {report['saved_pct']:>6.1f}% "
+                  f"{report['passes']:>8} {report['elapsed']:>7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+bench_snapshot.py
+-----------------
+Microbenchmark pembacaan telemetri di loop: tiga kali akses
+`vehicle.location.global_relative_frame` per tick (pola lama, setiap akses
+membuat objek lokasi baru seperti di DroneKit) dibanding satu `feed.latest`
+per tick dari TelemetryFeed.
+
+Juga mengukur biaya menulis snapshot di thread pesan, dan menghitung tick
+yang membaca lat dan alt dari update berbeda saat thread penulis berjalan.
+Tidak butuh dronekit:
+    python benchmarks/bench_snapshot.py --ticks 200000
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from irc_mission.sim import SimVehicle  # noqa: E402
+from irc_mission.snapshot import TelemetryFeed  # noqa: E402
+
+
+class _Location:
+    """Seperti LocationGlobalRelative DroneKit (kelas biasa, tanpa __slots__)."""
+
+    created = 0
+
+    def __init__(self, lat, lon, alt):
+        _Location.created += 1
+        self.lat = lat
+        self.lon = lon
+        self.alt = alt
+
+
+class DroneKitLocations:
+    """Meniru dronekit.Locations: field diisi listener, properti membuat objek baru."""
+
+    def __init__(self):
+        self._lat = self._lon = self._alt = 0.0
+
+    def on_position(self, message):
+        self._lat = message.lat / 1e7
+        self._lon = message.lon / 1e7
+        self._alt = message.relative_alt / 1000.0
+
+    @property
+    def global_relative_frame(self):
+        return _Location(self._lat, self._lon, self._alt)
+
+
+def message(k):
+    """GLOBAL_POSITION_INT ke-k; lat dan alt sama-sama menyimpan k untuk cek konsistensi."""
+    return SimpleNamespace(lat=k, lon=1067308000, relative_alt=k, vx=0, vy=0)
+
+
+def consistent(lat, alt):
+    return round(lat * 1e7) == round(alt * 1000)
+
+
+def read_property(vehicle, ticks):
+    bad = 0
+    for _ in range(ticks):
+        lat = vehicle.location.global_relative_frame.lat
+        lon = vehicle.location.global_relative_frame.lon
+        alt = vehicle.location.global_relative_frame.alt
+        bad += not consistent(lat, alt)
+        del lon
+    return bad
+
+
+def read_snapshot(feed, ticks):
+    bad = 0
+    for _ in range(ticks):
+        snap = feed.latest
+        lat, lon, alt = snap.lat, snap.lon, snap.alt
+        bad += not consistent(lat, alt)
+        del lon
+    return bad
+
+
+def timed(fn, *args):
+    start = time.perf_counter_ns()
+    result = fn(*args)
+    return time.perf_counter_ns() - start, result
+
+
+def run_with_writer(reader, target, write, ticks):
+    """Jalankan `reader` sementara thread lain terus menulis update."""
+    running = True
+
+    def writer():
+        k = 0
+        while running:
+            k += 1
+            write(message(k))
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    try:
+        return reader(target, ticks)
+    finally:
+        running = False
+        thread.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--ticks", type=int, default=200000)
+    args = parser.parse_args()
+    ticks = args.ticks
+
+    old = SimpleNamespace(location=DroneKitLocations())
+    old.location.on_position(message(1))
+    feed = TelemetryFeed(SimVehicle()).start()
+    feed._on_position(None, "GLOBAL_POSITION_INT", message(1))
+
+    _Location.created = 0
+    t_old, _ = timed(read_property, old, ticks)
+    created = _Location.created
+    t_new, _ = timed(read_snapshot, feed, ticks)
+    print(f"Baca per tick (lat, lon, alt), {ticks} tick:")
+    print(f"  3x global_relative_frame : {t_old / ticks:>6.0f} ns/tick, {created / ticks:.0f} objek baru/tick")
+    print(f"  1x feed.latest           : {t_new / ticks:>6.0f} ns/tick, 0 objek baru/tick "
+          f"({t_old / t_new:.1f}x lebih cepat)")
+
+    writes = ticks // 4
+    t_write_old, _ = timed(lambda: [old.location.on_position(message(k)) for k in range(writes)])
+    t_write_new, _ = timed(lambda: [feed._on_position(None, "GLOBAL_POSITION_INT", message(k))
+                                    for k in range(writes)])
+    print("\nTulis per pesan GLOBAL_POSITION_INT (thread pesan):")
+    print(f"  field Locations          : {t_write_old / writes:>6.0f} ns")
+    print(f"  TelemetrySnapshot baru   : {t_write_new / writes:>6.0f} ns")
+
+    # Perbesar peluang pergantian thread di tengah tick
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        bad_old = run_with_writer(read_property, old, old.location.on_position, ticks)
+        bad_new = run_with_writer(read_snapshot, feed,
+                                  lambda msg: feed._on_position(None, "GLOBAL_POSITION_INT", msg), ticks)
+    finally:
+        sys.setswitchinterval(interval)
+    print("\nTick dengan lat dan alt dari update berbeda (penulis berjalan paralel):")
+    print(f"  3x global_relative_frame : {bad_old} dari {ticks}")
+    print(f"  1x feed.latest           : {bad_new} dari {ticks}")
+    feed.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+bench_streams.py
+----------------
+Membandingkan rate GLOBAL_POSITION_INT tetap (rendah dan tinggi) dengan
+StreamRateController per fase: waktu misi (seberapa cepat tiba terdeteksi)
+dan jumlah pesan posisi/HEARTBEAT yang lewat link.
+
+Memakai SimVehicle dengan jam virtual, butuh dronekit (tanpa SITL):
+    python benchmarks/bench_streams.py
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from irc_mission import SimClock, arm_and_takeoff, execute_waypoints, land  # noqa: E402
+from irc_mission.sim import SimVehicle  # noqa: E402
+from irc_mission.streams import StreamRateController, print_stream_report  # noqa: E402
+
+ROUTE = [
+    {"name": "A", "d_north": 60, "d_east": 0, "altitude": 10},
+    {"name": "B", "d_north": 0, "d_east": 60, "altitude": 12, "hover": 5},
+    {"name": "C", "d_north": -60, "d_east": 0, "altitude": 10},
+    {"name": "D", "d_north": 30, "d_east": -30, "altitude": 10, "hover": 5},
+    {"name": "E", "d_north": -30, "d_east": -30, "altitude": 10},
+]
+
+
+def fly(position_rate, phased):
+    """Satu sortie. Return (durasi misi, jumlah pesan per nama, controller atau None)."""
+    vehicle = SimVehicle(position_rate=position_rate)
+    clock = SimClock(vehicle)
+    counts = {"GLOBAL_POSITION_INT": 0, "HEARTBEAT": 0}
+
+    def count(_vehicle, name, _message):
+        counts[name] += 1
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        arm_and_takeoff(vehicle, 10, clock=clock, report=False)
+        for name in counts:
+            vehicle.add_message_listener(name, count)
+        start = vehicle.time
+        streams = StreamRateController(vehicle, clock=clock).start() if phased else None
+        execute_waypoints(vehicle, ROUTE, clock=clock, streams=streams)
+        land(vehicle, clock=clock, streams=streams)
+        if streams is not None:
+            streams.stop()
+    return vehicle.time - start, counts, streams
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--low", type=float, default=4.0, help="rate posisi tetap rendah (Hz)")
+    parser.add_argument("--high", type=float, default=20.0, help="rate posisi tetap tinggi (Hz)")
+    args = parser.parse_args()
+
+    rows = [
+        (f"tetap {args.low:g}Hz", fly(args.low, phased=False)),
+        (f"tetap {args.high:g}Hz", fly(args.high, phased=False)),
+        ("per fase", fly(args.low, phased=True)),
+    ]
+    print(f"{'stream':<12} {'durasi':>8} {'posisi':>8} {'heartbeat':>10}")
+    for label, (duration, counts, _) in rows:
+        print(f"{label:<12} {duration:>7.1f}s {counts['GLOBAL_POSITION_INT']:>8} {counts['HEARTBEAT']:>10}")
+    print()
+    print_stream_report(rows[-1][1][2])
+
+
+if __name__ == "__main__":
+    main()
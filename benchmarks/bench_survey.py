@@ -0,0 +1,56 @@
+"""
+bench_survey.py
+---------------
+Mengukur waktu generate pola survey (lawnmower, spiral, expanding square)
+untuk lahan dari ratusan meter sampai beberapa kilometer.
+
+Membutuhkan NumPy:
+    python benchmarks/bench_survey.py --footprint 30 --overlap 0.3
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from irc_mission.survey import expanding_square, lawnmower, line_spacing, spiral  # noqa: E402
+
+# Segi empat tak beraturan (konveks), diskalakan ke ukuran lahan
+FIELD = [(0.0, 0.0), (0.0, 1.0), (0.7, 1.15), (0.85, -0.05)]
+SIZES = [200, 1000, 5000, 20000]
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--footprint", type=float, default=30.0, help="lebar footprint (meter)")
+    parser.add_argument("--overlap", type=float, default=0.3)
+    args = parser.parse_args()
+
+    spacing = line_spacing(args.footprint, args.overlap)
+    print(f"spacing {spacing:.1f} m (footprint {args.footprint} m, overlap {args.overlap:.0%})")
+    print(f"{'lahan':>8} {'pola':<16} {'waypoint':>9} {'waktu':>10}")
+    for size in SIZES:
+        field = [(n * size, e * size) for n, e in FIELD]
+        patterns = [
+            ("lawnmower", lambda: lawnmower(field, 40, spacing=spacing)),
+            ("spiral", lambda: spiral(field, 40, spacing=spacing)),
+            ("expanding square", lambda: expanding_square(40, size / 2, spacing=spacing)),
+        ]
+        for name, fn in patterns:
+            waypoints, elapsed = timed(fn)
+            print(f"{size / 1000:>6.1f}km {name:<16} {len(waypoints):>9} {elapsed * 1000:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+compare_auto_guided.py
+----------------------
+Membandingkan total waktu misi GUIDED (goto per leg) dan AUTO (misi di-upload).
+
+Rute yang sama (WAYPOINTS dari 03_multi_waypoint.py) diterbangkan dua kali
+dari titik awal yang sama. Butuh SITL yang sedang berjalan:
+    python benchmarks/compare_auto_guided.py --connect tcp:127.0.0.1:5762
+"""
+
+import importlib.util
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from irc_mission import (  # noqa: E402
+    arm_and_takeoff, connect_vehicle, execute_waypoints, land, parse_mission_args,
+    switch_mode, wait_until_arrived,
+)
+from irc_mission.auto_mission import run_auto_route  # noqa: E402
+
+
+def load_waypoints():
+    path = ROOT / "modules" / "03-mission" / "examples" / "03_multi_waypoint.py"
+    spec = importlib.util.spec_from_file_location("multi_waypoint", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.WAYPOINTS
+
+
+def return_to(vehicle, location):
+    switch_mode(vehicle, "GUIDED")
+    vehicle.simple_goto(location)
+    wait_until_arrived(vehicle, location, threshold=1.0)
+
+
+def main():
+    args = parse_mission_args(__doc__)
+    waypoints = load_waypoints()
+    if args.dry_run:
+        print(f"{len(waypoints)} waypoint akan diterbangkan dua kali (GUIDED lalu AUTO)")
+        return
+
+    vehicle = connect_vehicle(args.connect)
+    try:
+        arm_and_takeoff(vehicle, target_altitude=10)
+        start = vehicle.location.global_relative_frame
+
+        t0 = time.monotonic()
+        execute_waypoints(vehicle, waypoints)
+        guided = time.monotonic() - t0
+
+        return_to(vehicle, start)
+
+        t0 = time.monotonic()
+        run_auto_route(vehicle, waypoints)
+        auto = time.monotonic() - t0
+
+        land(vehicle)
+    finally:
+        vehicle.close()
+
+    print("\nTotal waktu misi:")
+    print(f"  GUIDED (goto per leg) : {guided:7.1f}s")
+    print(f"  AUTO (misi upload)    : {auto:7.1f}s")
+    print(f"  Selisih               : {guided - auto:+7.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+irc_mission
+-----------
+Runtime bersama untuk skrip misi DroneKit di bootcamp.
+
+Berisi helper yang sebelumnya disalin ke setiap skrip contoh: koneksi,
+switch_mode, arm_and_takeoff, perhitungan offset/jarak, goto, LOITER, dan
+eksekusi daftar waypoint. Impor dronekit dilakukan secara lazy di dalam
+fungsi, jadi mengimpor paket ini tetap cepat. Eksekutor asyncio dan armada
+(async_executor, fleet) juga baru dimuat saat namanya pertama kali dipakai,
+karena asyncio sendiri butuh puluhan milidetik untuk diimpor.
+
+Skrip contoh di folder modules/ mengimpor paket ini dari root repository.
+"""
+
+from .arrival import ArrivalWatcher, wait_until_arrived
+from .cli import parse_mission_args
+from .clock import MonotonicClock, SimClock, set_default_clock, sleep
+from .connection import (
+    DEFAULT_READY,
+    CachedParameters,
+    ConnectionManager,
+    LinkLost,
+    LinkMonitor,
+    ParameterCache,
+)
+from .control import (
+    DEFAULT_CONNECTION,
+    arm_and_takeoff,
+    connect_vehicle,
+    land,
+    switch_mode,
+)
+from .distance import distance_function
+from .energy import BatteryMonitor, EnergyAbort, EnergyModel, estimate_energy, print_energy_report
+from .frames import FRAME_ABSOLUTE, FRAME_HOME, FRAME_PREVIOUS, TargetTable, resolve_targets
+from .geo import get_distance, get_offset_location
+from .geofence import EXCLUDE, INCLUDE, Fence, Geofence, GeofenceBreach, GeofenceMonitor
+from .metrics import LatencyHistogram, export_histograms, get_histogram, registered_histograms
+from .navigation import execute_waypoints, goto, goto_location, loiter_at_current
+from .snapshot import TelemetryFeed, TelemetrySnapshot
+from .streams import StreamRateController, print_stream_report
+from .telemetry import TelemetryRecorder, read_telemetry, set_default_recorder
+
+# Nama yang dimuat lazy lewat __getattr__ -> modul asalnya
+_LAZY = {
+    "AsyncMissionExecutor": "async_executor",
+    "execute_waypoints_async": "async_executor",
+    "FleetRunner": "fleet",
+    "FleetTelemetry": "fleet",
+    "print_fleet_report": "fleet",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__all__ = [
+    "ArrivalWatcher",
+    "AsyncMissionExecutor",
+    "BatteryMonitor",
+    "CachedParameters",
+    "ConnectionManager",
+    "DEFAULT_CONNECTION",
+    "DEFAULT_READY",
+    "EXCLUDE",
+    "EnergyAbort",
+    "EnergyModel",
+    "FRAME_ABSOLUTE",
+    "FRAME_HOME",
+    "FRAME_PREVIOUS",
+    "Fence",
+    "FleetRunner",
+    "FleetTelemetry",
+    "Geofence",
+    "GeofenceBreach",
+    "GeofenceMonitor",
+    "INCLUDE",
+    "LatencyHistogram",
+    "LinkLost",
+    "LinkMonitor",
+    "MonotonicClock",
+    "ParameterCache",
+    "SimClock",
+    "StreamRateController",
+    "TargetTable",
+    "TelemetryFeed",
+    "TelemetryRecorder",
+    "TelemetrySnapshot",
+    "arm_and_takeoff",
+    "connect_vehicle",
+    "distance_function",
+    "estimate_energy",
+    "execute_waypoints",
+    "execute_waypoints_async",
+    "export_histograms",
+    "get_distance",
+    "get_histogram",
+    "get_offset_location",
+    "goto",
+    "goto_location",
+    "land",
+    "loiter_at_current",
+    "parse_mission_args",
+    "print_energy_report",
+    "print_fleet_report",
+    "print_stream_report",
+    "read_telemetry",
+    "registered_histograms",
+    "resolve_targets",
+    "set_default_clock",
+    "set_default_recorder",
+    "sleep",
+    "switch_mode",
+    "wait_until_arrived",
+]
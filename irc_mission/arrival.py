@@ -0,0 +1,145 @@
+"""
+arrival.py
+----------
+Deteksi kedatangan di waypoint berbasis event.
+
+Helper navigasi lama memakai loop `while True` dengan `time.sleep(1)`, sehingga
+drone bisa menunggu hingga satu detik penuh setelah sebenarnya sudah tiba.
+Modul ini mendaftarkan attribute listener DroneKit pada
+`vehicle.location.global_relative_frame`, sehingga pemanggil langsung
+dibangunkan begitu jarak ke target masuk threshold.
+
+Contoh:
+    vehicle.simple_goto(target)
+    ArrivalWatcher(vehicle).wait_until_arrived(target, threshold=1.5, timeout=60)
+"""
+
+import threading
+
+from .clock import get_clock
+from .geo import get_distance
+
+
+POSITION_ATTRIBUTE = "global_relative_frame"
+
+
+class ArrivalWatcher:
+    """
+    Menunggu drone tiba di target berdasarkan update posisi dari DroneKit.
+
+    Parameter:
+        vehicle     : objek Vehicle DroneKit
+        distance_fn : fungsi (loc1, loc2) -> meter, default get_distance
+        clock       : jam untuk timeout dan jeda progres (default: jam default).
+                      Hanya dipakai versi sinkron; versi async selalu waktu nyata.
+    """
+
+    def __init__(self, vehicle, distance_fn=get_distance, clock=None):
+        self.vehicle = vehicle
+        self.distance_fn = distance_fn
+        self.clock = clock
+
+    def wait_until_arrived(self, target, threshold=1.5, timeout=None,
+                           on_progress=None, progress_interval=1.0, time_to_go=None,
+                           abort=None):
+        """
+        Blok sampai jarak ke target <= threshold, sampai timeout, atau sampai
+        `abort` di-set.
+
+        Parameter:
+            target            : LocationGlobalRelative - titik tujuan
+            threshold         : float - jarak dalam meter untuk dianggap tiba
+            timeout           : float - batas waktu tunggu (detik), None = tanpa batas
+            on_progress       : fungsi (dist, location) untuk log berkala (opsional)
+            progress_interval : float - jeda antar pemanggilan on_progress (detik)
+            time_to_go        : float - anggap tiba juga jika jarak / groundspeed
+                                <= nilai ini (detik), None = hanya threshold
+            abort             : threading.Event atau list of Event - hentikan tunggu jika
+                                salah satunya di-set, dicek di setiap update posisi
+                                (misalnya pelanggaran geofence atau energi habis)
+
+        Return:
+            bool - True jika tiba, False jika timeout atau dibatalkan
+        """
+        clock = get_clock(self.clock, self.vehicle)
+        aborts = () if abort is None else (abort,) if isinstance(abort, threading.Event) else tuple(abort)
+        arrived = threading.Event()
+        latest = [None, None]  # [dist, location] terakhir dari listener
+
+        def listener(_locations, _name, location):
+            dist = self.distance_fn(location, target)
+            latest[0], latest[1] = dist, location
+            if any(event.is_set() for event in aborts):
+                arrived.set()
+            elif dist <= threshold:
+                arrived.set()
+            elif time_to_go is not None and dist <= time_to_go * (self.vehicle.groundspeed or 0.0):
+                arrived.set()
+
+        locations = self.vehicle.location
+        locations.add_attribute_listener(POSITION_ATTRIBUTE, listener)
+        try:
+            # Cek posisi saat ini, siapa tahu drone sudah berada di target
+            listener(locations, POSITION_ATTRIBUTE, locations.global_relative_frame)
+
+            deadline = None if timeout is None else clock.now() + timeout
+            while not arrived.is_set():
+                wait = progress_interval if on_progress else None
+                if deadline is not None:
+                    remaining = deadline - clock.now()
+                    if remaining <= 0:
+                        return False
+                    wait = remaining if wait is None else min(wait, remaining)
+                if clock.wait(arrived, wait):
+                    break
+                # Abort bisa di-set tanpa update posisi (misalnya link putus)
+                if any(event.is_set() for event in aborts):
+                    break
+                if on_progress and latest[1] is not None:
+                    on_progress(latest[0], latest[1])
+            return not any(event.is_set() for event in aborts)
+        finally:
+            locations.remove_attribute_listener(POSITION_ATTRIBUTE, listener)
+
+    async def wait_until_arrived_async(self, target, threshold=1.5, timeout=None):
+        """
+        Versi awaitable dari wait_until_arrived().
+
+        Listener DroneKit berjalan di thread pesan MAVLink, sehingga hasilnya
+        diteruskan ke event loop dengan call_soon_threadsafe.
+
+        Return:
+            bool - True jika tiba, False jika timeout
+        """
+        import asyncio  # lazy: asyncio mahal diimpor, hanya untuk eksekutor async
+
+        loop = asyncio.get_running_loop()
+        arrived = loop.create_future()
+
+        def resolve():
+            if not arrived.done():
+                arrived.set_result(True)
+
+        def listener(_locations, _name, location):
+            if self.distance_fn(location, target) <= threshold:
+                loop.call_soon_threadsafe(resolve)
+
+        locations = self.vehicle.location
+        locations.add_attribute_listener(POSITION_ATTRIBUTE, listener)
+        try:
+            if self.distance_fn(locations.global_relative_frame, target) <= threshold:
+                resolve()
+            await asyncio.wait_for(arrived, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            locations.remove_attribute_listener(POSITION_ATTRIBUTE, listener)
+
+
+def wait_until_arrived(vehicle, target, threshold=1.5, timeout=None,
+                       on_progress=None, progress_interval=1.0, clock=None, time_to_go=None):
+    """Shortcut untuk ArrivalWatcher(vehicle, clock=clock).wait_until_arrived(...)."""
+    return ArrivalWatcher(vehicle, clock=clock).wait_until_arrived(
+        target, threshold, timeout, on_progress, progress_interval, time_to_go
+    )
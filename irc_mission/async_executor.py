@@ -0,0 +1,243 @@
+"""
+async_executor.py
+-----------------
+Eksekutor waypoint berbasis asyncio.
+
+execute_waypoints() di navigation.py memblokir thread selama terbang, sehingga
+tidak ada hal lain yang bisa berjalan: logging telemetri, cek geofence, atau
+perintah operator. Eksekutor ini memakai format waypoint dict dan frame yang
+sama (`name`, `d_north`, `d_east`, `lat`, `lon`, `altitude`, `hover`,
+`threshold`, `frame`), dengan semua target dihitung sekali di awal misi
+(resolve_targets, lihat frames.py), tetapi:
+
+    - setiap leg adalah asyncio.Task yang bisa dibatalkan,
+    - coroutine monitor berjalan bersamaan selama misi,
+    - setiap leg punya timeout (global atau key `timeout` per waypoint).
+
+Waktu (durasi leg, hover, timeout) diukur dengan jam executor (lihat
+clock.py). Dengan SimClock, executor sendiri yang memajukan simulasi per
+potongan SIM_SLICE sambil memberi giliran ke task lain di event loop, jadi
+monitor dan vehicle lain di armada tetap berjalan bersamaan.
+
+Contoh:
+    executor = AsyncMissionExecutor(vehicle, WAYPOINTS, leg_timeout=60)
+    results = asyncio.run(executor.run(monitors=[position_printer()]))
+"""
+
+import asyncio
+from functools import partial
+
+from .arrival import ArrivalWatcher
+from .clock import SimClock, get_clock
+from .control import switch_mode
+from .distance import DEFAULT_MODEL, distance_function
+from .frames import FRAME_ABSOLUTE, FRAME_PREVIOUS, resolve_targets
+
+# Langkah waktu simulasi per giliran event loop saat memakai SimClock (detik)
+SIM_SLICE = 0.1
+
+
+class AsyncMissionExecutor:
+    """
+    Menjalankan daftar waypoint sebagai rangkaian task asyncio.
+
+    Parameter:
+        vehicle           : objek Vehicle DroneKit (atau fake vehicle)
+        waypoints         : list of dict - format sama dengan execute_waypoints()
+        default_threshold : float - threshold tiba default (meter)
+        leg_timeout       : float - batas waktu menuju satu waypoint (detik), None = tanpa batas
+        distance_model    : str - model jarak untuk deteksi tiba (lihat distance.py)
+        clock             : jam yang dipakai (default: jam vehicle atau jam default)
+        thread_pool       : concurrent.futures.Executor untuk langkah yang memblokir
+                            (switch_mode), None = pool default asyncio
+        frame             : str - frame waypoint (lihat frames.py)
+        targets           : TargetTable - target yang sudah dihitung resolve_targets();
+                            None = dihitung dari posisi drone saat run() dimulai
+
+    Atribut yang bisa dibaca monitor:
+        current_leg : int - indeks waypoint yang sedang diterbangi (mulai 1), None jika idle
+        target      : LocationGlobalRelative - target leg saat ini
+        results     : list of dict - hasil setiap leg yang sudah selesai
+    """
+
+    def __init__(self, vehicle, waypoints, default_threshold=1.5, leg_timeout=None,
+                 distance_model=DEFAULT_MODEL, clock=None, thread_pool=None,
+                 frame=FRAME_PREVIOUS, targets=None):
+        self.vehicle = vehicle
+        self.waypoints = waypoints
+        self.default_threshold = default_threshold
+        self.leg_timeout = leg_timeout
+        self.distance_model = distance_model
+        self.clock = get_clock(clock, vehicle)
+        self.thread_pool = thread_pool
+        self.frame = frame
+        self.targets = targets
+
+        self.current_leg = None
+        self.target = None
+        self.results = []
+        self.abort_reason = None
+        self._leg_task = None
+        self._leg_started = None
+
+    def abort(self, reason):
+        """Hentikan misi: batalkan leg yang sedang berjalan dan lewati sisanya."""
+        if self.abort_reason is None:
+            self.abort_reason = reason
+            print(f"[ABORT] {reason}")
+        if self._leg_task is not None and not self._leg_task.done():
+            self._leg_task.cancel()
+
+    async def run(self, monitors=()):
+        """
+        Eksekusi semua waypoint secara berurutan.
+
+        Parameter:
+            monitors : list of fungsi async (executor) -> None, dijalankan
+                       bersamaan selama misi dan dibatalkan saat misi selesai.
+                       Exception dari monitor akan meng-abort misi.
+
+        Return:
+            list of dict - hasil per leg: name, status ("arrived", "timeout",
+            "cancelled"), duration (detik)
+        """
+        if self.targets is None:
+            self.targets = resolve_targets(self.waypoints, self.vehicle.location.global_relative_frame,
+                                           self.frame)
+        monitor_tasks = [asyncio.create_task(monitor(self)) for monitor in monitors]
+        for task in monitor_tasks:
+            task.add_done_callback(self._on_monitor_done)
+
+        total = len(self.targets)
+        print(f"[INFO] Memulai eksekusi {total} waypoint (asyncio)...")
+        try:
+            for i, wp in enumerate(self.waypoints, start=1):
+                if self.abort_reason is not None:
+                    break
+                self.current_leg = i
+                self._leg_started = self.clock.now()
+                self._leg_task = asyncio.create_task(self._fly_leg(i, wp, total))
+                try:
+                    await self._leg_task
+                except asyncio.CancelledError:
+                    if self.abort_reason is None:
+                        raise
+                    self._record(i, wp, "cancelled", self._leg_started)
+                    break
+        finally:
+            self.current_leg = None
+            for task in monitor_tasks:
+                task.cancel()
+            await asyncio.gather(*monitor_tasks, return_exceptions=True)
+
+        print("\n[INFO] Eksekusi waypoint selesai.")
+        return self.results
+
+    async def sleep(self, seconds):
+        """
+        asyncio.sleep() menurut jam executor.
+
+        Dengan SimClock, simulasi dimajukan per SIM_SLICE dan event loop diberi
+        giliran di antaranya. Monitor sebaiknya memakai ini, bukan asyncio.sleep().
+        """
+        if not isinstance(self.clock, SimClock):
+            await asyncio.sleep(seconds)
+            return
+        end = self.clock.now() + seconds
+        while True:
+            remaining = end - self.clock.now()
+            if remaining <= 1e-9:
+                return
+            self.clock.sleep(min(SIM_SLICE, remaining))
+            await asyncio.sleep(0)
+
+    async def _wait_arrived(self, watcher, threshold, timeout):
+        if not isinstance(self.clock, SimClock):
+            return await watcher.wait_until_arrived_async(self.target, threshold, timeout)
+        # Listener tiba dipanggil dari step() simulasi; timeout dihitung dengan waktu simulasi
+        task = asyncio.create_task(watcher.wait_until_arrived_async(self.target, threshold))
+        deadline = None if timeout is None else self.clock.now() + timeout
+        try:
+            while not task.done():
+                if deadline is not None and self.clock.now() >= deadline:
+                    return False
+                await self.sleep(SIM_SLICE)
+            return task.result()
+        finally:
+            task.cancel()
+
+    def _on_monitor_done(self, task):
+        if not task.cancelled() and task.exception() is not None:
+            self.abort(f"monitor gagal: {task.exception()!r}")
+
+    def _record(self, i, wp, status, started):
+        self.results.append({
+            "name": wp.get("name", f"WP{i}"),
+            "status": status,
+            "duration": self.clock.now() - started,
+        })
+
+    async def _fly_leg(self, i, wp, total):
+        name = wp.get("name", f"WP{i}")
+        threshold = wp.get("threshold", self.default_threshold)
+        timeout = wp.get("timeout", self.leg_timeout)
+        hover = wp.get("hover", 0)
+
+        print(f"\n[WP {i}/{total}] {name}")
+        if wp.get("frame", self.frame) == FRAME_ABSOLUTE:
+            print(f"  Target: lat={wp['lat']:.6f}, lon={wp['lon']:.6f}, Alt={wp['altitude']}m")
+        else:
+            print(f"  Target: N={wp['d_north']:+.1f}m, E={wp['d_east']:+.1f}m, Alt={wp['altitude']}m")
+
+        if self.vehicle.mode.name != "GUIDED":
+            # switch_mode memblokir, jadi dijalankan di thread terpisah
+            await asyncio.get_running_loop().run_in_executor(
+                self.thread_pool, partial(switch_mode, self.vehicle, "GUIDED", clock=self.clock))
+
+        self.target = self.targets.location(i - 1)
+        self.vehicle.simple_goto(self.target)
+
+        watcher = ArrivalWatcher(self.vehicle, distance_function(self.distance_model, self.target.lat))
+        if not await self._wait_arrived(watcher, threshold, timeout):
+            print(f"[WARN] Timeout {timeout}s menuju {name}")
+            self._record(i, wp, "timeout", self._leg_started)
+            # Tidak memakai abort() karena task ini sendiri yang akan dibatalkan
+            self.abort_reason = f"leg {i} ({name}) timeout"
+            print(f"[ABORT] {self.abort_reason}")
+            return
+        print(f"  Tiba di {name}")
+
+        if hover > 0:
+            print(f"  Hover {hover} detik di {name}...")
+            await self.sleep(hover)
+        self._record(i, wp, "arrived", self._leg_started)
+
+
+def position_printer(interval=1.0):
+    """
+    Monitor yang mencetak posisi dan jarak ke target secara berkala.
+
+    Return:
+        fungsi async (executor) untuk AsyncMissionExecutor.run(monitors=...)
+    """
+    async def monitor(executor):
+        while True:
+            await executor.sleep(interval)
+            if executor.current_leg is None or executor.target is None:
+                continue
+            pos = executor.vehicle.location.global_relative_frame
+            dist = distance_function(executor.distance_model)(pos, executor.target)
+            print(f"  [leg {executor.current_leg}] Jarak: {dist:.1f}m | Alt: {pos.alt:.2f}m")
+
+    return monitor
+
+
+def execute_waypoints_async(vehicle, waypoints, monitors=(), **kwargs):
+    """
+    Shortcut sinkron: jalankan AsyncMissionExecutor dengan asyncio.run().
+
+    Return:
+        list of dict - hasil per leg (lihat AsyncMissionExecutor.run)
+    """
+    executor = AsyncMissionExecutor(vehicle, waypoints, **kwargs)
+    return asyncio.run(executor.run(monitors=monitors))
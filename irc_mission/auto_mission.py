@@ -0,0 +1,194 @@
+"""
+auto_mission.py
+---------------
+Mengubah daftar waypoint menjadi misi MAVLink dan menerbangkannya dalam mode AUTO.
+
+Dengan GUIDED, Python harus menunggu setiap leg selesai sebelum mengirim
+`simple_goto` berikutnya, sehingga ada latensi di setiap sudut. Di sini seluruh
+rute di-upload sekaligus ke `vehicle.commands`, lalu flight controller yang
+mengeksekusinya. Python hanya memantau progres lewat pesan MISSION_CURRENT dan
+MISSION_ITEM_REACHED.
+
+Format yang diterima:
+    - dict seperti WAYPOINTS (`d_north`, `d_east`, `altitude`, `hover`, `threshold`, `name`)
+    - tuple seperti MISSION_WAYPOINTS: (d_north, d_east, altitude[, label])
+
+Secara default offset RELATIF terhadap waypoint sebelumnya, dimulai dari
+posisi `origin`. Frame lain (relative-to-home, absolute) lihat frames.py.
+
+Radius tiba: `threshold` ditulis ke param2 MAV_CMD_NAV_WAYPOINT, tetapi
+ArduCopter mengabaikan param2 dan selalu memakai parameter WPNAV_RADIUS
+(cm) untuk semua waypoint. `threshold` per waypoint hanya berlaku untuk
+autopilot yang membaca param2 (misalnya ArduPlane/PX4); run_auto_route()
+mencetak peringatan jika nilainya berbeda dengan WPNAV_RADIUS vehicle.
+
+Contoh:
+    commands = compile_mission(WAYPOINTS, vehicle.location.global_relative_frame)
+    upload_mission(vehicle, commands)
+    fly_auto_mission(vehicle, commands)
+"""
+
+import threading
+
+from .clock import get_clock
+from .control import switch_mode
+from .frames import FRAME_PREVIOUS, resolve_targets
+
+
+def normalize_waypoints(route):
+    """
+    Menyeragamkan rute (dict atau tuple) menjadi list of dict format execute_waypoints().
+
+    Return:
+        list of dict
+    """
+    waypoints = []
+    for i, wp in enumerate(route, start=1):
+        if isinstance(wp, dict):
+            waypoints.append(wp)
+            continue
+        d_north, d_east, altitude = wp[:3]
+        name = wp[3] if len(wp) > 3 else f"WP{i}"
+        waypoints.append({"name": name, "d_north": d_north, "d_east": d_east, "altitude": altitude})
+    return waypoints
+
+
+def compile_mission(route, origin, takeoff_altitude=None, default_threshold=1.5,
+                    frame=FRAME_PREVIOUS):
+    """
+    Mengubah rute menjadi list Command DroneKit.
+
+    Setiap waypoint menjadi MAV_CMD_NAV_WAYPOINT (param2 = radius tiba dari
+    `threshold`; diabaikan ArduCopter, lihat wpnav_radius()). Jika `hover` > 0, ditambahkan MAV_CMD_NAV_LOITER_TIME di titik
+    yang sama dengan param1 = durasi hover.
+
+    Parameter:
+        route             : list of dict/tuple - daftar waypoint
+        origin            : LocationGlobalRelative - posisi awal (biasanya posisi saat ini)
+        takeoff_altitude  : float - jika diisi, item pertama MAV_CMD_NAV_TAKEOFF
+                            (diabaikan flight controller jika sudah terbang)
+        default_threshold : float - radius tiba jika waypoint tidak punya `threshold`
+        frame             : str - frame waypoint (lihat frames.py)
+
+    Return:
+        list of Command
+    """
+    from dronekit import Command
+    from pymavlink import mavutil
+
+    mav_frame = mavutil.mavlink.MAV_FRAME_GLOBAL_RELATIVE_ALT
+    commands = []
+
+    if takeoff_altitude is not None:
+        commands.append(Command(0, 0, 0, mav_frame, mavutil.mavlink.MAV_CMD_NAV_TAKEOFF,
+                                0, 0, 0, 0, 0, 0, origin.lat, origin.lon, takeoff_altitude))
+
+    waypoints = normalize_waypoints(route)
+    targets = resolve_targets(waypoints, origin, frame)
+    for wp, (lat, lon, alt) in zip(waypoints, targets):
+        radius = wp.get("threshold", default_threshold)
+        commands.append(Command(0, 0, 0, mav_frame, mavutil.mavlink.MAV_CMD_NAV_WAYPOINT,
+                                0, 0, 0, radius, 0, 0, lat, lon, alt))
+        hover = wp.get("hover", 0)
+        if hover > 0:
+            commands.append(Command(0, 0, 0, mav_frame, mavutil.mavlink.MAV_CMD_NAV_LOITER_TIME,
+                                    0, 0, hover, 0, 0, 0, lat, lon, alt))
+
+    return commands
+
+
+def wpnav_radius(vehicle):
+    """
+    Radius tiba waypoint yang dipakai ArduCopter di mode AUTO.
+
+    Return:
+        float - WPNAV_RADIUS dalam meter, None jika parameter tidak tersedia
+    """
+    try:
+        value = vehicle.parameters.get("WPNAV_RADIUS")
+    except Exception:  # noqa: BLE001 - parameter belum terunduh / koneksi bermasalah
+        return None
+    return None if value is None else value / 100.0
+
+
+def upload_mission(vehicle, commands):
+    """
+    Mengganti misi di flight controller dengan `commands` dalam satu kali upload.
+
+    Parameter:
+        vehicle  : objek Vehicle DroneKit
+        commands : list of Command - hasil compile_mission()
+    """
+    cmds = vehicle.commands
+    cmds.clear()
+    for command in commands:
+        cmds.add(command)
+    cmds.upload()
+    print(f"[AUTO] {len(commands)} item misi ter-upload")
+
+
+def fly_auto_mission(vehicle, commands, timeout=None, clock=None):
+    """
+    Menjalankan misi yang sudah di-upload dalam mode AUTO dan menunggu selesai.
+
+    Progres dipantau lewat MISSION_CURRENT (item aktif) dan MISSION_ITEM_REACHED
+    (item selesai). Misi dianggap selesai saat item terakhir tercapai. Nomor item
+    dimulai dari 1 karena item 0 adalah home.
+
+    Parameter:
+        vehicle  : objek Vehicle DroneKit
+        commands : list of Command - misi yang sudah di-upload
+        timeout  : float - batas waktu seluruh misi (detik), None = tanpa batas
+        clock    : jam yang dipakai (default: jam vehicle atau jam default, lihat clock.py)
+
+    Return:
+        bool - True jika item terakhir tercapai, False jika timeout
+    """
+    clock = get_clock(clock, vehicle)
+    last_seq = len(commands)
+    finished = threading.Event()
+    current = [0]
+
+    def on_current(_vehicle, _name, message):
+        if message.seq != current[0]:
+            current[0] = message.seq
+            print(f"[AUTO] Item aktif {message.seq}/{last_seq}")
+
+    def on_reached(_vehicle, _name, message):
+        if message.seq >= last_seq:
+            finished.set()
+
+    vehicle.add_message_listener("MISSION_CURRENT", on_current)
+    vehicle.add_message_listener("MISSION_ITEM_REACHED", on_reached)
+    try:
+        vehicle.commands.next = 0
+        start = clock.now()
+        switch_mode(vehicle, "AUTO", clock=clock)
+        if not clock.wait(finished, timeout):
+            print(f"[WARN] Misi AUTO belum selesai setelah {timeout}s")
+            return False
+        print(f"[AUTO] Misi selesai dalam {clock.now() - start:.1f}s")
+        return True
+    finally:
+        vehicle.remove_message_listener("MISSION_CURRENT", on_current)
+        vehicle.remove_message_listener("MISSION_ITEM_REACHED", on_reached)
+
+
+def run_auto_route(vehicle, route, timeout=None, frame=FRAME_PREVIOUS, clock=None):
+    """
+    Compile rute dari posisi saat ini, upload, lalu terbangkan dalam mode AUTO.
+
+    Return:
+        bool - hasil fly_auto_mission()
+    """
+    waypoints = normalize_waypoints(route)
+    radius = wpnav_radius(vehicle)
+    if radius is not None:
+        ignored = sorted({wp["threshold"] for wp in waypoints
+                          if "threshold" in wp and abs(wp["threshold"] - radius) > 1e-6})
+        if ignored:
+            print(f"[WARN] threshold {', '.join(f'{t:g}m' for t in ignored)} diabaikan ArduCopter; "
+                  f"radius tiba AUTO = WPNAV_RADIUS {radius:g}m")
+    commands = compile_mission(waypoints, vehicle.location.global_relative_frame, frame=frame)
+    upload_mission(vehicle, commands)
+    return fly_auto_mission(vehicle, commands, timeout, clock)
@@ -0,0 +1,48 @@
+"""
+cli.py
+------
+Argumen baris perintah bersama untuk skrip misi contoh.
+
+Modul ini sengaja tidak mengimpor dronekit, sehingga `--help` dan `--dry-run`
+langsung selesai tanpa memuat pymavlink.
+"""
+
+import argparse
+
+from .control import DEFAULT_CONNECTION
+
+
+def parse_mission_args(description=None, argv=None, allow_auto=False, allow_mission=False):
+    """
+    Membaca argumen standar skrip misi.
+
+    Argumen:
+        --connect  : alamat koneksi MAVLink (default tcp:127.0.0.1:5762)
+        --dry-run  : tampilkan rencana misi saja, tanpa koneksi ke vehicle
+        --auto     : upload rute sebagai misi AUTO (hanya jika allow_auto=True)
+        --mission  : file misi pengganti rute bawaan skrip (hanya jika allow_mission=True)
+
+    Parameter:
+        description : str - teks bantuan (biasanya __doc__ skrip)
+        argv        : list of str - argumen (default: sys.argv)
+        allow_auto  : bool - tambahkan opsi --auto untuk skrip berbasis daftar rute
+        allow_mission : bool - tambahkan opsi --mission (lihat missionfile.py)
+
+    Return:
+        argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(
+        description=description,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--connect", default=DEFAULT_CONNECTION,
+                        help=f"alamat koneksi vehicle (default: {DEFAULT_CONNECTION})")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="tampilkan rencana misi tanpa koneksi ke vehicle")
+    if allow_auto:
+        parser.add_argument("--auto", action="store_true",
+                            help="upload rute sebagai misi AUTO, bukan goto GUIDED per leg")
+    if allow_mission:
+        parser.add_argument("--mission", metavar="FILE",
+                            help="baca rute dari file .yaml/.json/.jsonl/.csv/.waypoints")
+    return parser.parse_args(argv)
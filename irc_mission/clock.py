@@ -0,0 +1,101 @@
+"""
+clock.py
+--------
+Abstraksi jam agar helper misi tidak memanggil time.sleep()/time.time() langsung.
+
+Semua helper (switch_mode, arm_and_takeoff, land, goto, loiter_at_current,
+execute_waypoints, ArrivalWatcher) menerima argumen `clock`. Jika tidak diisi,
+dipakai jam milik vehicle (atribut `vehicle.clock`, diisi connect_vehicle("sim")),
+lalu jam default yang bisa diganti dengan set_default_clock(). Dengan jam per
+vehicle, beberapa SimVehicle dalam satu proses (misalnya armada) masing-masing
+maju dengan waktunya sendiri.
+
+    MonotonicClock : jam nyata, time.perf_counter (monotonic, resolusi tinggi)
+    SimClock       : jam virtual yang memajukan SimVehicle setiap kali "tidur",
+                     sehingga replay misi berjam-jam selesai dalam hitungan detik
+
+Sebuah clock cukup punya tiga method:
+    now()                 -> float detik
+    sleep(seconds)
+    wait(event, timeout)  -> bool, seperti threading.Event.wait()
+"""
+
+import time
+
+
+class MonotonicClock:
+    """Jam nyata untuk penerbangan sungguhan (SITL atau vehicle asli)."""
+
+    def now(self):
+        return time.perf_counter()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def wait(self, event, timeout=None):
+        return event.wait(timeout)
+
+
+class SimClock:
+    """
+    Jam virtual yang digerakkan oleh SimVehicle.
+
+    sleep() dan wait() tidak menunggu waktu nyata, tetapi memanggil
+    vehicle.step() sampai waktu simulasi yang diminta terlewati. SimVehicle
+    jangan dijalankan dengan start() saat memakai jam ini.
+
+    Parameter:
+        vehicle : SimVehicle
+    """
+
+    def __init__(self, vehicle):
+        self.vehicle = vehicle
+
+    def now(self):
+        return self.vehicle.time
+
+    def sleep(self, seconds):
+        # Minimal satu langkah, agar loop pemanggil selalu melihat waktu bergerak
+        if seconds <= 0:
+            return
+        end = self.vehicle.time + seconds
+        self.vehicle.step()
+        while self.vehicle.time + 1e-9 < end:
+            self.vehicle.step()
+
+    def wait(self, event, timeout=None):
+        # Seperti sleep(): timeout > 0 minimal satu langkah, agar sisa waktu
+        # sangat kecil (pembulatan float) tidak membuat loop pemanggil macet
+        if event.is_set():
+            return True
+        if timeout is not None and timeout <= 0:
+            return False
+        end = None if timeout is None else self.vehicle.time + timeout
+        self.vehicle.step()
+        while not event.is_set():
+            if end is not None and self.vehicle.time + 1e-9 >= end:
+                return False
+            self.vehicle.step()
+        return True
+
+
+_default_clock = MonotonicClock()
+
+
+def get_clock(clock=None, vehicle=None):
+    """Kembalikan `clock` jika diisi, lalu `vehicle.clock` jika ada, selain itu jam default."""
+    if clock is not None:
+        return clock
+    clock = getattr(vehicle, "clock", None)
+    return clock if clock is not None else _default_clock
+
+
+def set_default_clock(clock):
+    """Ganti jam default yang dipakai helper tanpa argumen `clock`."""
+    global _default_clock
+    _default_clock = clock if clock is not None else MonotonicClock()
+
+
+def sleep(seconds, clock=None, vehicle=None):
+    """Pengganti time.sleep() untuk skrip misi, mengikuti jam vehicle atau jam default."""
+    get_clock(clock, vehicle).sleep(seconds)
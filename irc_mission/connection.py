@@ -0,0 +1,503 @@
+"""
+connection.py
+-------------
+Manajemen koneksi: wait_ready selektif, cache parameter di disk, pemantauan
+link lewat HEARTBEAT, dan reconnect otomatis yang melanjutkan leg berjalan.
+
+`connect(..., wait_ready=True)` menunggu semua atribut DAN seluruh tabel
+parameter terunduh, yang sering makan waktu beberapa detik. ConnectionManager
+hanya menunggu atribut yang dibutuhkan misi (DEFAULT_READY). Parameter dibaca
+lewat CachedParameters: nilai dari cache disk (key firmware + sysid) langsung
+tersedia, sementara unduhan penuh DroneKit tetap berjalan di belakang dan
+memperbarui cache begitu selesai. Jadi tidak ada yang menunggu unduhan
+parameter, baik saat koneksi pertama (jika cache sudah ada) maupun saat
+reconnect.
+
+LinkMonitor mencatat jeda antar HEARTBEAT di histogram dan menandai link
+"degraded" atau "lost". Saat lost, goto()/hover yang sedang menunggu
+dibangunkan dengan LinkLost; ConnectionManager.execute_waypoints() lalu
+menyambung ulang (dengan backoff) dan melanjutkan dari leg yang terputus
+memakai target absolut yang sama.
+
+Contoh:
+    with ConnectionManager(args.connect) as manager:
+        vehicle = manager.connect()
+        print(manager.parameters.get("RTL_ALT"))
+        arm_and_takeoff(vehicle, 10)
+        manager.execute_waypoints(WAYPOINTS)
+        land(manager.vehicle)
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+from .clock import get_clock
+from .control import DEFAULT_CONNECTION, connect_vehicle
+from .metrics import get_histogram
+
+# Atribut yang cukup untuk misi GUIDED; autopilot_version dipakai untuk key cache
+DEFAULT_READY = ("autopilot_version", "mode", "armed", "gps_0")
+
+DEFAULT_PARAM_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "irc_mission", "params",
+)
+
+LINK_OK = "ok"
+LINK_DEGRADED = "degraded"
+LINK_LOST = "lost"
+
+
+class LinkLost(RuntimeError):
+    """HEARTBEAT tidak diterima melewati batas waktu. `leg` = leg yang sedang berjalan."""
+
+    def __init__(self, gap, leg=None):
+        super().__init__(f"Link putus: tidak ada HEARTBEAT selama {gap:.1f}s")
+        self.gap = gap
+        self.leg = leg
+
+
+class ParameterCache:
+    """
+    Tabel parameter vehicle di disk, satu file JSON per firmware + sysid.
+
+    Parameter:
+        cache_dir : str - folder cache
+    """
+
+    def __init__(self, cache_dir=DEFAULT_PARAM_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def key(firmware, sysid):
+        """Key cache dari versi firmware dan system id (aman sebagai nama file)."""
+        return re.sub(r"[^A-Za-z0-9._-]+", "_", f"{firmware}-sys{sysid}")
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def load(self, key):
+        """Return dict nama -> nilai, atau None jika belum ada / rusak."""
+        try:
+            with open(self.path(key), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def save(self, key, params):
+        """Menyimpan tabel parameter (ditulis ke file sementara lalu di-rename)."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(params, f, sort_keys=True)
+        os.replace(tmp, path)
+        return path
+
+
+class CachedParameters:
+    """
+    Akses parameter vehicle yang tidak menunggu unduhan penuh.
+
+    Nilai dibaca dari cache jika ada; parameter yang tidak ada di cache
+    dibaca dari `vehicle.parameters` (yang di DroneKit bisa memblokir sampai
+    unduhan selesai). Begitu DroneKit selesai mengunduh (listener
+    `parameters`), cache di memori dan di disk diperbarui. Penulisan langsung
+    dikirim ke vehicle dan ikut mengubah cache.
+
+    Parameter:
+        vehicle : objek Vehicle DroneKit
+        cache   : ParameterCache
+        key     : str - key cache (ParameterCache.key)
+    """
+
+    def __init__(self, vehicle, cache, key):
+        self.vehicle = vehicle
+        self.cache = cache
+        self.key = key
+        self.values = cache.load(key) or {}
+        self.source = "cache" if self.values else "vehicle"
+        self.loaded = threading.Event()
+        self._listening = False
+        if _parameters_complete(vehicle):
+            self._refresh()
+        elif hasattr(vehicle, "add_attribute_listener"):
+            vehicle.add_attribute_listener("parameters", self._on_parameters)
+            self._listening = True
+
+    def _on_parameters(self, _vehicle, _name, _value):
+        self._refresh()
+
+    def _refresh(self):
+        params = {name: value for name, value in self.vehicle.parameters.items() if value is not None}
+        if params:
+            changed = params != self.values
+            self.values = params
+            self.source = "vehicle"
+            if changed:
+                self.cache.save(self.key, params)
+        self.loaded.set()
+        self.close()
+
+    def close(self):
+        if self._listening:
+            self.vehicle.remove_attribute_listener("parameters", self._on_parameters)
+            self._listening = False
+
+    def get(self, name, default=None):
+        if name in self.values:
+            return self.values[name]
+        value = self.vehicle.parameters.get(name)
+        return default if value is None else value
+
+    def __getitem__(self, name):
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __setitem__(self, name, value):
+        self.vehicle.parameters[name] = value
+        self.values[name] = value
+        self.cache.save(self.key, self.values)
+
+    def __contains__(self, name):
+        return name in self.values
+
+    def __len__(self):
+        return len(self.values)
+
+
+def _parameters_complete(vehicle):
+    """True jika tabel parameter vehicle sudah lengkap (DroneKit: _params_loaded)."""
+    return getattr(vehicle, "_params_loaded", isinstance(vehicle.parameters, dict))
+
+
+class _HeartbeatTimeout(threading.Event):
+    """
+    Event `breached` LinkMonitor: is_set() sekaligus memeriksa umur HEARTBEAT.
+
+    Saat link putus tidak ada listener yang terpanggil, jadi pemeriksaan
+    tidak bisa menunggu pesan. Selain thread pengawas, setiap pemanggil yang
+    mengecek event ini (loop tunggu goto/hover, SimClock.wait) ikut memeriksa,
+    sehingga deteksi juga tepat waktu di jam simulasi.
+    """
+
+    def __init__(self, monitor):
+        super().__init__()
+        self._monitor = monitor
+
+    def is_set(self):
+        if not super().is_set():
+            self._monitor._check()
+        return super().is_set()
+
+
+class LinkMonitor:
+    """
+    Memantau kesehatan link dari jeda antar HEARTBEAT.
+
+    Jeda antar HEARTBEAT dicatat di histogram `link.heartbeat`. Umur HEARTBEAT
+    terakhir diperiksa oleh thread pengawas setiap `check_interval` detik
+    (waktu nyata) dan setiap kali `breached` dicek, terhadap jam `clock`.
+
+    Parameter:
+        vehicle        : objek Vehicle DroneKit
+        timeout        : float - tanpa HEARTBEAT selama ini = link putus (detik)
+        degraded_after : float - tanpa HEARTBEAT selama ini = link terganggu (detik)
+        clock          : jam yang dipakai (default: jam default)
+        check_interval : float - periode thread pengawas (detik waktu nyata)
+    """
+
+    def __init__(self, vehicle, timeout=5.0, degraded_after=2.0, clock=None, check_interval=0.1):
+        self.vehicle = vehicle
+        self.timeout = timeout
+        self.degraded_after = degraded_after
+        self.clock = get_clock(clock, vehicle)
+        self.check_interval = check_interval
+        self.latency = get_histogram("link.heartbeat")
+        self.breached = _HeartbeatTimeout(self)
+        self.state = LINK_OK
+        self.sysid = None
+        self.losses = 0
+        self.max_gap = 0.0
+        self._heartbeat = threading.Event()
+        self._lock = threading.Lock()
+        self._last = None
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        if self._running:
+            return self
+        self._last = self.clock.now()
+        self._running = True
+        self.vehicle.add_message_listener("HEARTBEAT", self._on_heartbeat)
+        self._thread = threading.Thread(target=self._watch, name="LinkMonitor", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        self.vehicle.remove_message_listener("HEARTBEAT", self._on_heartbeat)
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    @property
+    def gap(self):
+        """Umur HEARTBEAT terakhir (detik)."""
+        return self.clock.now() - self._last
+
+    def wait_heartbeat(self, timeout):
+        """Tunggu satu HEARTBEAT berikutnya. Return False jika timeout."""
+        self._heartbeat.clear()
+        return self.clock.wait(self._heartbeat, timeout)
+
+    def raise_if_breached(self):
+        """Melempar LinkLost jika link sudah dinyatakan putus."""
+        if self.breached.is_set():
+            raise LinkLost(self.max_gap)
+
+    def _on_heartbeat(self, _vehicle, _name, message):
+        now = self.clock.now()
+        gap = now - self._last
+        self._last = now
+        self.latency.record(gap)
+        self.max_gap = max(self.max_gap, gap)
+        if self.sysid is None:
+            get_src = getattr(message, "get_srcSystem", None)
+            self.sysid = get_src() if get_src is not None else None
+        if self.state != LINK_OK:
+            print(f"[LINK] HEARTBEAT kembali setelah {gap:.1f}s")
+            self.state = LINK_OK
+        self._heartbeat.set()
+
+    def _check(self):
+        if not self._running:
+            return
+        with self._lock:
+            gap = self.gap
+            if gap > self.timeout:
+                if self.state != LINK_LOST:
+                    self.state = LINK_LOST
+                    self.losses += 1
+                    self.max_gap = max(self.max_gap, gap)
+                    print(f"[LINK] Putus: tidak ada HEARTBEAT selama {gap:.1f}s")
+                    self.breached.set()
+            elif gap > self.degraded_after and self.state == LINK_OK:
+                self.state = LINK_DEGRADED
+                print(f"[WARN] Link terganggu: HEARTBEAT terakhir {gap:.1f}s lalu")
+
+    def _watch(self):
+        while self._running:
+            self._check()
+            time.sleep(self.check_interval)
+
+
+class ConnectionManager:
+    """
+    Koneksi vehicle dengan wait_ready selektif, cache parameter, pemantauan
+    link, dan reconnect otomatis.
+
+    Parameter:
+        connection_string  : str - alamat koneksi (lihat connect_vehicle), termasuk sim
+        wait_ready         : tuple of str - atribut yang ditunggu saat connect,
+                             True = semua (termasuk unduhan parameter penuh)
+        cache_dir          : str - folder cache parameter, None = tanpa cache disk
+        heartbeat_timeout  : float - tanpa HEARTBEAT selama ini = link putus (detik)
+        reconnect_attempts : int - batas percobaan reconnect berturut-turut
+        retry_interval     : float - jeda sebelum percobaan reconnect kedua (detik)
+        backoff            : float - pengali jeda antar percobaan reconnect
+        connect_fn         : fungsi () -> vehicle pengganti connect_vehicle (opsional)
+        clock              : jam yang dipakai (default: jam default)
+    """
+
+    def __init__(self, connection_string=DEFAULT_CONNECTION, wait_ready=DEFAULT_READY,
+                 cache_dir=DEFAULT_PARAM_CACHE_DIR, heartbeat_timeout=5.0, reconnect_attempts=5,
+                 retry_interval=1.0, backoff=2.0, connect_fn=None, clock=None):
+        self.connection_string = connection_string
+        self.wait_ready = list(wait_ready) if isinstance(wait_ready, (tuple, list)) else wait_ready
+        self.cache = ParameterCache(cache_dir) if cache_dir is not None else None
+        self.heartbeat_timeout = heartbeat_timeout
+        self.reconnect_attempts = reconnect_attempts
+        self.retry_interval = retry_interval
+        self.backoff = backoff
+        self.connect_fn = connect_fn
+        self.clock = clock
+        self.vehicle = None
+        self.link = None
+        self.parameters = None
+        self.reconnects = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _reuses_vehicle(self):
+        # SimVehicle berjalan di proses ini: "reconnect" = memakai objek yang sama
+        return (self.connect_fn is None and self.vehicle is not None
+                and self.connection_string.startswith("sim"))
+
+    def _open(self):
+        if self.connect_fn is not None:
+            return self.connect_fn()
+        if self._reuses_vehicle():
+            return self.vehicle
+        return connect_vehicle(self.connection_string, wait_ready=self.wait_ready)
+
+    def connect(self):
+        """
+        Membuka koneksi dan menyiapkan LinkMonitor serta CachedParameters.
+
+        Return:
+            Vehicle
+        """
+        clock = get_clock(self.clock)
+        start = clock.now()
+        self.vehicle = self._open()
+        self.link = LinkMonitor(self.vehicle, timeout=self.heartbeat_timeout, clock=self.clock).start()
+        elapsed = clock.now() - start
+        get_histogram("link.connect").record(elapsed)
+
+        if self.cache is not None:
+            sysid = _sysid(self.vehicle, self.link)
+            key = ParameterCache.key(getattr(self.vehicle, "version", "unknown"), sysid)
+            if self.parameters is not None:
+                self.parameters.close()
+            self.parameters = CachedParameters(self.vehicle, self.cache, key)
+            print(f"[LINK] Terhubung dalam {elapsed:.2f}s | parameter: {len(self.parameters)} dari "
+                  f"{self.parameters.source} ({key})")
+        else:
+            print(f"[LINK] Terhubung dalam {elapsed:.2f}s")
+        return self.vehicle
+
+    def reconnect(self):
+        """
+        Menutup koneksi lama dan menyambung ulang dengan backoff.
+
+        Return:
+            Vehicle
+
+        Raises:
+            ConnectionError - semua percobaan gagal
+        """
+        clock = get_clock(self.clock, self.vehicle)
+        self._close_link()
+        self._close_vehicle()
+        interval = self.retry_interval
+        for attempt in range(1, self.reconnect_attempts + 1):
+            print(f"[LINK] Reconnect percobaan {attempt}/{self.reconnect_attempts}...")
+            try:
+                self.connect()
+                if self.link.wait_heartbeat(self.heartbeat_timeout):
+                    self.reconnects += 1
+                    return self.vehicle
+                print("[WARN] Terhubung, tetapi belum ada HEARTBEAT")
+            except Exception as exc:  # noqa: BLE001 - pymavlink melempar berbagai jenis error
+                print(f"[WARN] Reconnect gagal: {exc}")
+            self._close_link()
+            self._close_vehicle()
+            clock.sleep(interval)
+            interval *= self.backoff
+        raise ConnectionError(f"Gagal reconnect ke {self.connection_string} "
+                              f"setelah {self.reconnect_attempts} percobaan")
+
+    def execute_waypoints(self, waypoints, frame=None, targets=None, **kwargs):
+        """
+        execute_waypoints() yang tahan link putus.
+
+        Target absolut dihitung sekali dari posisi awal. Jika LinkLost terjadi,
+        koneksi disambung ulang lalu misi dilanjutkan dari leg yang terputus
+        (target sama, jadi tidak ada offset yang bergeser). Monitor di kwargs
+        (geofence, battery, streams) dipindahkan ke vehicle hasil reconnect.
+
+        Parameter:
+            waypoints : list of dict - format execute_waypoints()
+            frame     : str - frame default waypoint (None = default execute_waypoints)
+            targets   : TargetTable - target yang sudah dihitung (opsional)
+            kwargs    : argumen lain execute_waypoints() (clock, telemetry, geofence, ...)
+        """
+        from .frames import FRAME_PREVIOUS, resolve_targets
+        from .navigation import execute_waypoints
+
+        frame = frame or FRAME_PREVIOUS
+        if targets is None:
+            targets = resolve_targets(waypoints, self.vehicle.location.global_relative_frame, frame)
+        start = 1
+        while True:
+            try:
+                execute_waypoints(self.vehicle, waypoints, frame=frame, targets=targets,
+                                  start=start, link=self.link, **kwargs)
+                return
+            except LinkLost as exc:
+                start = exc.leg or start
+                print(f"\n[LINK] {exc}, misi dijeda di leg {start}/{len(targets)}")
+                self.reconnect()
+                _rebind_monitors(kwargs, self.vehicle)
+                print(f"[LINK] Melanjutkan dari leg {start}/{len(targets)}")
+
+    def _close_link(self):
+        if self.link is not None:
+            self.link.stop()
+            self.link = None
+        if self.parameters is not None:
+            self.parameters.close()
+
+    def _close_vehicle(self):
+        if self.vehicle is None or self._reuses_vehicle():
+            return
+        try:
+            self.vehicle.close()
+        except Exception as exc:  # noqa: BLE001 - koneksi lama memang sudah bermasalah
+            print(f"[WARN] Gagal menutup koneksi lama: {exc}")
+        self.vehicle = None
+
+    def close(self):
+        """Menutup LinkMonitor dan koneksi vehicle."""
+        self._close_link()
+        if self.vehicle is not None:
+            self.vehicle.close()
+            self.vehicle = None
+
+
+def _rebind_monitors(kwargs, vehicle):
+    """Pindahkan monitor execute_waypoints() (geofence, battery, streams) ke `vehicle`."""
+    for key in ("geofence", "battery", "streams"):
+        monitor = kwargs.get(key)
+        if monitor is None or monitor.vehicle is vehicle:
+            continue
+        if key == "streams":
+            monitor.rebind(vehicle)
+        else:
+            monitor.stop()
+            monitor.vehicle = vehicle
+            monitor.start()
+        print(f"[LINK] {type(monitor).__name__} dipindahkan ke koneksi baru")
+
+
+def _sysid(vehicle, link):
+    """System id vehicle: dari koneksi DroneKit, HEARTBEAT, atau atribut SimVehicle."""
+    handler = getattr(vehicle, "_handler", None)
+    sysid = getattr(handler, "target_system", None)
+    if sysid:
+        return sysid
+    if link.sysid is None:
+        link.wait_heartbeat(2.0)
+    return link.sysid if link.sysid is not None else getattr(vehicle, "sysid", 0)
@@ -0,0 +1,272 @@
+"""
+control.py
+----------
+Koneksi, perpindahan mode, arm/takeoff, dan landing.
+
+Semua impor `dronekit` dilakukan di dalam fungsi agar `--help` dan dry-run
+skrip contoh tidak perlu memuat dronekit/pymavlink sama sekali.
+"""
+
+import threading
+
+from .clock import SimClock, get_clock
+from .metrics import get_histogram
+from .streams import PHASE_LANDING
+from .telemetry import LEG_LAND, LEG_TAKEOFF, get_recorder
+
+DEFAULT_CONNECTION = "tcp:127.0.0.1:5762"
+
+
+def connect_vehicle(connection_string=DEFAULT_CONNECTION, wait_ready=True):
+    """
+    Membuka koneksi ke vehicle (default: SITL Mission Planner).
+
+    Alamat `sim` atau `sim:<speedup>` (misalnya `sim:100`) tidak membuka koneksi
+    MAVLink, tetapi menjalankan SimVehicle di dalam proses (lihat sim.py).
+    `sim` memakai jam virtual (SimClock dipasang di `vehicle.clock` dan dipakai
+    helper yang menerima vehicle ini), sehingga misi selesai secepat CPU tanpa
+    thread; `sim:<speedup>` menjalankan simulasi di
+    thread latar dengan kelipatan waktu nyata.
+
+    Parameter:
+        connection_string : str  - alamat koneksi MAVLink, atau sim[:speedup]
+        wait_ready        : bool - tunggu atribut vehicle terisi sebelum return
+
+    Return:
+        Vehicle - objek Vehicle DroneKit (atau SimVehicle)
+    """
+    if connection_string == "sim" or connection_string.startswith("sim:"):
+        from .sim import SimVehicle
+
+        if connection_string == "sim":
+            vehicle = SimVehicle()
+            vehicle.clock = SimClock(vehicle)
+            return vehicle
+        return SimVehicle().start(speedup=float(connection_string[4:] or 1))
+
+    from dronekit import connect
+
+    return connect(connection_string, wait_ready=wait_ready)
+
+
+def switch_mode(vehicle, mode_name, timeout=10, clock=None, retry_interval=1.0, backoff=2.0):
+    """
+    Berpindah ke mode tertentu dan menunggu konfirmasi flight controller.
+
+    Konfirmasi ditunggu lewat attribute listener `mode` (diperbarui DroneKit
+    dari HEARTBEAT), jadi fungsi ini kembali begitu HEARTBEAT dengan mode baru
+    diterima, bukan pada tick polling 0.5 detik berikutnya. Jika belum
+    terkonfirmasi setelah `retry_interval`, perintah dikirim ulang dengan jeda
+    yang dikali `backoff` setiap percobaan, sampai `timeout` habis.
+
+    Latensi perintah-sampai-konfirmasi dicatat di histogram `mode.<MODE>`
+    (lihat metrics.py), timeout dihitung sebagai `errors` di histogram yang sama.
+
+    Parameter:
+        vehicle        : objek Vehicle DroneKit
+        mode_name      : str - nama mode tujuan
+        timeout        : int - batas waktu tunggu total (detik)
+        clock          : jam yang dipakai (default: jam vehicle atau jam default, lihat clock.py)
+        retry_interval : float - tunggu sebelum perintah dikirim ulang (detik)
+        backoff        : float - pengali jeda antar pengiriman ulang
+
+    Return:
+        bool - True jika berhasil, False jika timeout
+    """
+    from dronekit import VehicleMode
+
+    clock = get_clock(clock, vehicle)
+    histogram = get_histogram(f"mode.{mode_name}")
+    confirmed = threading.Event()
+
+    def listener(_vehicle, _name, mode):
+        if mode is not None and mode.name == mode_name:
+            confirmed.set()
+
+    # Listener dipasang sebelum perintah dikirim agar konfirmasi tidak terlewat
+    vehicle.add_attribute_listener("mode", listener)
+    try:
+        start = clock.now()
+        deadline = start + timeout
+        interval = retry_interval
+        attempt = 1
+        vehicle.mode = VehicleMode(mode_name)
+        while vehicle.mode.name != mode_name:
+            remaining = deadline - clock.now()
+            if remaining <= 0:
+                histogram.record_error()
+                print(f"[WARN] Timeout saat pindah ke mode {mode_name}")
+                return False
+            wait = min(interval, remaining)
+            if clock.wait(confirmed, wait):
+                break
+            # Tunggu yang dipotong deadline tidak diikuti kirim ulang; cek waktu
+            # jam saja bisa meleset sedikit di bawah deadline karena pembulatan
+            if vehicle.mode.name == mode_name or wait >= remaining:
+                continue
+            attempt += 1
+            interval *= backoff
+            print(f"[WARN] Mode {mode_name} belum terkonfirmasi, kirim ulang (percobaan {attempt})")
+            vehicle.mode = VehicleMode(mode_name)
+    finally:
+        vehicle.remove_attribute_listener("mode", listener)
+
+    histogram.record(clock.now() - start)
+    print(f"[MODE] {mode_name} aktif")
+    return True
+
+
+LAUNCH_PHASES = ("armable", "mode", "arm", "climb")
+
+
+def arm_and_takeoff(vehicle, target_altitude, clock=None, telemetry=None, arm_retry=1.0,
+                    report=True):
+    """
+    Menunggu drone siap, melakukan arm, dan takeoff ke ketinggian target.
+
+    Langkah yang tidak saling bergantung dijalankan tumpang tindih:
+        - perintah GUIDED dikirim langsung, selagi menunggu EKF/GPS (is_armable)
+        - arm dikirim pada update atribut pertama yang menunjukkan is_armable
+          dan mode GUIDED, bukan pada tick polling 1 detik berikutnya
+        - simple_takeoff dikirim begitu update `armed` diterima, lalu
+          ketinggian diikuti lewat listener posisi
+
+    Waktu tiap fase (detik sejak fungsi dipanggil) dikembalikan, dicetak
+    sebagai rincian [LAUNCH], dan dicatat di histogram `launch.<fase>`
+    (lihat metrics.py).
+
+    Parameter:
+        vehicle          : objek Vehicle DroneKit
+        target_altitude  : float - ketinggian target dalam meter
+        clock            : jam yang dipakai (default: jam default)
+        telemetry        : perekam telemetri (default: perekam default, lihat telemetry.py)
+        arm_retry        : float - jeda sebelum perintah arm dikirim ulang (detik)
+        report           : bool - cetak rincian waktu per fase
+
+    Return:
+        dict - fase -> (mulai, selesai) dalam detik sejak awal, plus "total"
+    """
+    from dronekit import VehicleMode
+
+    clock = get_clock(clock, vehicle)
+    recorder = get_recorder(telemetry)
+    armable = threading.Event()
+    guided = threading.Event()
+    armed = threading.Event()
+    reached = threading.Event()
+    marks = {}
+    t0 = clock.now()
+
+    def mark(name):
+        marks.setdefault(name, clock.now() - t0)
+
+    def on_attribute(_vehicle, _name, _value):
+        # Wildcard: dipanggil untuk setiap atribut, jadi kondisi dibaca langsung
+        if not armable.is_set() and vehicle.is_armable:
+            mark("armable")
+            armable.set()
+        if not guided.is_set() and vehicle.mode.name == "GUIDED":
+            mark("mode")
+            guided.set()
+        if not armed.is_set() and vehicle.armed:
+            mark("arm")
+            armed.set()
+
+    def on_position(_locations, _name, location):
+        if location.alt is not None and location.alt >= target_altitude * 0.95:
+            mark("climb")
+            reached.set()
+
+    vehicle.add_attribute_listener("*", on_attribute)
+    vehicle.location.add_attribute_listener("global_relative_frame", on_position)
+    try:
+        # Mode di-stage lebih dulu, tumpang tindih dengan tunggu EKF/GPS
+        vehicle.mode = VehicleMode("GUIDED")
+        on_attribute(vehicle, "*", None)
+        if not armable.is_set():
+            print("[INFO] Menunggu drone siap (is_armable)...")
+        while not armable.is_set():
+            clock.wait(armable, 1.0)
+            on_attribute(vehicle, "*", None)
+
+        # Flight controller bisa menolak GUIDED sebelum posisi siap: konfirmasi ulang
+        if not guided.is_set():
+            switch_mode(vehicle, "GUIDED", clock=clock)
+            on_attribute(vehicle, "*", None)
+        else:
+            print("[MODE] GUIDED aktif")
+
+        print("[INFO] Arm drone...")
+        arm_sent = clock.now() - t0
+        vehicle.armed = True
+        while not armed.is_set():
+            if not clock.wait(armed, arm_retry):
+                on_attribute(vehicle, "*", None)
+                if not armed.is_set():
+                    print("  Menunggu arm...")
+                    vehicle.armed = True
+        print("[INFO] Drone ter-arm")
+
+        print(f"[INFO] Takeoff ke {target_altitude} meter...")
+        takeoff_sent = clock.now() - t0
+        vehicle.simple_takeoff(target_altitude)
+        on_position(vehicle.location, "global_relative_frame", vehicle.location.global_relative_frame)
+        while True:
+            pos = vehicle.location.global_relative_frame
+            recorder.record(clock.now(), LEG_TAKEOFF, vehicle.mode.name, pos, target_altitude - pos.alt)
+            if reached.is_set() or clock.wait(reached, recorder.sample_interval):
+                break
+        print(f"[INFO] Ketinggian {target_altitude}m tercapai")
+    finally:
+        vehicle.remove_attribute_listener("*", on_attribute)
+        vehicle.location.remove_attribute_listener("global_relative_frame", on_position)
+
+    # Vehicle yang sudah armed / sudah di ketinggian (misalnya replay) tercatat
+    # sebelum perintahnya dikirim: fase itu dihitung nol
+    phases = {
+        "armable": (0.0, marks["armable"]),
+        "mode": (0.0, marks.get("mode", marks["armable"])),
+        "arm": (min(arm_sent, marks["arm"]), marks["arm"]),
+        "climb": (min(takeoff_sent, marks["climb"]), marks["climb"]),
+    }
+    phases["total"] = (0.0, marks["climb"])
+    for name, (start, end) in phases.items():
+        get_histogram(f"launch.{name}").record(end - start)
+    if report:
+        print_launch_report(phases)
+    return phases
+
+
+def print_launch_report(phases):
+    """Mencetak rincian waktu fase dari arm_and_takeoff()."""
+    total = phases["total"][1]
+    sequential = sum(end - start for name, (start, end) in phases.items() if name != "total")
+    print(f"[LAUNCH] Total {total:.2f}s (berurutan {sequential:.2f}s, hemat {sequential - total:.2f}s "
+          f"karena tumpang tindih)")
+    for name in LAUNCH_PHASES:
+        start, end = phases[name]
+        print(f"  {name:<8} {start:>6.2f}s -> {end:>6.2f}s  ({end - start:.2f}s)")
+
+
+def land(vehicle, ground_altitude=0.2, clock=None, telemetry=None, streams=None):
+    """
+    Beralih ke mode LAND dan menunggu hingga drone menyentuh tanah.
+
+    Parameter:
+        vehicle         : objek Vehicle DroneKit
+        ground_altitude : float - ketinggian (meter) yang dianggap sudah mendarat
+        clock           : jam yang dipakai (default: jam default)
+        telemetry       : perekam telemetri (default: perekam default)
+        streams         : StreamRateController - pindah ke rate fase landing (lihat streams.py)
+    """
+    clock = get_clock(clock, vehicle)
+    recorder = get_recorder(telemetry)
+    if streams is not None:
+        streams.set_phase(PHASE_LANDING)
+    switch_mode(vehicle, "LAND", clock=clock)
+    while True:
+        pos = vehicle.location.global_relative_frame
+        recorder.record(clock.now(), LEG_LAND, vehicle.mode.name, pos, max(0.0, pos.alt - ground_altitude))
+        if pos.alt <= ground_altitude:
+            break
+        clock.sleep(recorder.sample_interval)
@@ -0,0 +1,158 @@
+"""
+distance.py
+-----------
+Model jarak antar titik GPS yang bisa dipilih sesuai kebutuhan.
+
+Rumus lama `sqrt(dlat² + dlon²) * 1.113195e5` memperlakukan 1 derajat bujur
+sama panjang dengan 1 derajat lintang. Padahal panjang 1 derajat bujur
+menyusut sebesar cos(lintang), sehingga jarak timur-barat dilebih-lebihkan
+(di lintang 60° kelebihannya 2x) dan threshold tiba terlambat terpenuhi.
+
+Tiga model yang tersedia (galat dibandingkan geodesik WGS84, lihat
+benchmarks/bench_distance.py untuk tabel lengkapnya):
+
+    equirectangular : proyeksi datar lokal dengan jari-jari kelengkungan
+                      ellipsoid WGS84 di lintang referensi (koreksi cos lintang).
+                      Galat < 0.01% untuk jarak < 10 km di bawah lintang 80°.
+                      Paling murah: dua perkalian dan satu hypot per panggilan
+                      jika konstanta dihitung sekali per misi (ref_lat); galat
+                      tambahan ~0.005%/km dari ref_lat di lintang 60°
+                      (< 0.05% dalam radius 10 km).
+    haversine       : lingkaran besar pada bola dengan jari-jari rata-rata
+                      6371008.8 m. Galat hingga ~0.5% karena bumi bukan bola,
+                      tetapi tetap valid untuk jarak jauh.
+    ecef            : jarak garis lurus 3D antar titik dalam koordinat ECEF
+                      WGS84, termasuk selisih ketinggian. Galat < 1 mm untuk
+                      jarak < 10 km (selisih tali busur vs busur = d³/24R²).
+"""
+
+import math
+
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_E2 = WGS84_F * (2 - WGS84_F)
+MEAN_EARTH_RADIUS = 6371008.8
+
+# Panjang 1 derajat pada bola berjari-jari WGS84_A (dipakai rumus lama)
+METERS_PER_DEGREE = 1.113195e5
+
+MODELS = ("equirectangular", "haversine", "ecef")
+DEFAULT_MODEL = "equirectangular"
+
+
+def meters_per_degree(lat):
+    """
+    Panjang 1 derajat lintang dan 1 derajat bujur di lintang tertentu (WGS84).
+
+    Parameter:
+        lat : float - lintang referensi (derajat)
+
+    Return:
+        tuple (m_per_deg_lat, m_per_deg_lon)
+    """
+    phi = math.radians(lat)
+    sin_phi = math.sin(phi)
+    w = 1 - WGS84_E2 * sin_phi * sin_phi
+    meridian = WGS84_A * (1 - WGS84_E2) / (w * math.sqrt(w))
+    prime_vertical = WGS84_A / math.sqrt(w)
+    rad = math.pi / 180
+    return meridian * rad, prime_vertical * math.cos(phi) * rad
+
+
+def offset_degrees(lat, d_north, d_east):
+    """
+    Offset meter menjadi selisih derajat, kebalikan dari equirectangular_distance().
+
+    Skala lintang dan bujur diambil di lintang tengah antara titik asal dan
+    titik tujuan, sama seperti equirectangular_distance(), sehingga jarak
+    titik hasil ke titik asal kembali tepat sqrt(d_north² + d_east²).
+
+    Parameter:
+        lat     : float - lintang titik asal (derajat)
+        d_north : float - offset ke utara (meter), negatif = selatan
+        d_east  : float - offset ke timur (meter), negatif = barat
+
+    Return:
+        tuple (d_lat, d_lon) - selisih derajat
+    """
+    d_lat = d_north / meters_per_degree(lat)[0]
+    d_lat = d_north / meters_per_degree(lat + d_lat / 2)[0]
+    return d_lat, d_east / meters_per_degree(lat + d_lat / 2)[1]
+
+
+def local_offset(lat1, lon1, lat2, lon2):
+    """
+    Offset (north, east) meter titik 2 dari titik 1, komponen dari
+    equirectangular_distance(); kebalikan dari offset_degrees().
+    """
+    k_lat, k_lon = meters_per_degree((lat1 + lat2) / 2)
+    return (lat2 - lat1) * k_lat, (lon2 - lon1) * k_lon
+
+
+def equirectangular_distance(loc1, loc2):
+    """Jarak meter (2D) dengan proyeksi datar lokal di lintang rata-rata kedua titik."""
+    k_lat, k_lon = meters_per_degree((loc1.lat + loc2.lat) / 2)
+    return math.hypot((loc2.lat - loc1.lat) * k_lat, (loc2.lon - loc1.lon) * k_lon)
+
+
+def haversine_distance(loc1, loc2):
+    """Jarak meter (2D) lingkaran besar dengan rumus haversine."""
+    phi1 = math.radians(loc1.lat)
+    phi2 = math.radians(loc2.lat)
+    d_phi = phi2 - phi1
+    d_lam = math.radians(loc2.lon - loc1.lon)
+    h = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lam / 2) ** 2
+    return 2 * MEAN_EARTH_RADIUS * math.asin(min(1.0, math.sqrt(h)))
+
+
+def to_ecef(lat, lon, alt):
+    """Konversi lat/lon (derajat) dan ketinggian (meter) ke koordinat ECEF WGS84."""
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    sin_phi = math.sin(phi)
+    cos_phi = math.cos(phi)
+    n = WGS84_A / math.sqrt(1 - WGS84_E2 * sin_phi * sin_phi)
+    return (
+        (n + alt) * cos_phi * math.cos(lam),
+        (n + alt) * cos_phi * math.sin(lam),
+        (n * (1 - WGS84_E2) + alt) * sin_phi,
+    )
+
+
+def ecef_distance(loc1, loc2):
+    """Jarak meter (3D, termasuk selisih ketinggian) melalui koordinat ECEF."""
+    x1, y1, z1 = to_ecef(loc1.lat, loc1.lon, loc1.alt or 0.0)
+    x2, y2, z2 = to_ecef(loc2.lat, loc2.lon, loc2.alt or 0.0)
+    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2 + (z2 - z1) ** 2)
+
+
+def distance_function(model=DEFAULT_MODEL, ref_lat=None):
+    """
+    Membuat fungsi jarak (loc1, loc2) -> meter untuk model tertentu.
+
+    Untuk model equirectangular, jika ref_lat diberikan maka konstanta cos(lintang)
+    dan jari-jari kelengkungan dihitung sekali di sini, sehingga setiap panggilan
+    di loop hanya butuh dua perkalian dan satu hypot. Cocok untuk satu misi
+    lokal; gunakan lintang home atau lintang target.
+
+    Parameter:
+        model   : str   - "equirectangular", "haversine", atau "ecef"
+        ref_lat : float - lintang referensi (derajat), opsional
+
+    Return:
+        fungsi (loc1, loc2) -> float
+    """
+    if model == "equirectangular":
+        if ref_lat is None:
+            return equirectangular_distance
+        k_lat, k_lon = meters_per_degree(ref_lat)
+
+        def local_distance(loc1, loc2):
+            return math.hypot((loc2.lat - loc1.lat) * k_lat, (loc2.lon - loc1.lon) * k_lon)
+
+        return local_distance
+    if model == "haversine":
+        return haversine_distance
+    if model == "ecef":
+        return ecef_distance
+    raise ValueError(f"Model jarak tidak dikenal: {model!r} (pilihan: {', '.join(MODELS)})")
@@ -0,0 +1,336 @@
+"""
+energy.py
+---------
+Model energi misi: perkiraan konsumsi per leg sebelum terbang dan prediksi
+"masih cukup untuk pulang?" selama terbang dari pembacaan `vehicle.battery`.
+
+Model per leg (konservatif, komponen dijumlahkan):
+    - horizontal : jarak / cruise_speed pada daya cruise
+    - naik       : waktu naik pada daya hover + energi potensial m*g*h / efisiensi
+    - turun      : waktu turun pada daya hover
+    - hover      : durasi hover pada daya hover
+
+Semua konstanta dihitung sekali di EnergyModel, jadi return_energy() hanya
+beberapa perkalian dan cukup murah untuk dipanggil di setiap update posisi.
+
+BatteryMonitor memantau dua stream:
+    - `battery` (SYS_STATUS): sisa energi = min(kapasitas * level%, kapasitas
+      dikurangi integral tegangan * arus), yang lebih pesimis dipakai
+    - posisi: energi untuk pulang dari posisi saat ini (naik ke ketinggian
+      RTL, terbang lurus ke home, turun) dibanding sisa energi dikurangi
+      cadangan. Begitu tidak cukup, mode diganti ke RTL lebih awal.
+
+Contoh:
+    model = EnergyModel(hover_power_w=180, cruise_power_w=230)
+    estimate = estimate_energy(WAYPOINTS, vehicle.location.global_relative_frame, model)
+    print_energy_report(estimate, capacity_wh=80)
+    with BatteryMonitor(vehicle, model, capacity_wh=80, reserve=0.2) as battery:
+        execute_waypoints(vehicle, WAYPOINTS, battery=battery)
+"""
+
+import math
+import threading
+import time
+from array import array
+
+from .clock import get_clock
+from .distance import meters_per_degree
+from .frames import FRAME_PREVIOUS, resolve_targets
+from .metrics import LatencyHistogram
+
+GRAVITY = 9.81
+
+
+class EnergyAbort(RuntimeError):
+    """Misi dihentikan karena energi tidak cukup untuk pulang. `status` berisi detailnya."""
+
+    def __init__(self, status):
+        super().__init__(f"Energi tidak cukup untuk melanjutkan misi: sisa {status['remaining_wh']:.1f} Wh, "
+                         f"pulang butuh {status['return_wh']:.1f} Wh + cadangan {status['reserve_wh']:.1f} Wh")
+        self.status = status
+
+
+class EnergyModel:
+    """
+    Model konsumsi energi multicopter.
+
+    Parameter:
+        hover_power_w    : float - daya saat hover (watt)
+        cruise_power_w   : float - daya saat terbang datar di cruise_speed (watt)
+        cruise_speed     : float - kecepatan horizontal (m/s)
+        climb_speed      : float - laju naik (m/s)
+        descent_speed    : float - laju turun / landing (m/s)
+        mass_kg          : float - massa drone (kg)
+        climb_efficiency : float - efisiensi propulsi untuk energi potensial (0-1)
+        rtl_altitude     : float - ketinggian minimum RTL (meter, parameter RTL_ALT)
+    """
+
+    def __init__(self, hover_power_w=180.0, cruise_power_w=230.0, cruise_speed=5.0,
+                 climb_speed=2.5, descent_speed=1.0, mass_kg=1.5, climb_efficiency=0.5,
+                 rtl_altitude=15.0):
+        self.hover_power_w = hover_power_w
+        self.cruise_power_w = cruise_power_w
+        self.cruise_speed = cruise_speed
+        self.climb_speed = climb_speed
+        self.descent_speed = descent_speed
+        self.mass_kg = mass_kg
+        self.climb_efficiency = climb_efficiency
+        self.rtl_altitude = rtl_altitude
+        # Wh per meter / per detik, dihitung sekali
+        self.wh_per_m = cruise_power_w / cruise_speed / 3600.0
+        self.wh_per_m_climb = (hover_power_w / climb_speed + mass_kg * GRAVITY / climb_efficiency) / 3600.0
+        self.wh_per_m_descent = hover_power_w / descent_speed / 3600.0
+        self.wh_per_s_hover = hover_power_w / 3600.0
+
+    def leg_energy(self, horizontal, vertical, hover=0.0):
+        """
+        Energi satu leg (Wh).
+
+        Parameter:
+            horizontal : float - jarak horizontal (meter)
+            vertical   : float - perubahan ketinggian (meter, positif = naik)
+            hover      : float - durasi hover di akhir leg (detik)
+        """
+        climb = self.wh_per_m_climb * vertical if vertical > 0 else -self.wh_per_m_descent * vertical
+        return self.wh_per_m * horizontal + climb + self.wh_per_s_hover * hover
+
+    def return_energy(self, distance, altitude):
+        """
+        Energi untuk RTL dari posisi saat ini (Wh): naik ke rtl_altitude jika
+        lebih rendah, terbang lurus ke home, lalu turun sampai mendarat.
+
+        Parameter:
+            distance : float - jarak horizontal ke home (meter)
+            altitude : float - ketinggian saat ini (meter)
+        """
+        climb = self.rtl_altitude - altitude
+        if climb > 0:
+            return self.wh_per_m_climb * climb + self.wh_per_m * distance + self.wh_per_m_descent * self.rtl_altitude
+        return self.wh_per_m * distance + self.wh_per_m_descent * altitude
+
+
+class EnergyEstimate:
+    """
+    Perkiraan energi per waypoint.
+
+    Atribut:
+        names     : list of str - nama waypoint
+        legs_wh   : array('d') - energi tiap leg termasuk hover (Wh)
+        used_wh   : array('d') - energi kumulatif sampai tiba di waypoint (Wh)
+        return_wh : array('d') - energi RTL dari waypoint itu (Wh)
+        total_wh  : float - energi seluruh rute tanpa pulang (Wh)
+    """
+
+    def __init__(self, names, legs_wh, used_wh, return_wh):
+        self.names = names
+        self.legs_wh = legs_wh
+        self.used_wh = used_wh
+        self.return_wh = return_wh
+        self.total_wh = used_wh[-1] if used_wh else 0.0
+
+    def __len__(self):
+        return len(self.legs_wh)
+
+    def peak_wh(self):
+        """Kebutuhan terbesar: energi sampai waypoint mana pun ditambah pulang darinya."""
+        return max((u + r for u, r in zip(self.used_wh, self.return_wh)), default=0.0)
+
+    def check(self, capacity_wh, reserve=0.2):
+        """
+        Memeriksa rute terhadap kapasitas baterai.
+
+        Parameter:
+            capacity_wh : float - kapasitas baterai (Wh)
+            reserve     : float - fraksi kapasitas yang tidak boleh dipakai (0-1)
+
+        Return:
+            list of str - pesan untuk setiap waypoint yang tidak bisa pulang
+            dengan cadangan utuh (kosong = rute aman)
+        """
+        usable = capacity_wh * (1.0 - reserve)
+        errors = []
+        for i, (name, used, back) in enumerate(zip(self.names, self.used_wh, self.return_wh), start=1):
+            if used + back > usable:
+                errors.append(f"WP{i} ({name}): butuh {used:.1f} Wh + pulang {back:.1f} Wh, "
+                              f"tersedia {usable:.1f} Wh (cadangan {reserve:.0%})")
+        return errors
+
+
+def estimate_energy(waypoints, home, model=None, frame=FRAME_PREVIOUS, targets=None):
+    """
+    Menghitung perkiraan energi per leg sebelum terbang.
+
+    Parameter:
+        waypoints : list of dict - format execute_waypoints()
+        home      : LocationGlobalRelative atau tuple (lat, lon, alt) - titik awal
+                    misi (setelah takeoff); juga titik tujuan RTL
+        model     : EnergyModel (default: EnergyModel())
+        frame     : str - frame default waypoint (lihat frames.py)
+        targets   : TargetTable - target yang sudah dihitung (misalnya plan.bind(home))
+
+    Return:
+        EnergyEstimate
+    """
+    model = model or EnergyModel()
+    if targets is None:
+        targets = resolve_targets(waypoints, home, frame)
+    if not isinstance(home, tuple):
+        home = (home.lat, home.lon, home.alt)
+    home_lat, home_lon = home[0], home[1]
+    ky, kx = meters_per_degree(home_lat)
+
+    legs_wh = array("d")
+    used_wh = array("d")
+    return_wh = array("d")
+    used = 0.0
+    x, y, z = 0.0, 0.0, home[2] or 0.0
+    for wp, (lat, lon, alt) in zip(waypoints, targets):
+        nx, ny = (lon - home_lon) * kx, (lat - home_lat) * ky
+        leg = model.leg_energy(math.hypot(nx - x, ny - y), alt - z, wp.get("hover", 0))
+        used += leg
+        legs_wh.append(leg)
+        used_wh.append(used)
+        return_wh.append(model.return_energy(math.hypot(nx, ny), alt))
+        x, y, z = nx, ny, alt
+    return EnergyEstimate(list(targets.names), legs_wh, used_wh, return_wh)
+
+
+def print_energy_report(estimate, capacity_wh=None, reserve=0.2):
+    """Mencetak perkiraan energi per leg dan hasil cek kapasitas (jika diisi)."""
+    print(f"[ENERGY] {len(estimate)} leg | rute {estimate.total_wh:.1f} Wh | "
+          f"puncak (rute + pulang) {estimate.peak_wh():.1f} Wh"
+          + (f" | baterai {capacity_wh:.0f} Wh, cadangan {reserve:.0%}" if capacity_wh else ""))
+    print(f"  {'#':>4} {'nama':<24} {'leg':>7} {'kumulatif':>10} {'pulang':>7}")
+    for i, (name, leg, used, back) in enumerate(
+            zip(estimate.names, estimate.legs_wh, estimate.used_wh, estimate.return_wh), start=1):
+        print(f"  {i:>4} {str(name)[:24]:<24} {leg:>6.2f} {used:>9.2f} {back:>7.2f}")
+    if capacity_wh:
+        errors = estimate.check(capacity_wh, reserve)
+        for error in errors:
+            print(f"[WARN] {error}")
+        if not errors:
+            print("[ENERGY] Rute aman: setiap waypoint bisa pulang dengan cadangan utuh")
+
+
+class BatteryMonitor:
+    """
+    Memantau sisa energi dan memicu RTL saat energi untuk pulang tidak cukup lagi.
+
+    Parameter:
+        vehicle     : objek Vehicle DroneKit
+        model       : EnergyModel
+        capacity_wh : float - kapasitas baterai penuh (Wh)
+        reserve     : float - fraksi kapasitas yang harus tersisa saat mendarat (0-1)
+        home        : LocationGlobalRelative atau tuple (lat, lon) - tujuan RTL
+                      (default: posisi saat start())
+        action      : str - mode saat energi tidak cukup, "RTL" atau "LAND"
+        on_abort    : fungsi (status dict) yang dipanggil di thread listener (opsional)
+        clock       : jam untuk integrasi arus dan stempel waktu (default: jam default)
+    """
+
+    def __init__(self, vehicle, model, capacity_wh, reserve=0.2, home=None, action="RTL",
+                 on_abort=None, clock=None):
+        if action not in ("RTL", "LAND"):
+            raise ValueError(f"action harus 'RTL' atau 'LAND', bukan {action!r}")
+        self.vehicle = vehicle
+        self.model = model
+        self.capacity_wh = capacity_wh
+        self.reserve_wh = capacity_wh * reserve
+        self.home = home
+        self.action = action
+        self.on_abort = on_abort
+        self.clock = get_clock(clock, vehicle)
+        self.latency = LatencyHistogram("energy.predict")
+        self.breached = threading.Event()
+        self.status = None
+        self.remaining_wh = capacity_wh
+        self.return_wh = 0.0
+        self.consumed_wh = 0.0
+        self._last_power = None  # (t, watt) dari pembacaan baterai sebelumnya
+        self._started = False
+
+    @property
+    def margin_wh(self):
+        """Sisa energi setelah pulang dan cadangan (Wh); negatif = harus pulang sekarang."""
+        return self.remaining_wh - self.return_wh - self.reserve_wh
+
+    def start(self):
+        if self._started:
+            return self
+        home = self.home if self.home is not None else self.vehicle.location.global_relative_frame
+        if not isinstance(home, tuple):
+            home = (home.lat, home.lon)
+        self._home_lat, self._home_lon = home[0], home[1]
+        self._ky, self._kx = meters_per_degree(home[0])
+        self._on_battery(self.vehicle, "battery", self.vehicle.battery)
+        self.vehicle.add_attribute_listener("battery", self._on_battery)
+        self.vehicle.location.add_attribute_listener("global_relative_frame", self._on_position)
+        self._started = True
+        return self
+
+    def stop(self):
+        if self._started:
+            self.vehicle.remove_attribute_listener("battery", self._on_battery)
+            self.vehicle.location.remove_attribute_listener("global_relative_frame", self._on_position)
+            self._started = False
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def raise_if_breached(self):
+        """Melempar EnergyAbort jika energi sudah dinyatakan tidak cukup."""
+        if self.breached.is_set():
+            raise EnergyAbort(self.status)
+
+    def _on_battery(self, _vehicle, _name, battery):
+        if battery is None:
+            return
+        now = self.clock.now()
+        voltage, current, level = battery.voltage, battery.current, battery.level
+        # Integrasi daya (trapesium) antar pembacaan SYS_STATUS
+        if voltage is not None and current is not None and current >= 0:
+            power = voltage * current
+            if self._last_power is not None:
+                t0, p0 = self._last_power
+                self.consumed_wh += (p0 + power) / 2.0 * (now - t0) / 3600.0
+            self._last_power = (now, power)
+        remaining = self.capacity_wh - self.consumed_wh
+        if level is not None and level >= 0:
+            remaining = min(remaining, self.capacity_wh * level / 100.0)
+        self.remaining_wh = remaining
+
+    def _on_position(self, _locations, _name, location):
+        if self.breached.is_set():
+            return
+        start = time.perf_counter_ns()
+        distance = math.hypot((location.lon - self._home_lon) * self._kx,
+                              (location.lat - self._home_lat) * self._ky)
+        self.return_wh = self.model.return_energy(distance, location.alt or 0.0)
+        abort = self.remaining_wh - self.return_wh < self.reserve_wh
+        self.latency.record_ns(time.perf_counter_ns() - start)
+        if abort and self.vehicle.mode.name not in ("RTL", "LAND"):
+            self._trigger(location, distance)
+
+    def _trigger(self, location, distance):
+        from dronekit import VehicleMode
+
+        self.status = {
+            "t": self.clock.now(),
+            "remaining_wh": self.remaining_wh,
+            "return_wh": self.return_wh,
+            "reserve_wh": self.reserve_wh,
+            "distance": distance,
+            "alt": location.alt,
+            "action": self.action,
+        }
+        # Sama seperti GeofenceMonitor: jangan menunggu konfirmasi mode di thread listener
+        self.vehicle.mode = VehicleMode(self.action)
+        self.breached.set()
+        print(f"[ENERGY] Sisa {self.remaining_wh:.1f} Wh, pulang dari {distance:.0f}m butuh "
+              f"{self.return_wh:.1f} Wh + cadangan {self.reserve_wh:.1f} Wh -> {self.action}")
+        if self.on_abort is not None:
+            self.on_abort(self.status)
@@ -0,0 +1,154 @@
+"""
+fleet.py
+--------
+Menjalankan misi di banyak vehicle (misalnya beberapa instance SITL) sekaligus.
+
+Setiap vehicle dijalankan oleh AsyncMissionExecutor di satu event loop yang
+sama. Karena deteksi tiba berbasis listener DroneKit, tidak ada thread
+busy-wait per vehicle selama terbang; thread hanya dipakai sebentar untuk
+langkah yang memang memblokir (connect, arm/takeoff, landing). Thread itu
+diambil dari pool berukuran jumlah vehicle, bukan pool default asyncio yang
+dibatasi jumlah CPU, sehingga connect armada besar tidak saling antre.
+
+Waktu per vehicle mengikuti jam vehicle tersebut (lihat clock.py): dengan
+alamat `sim`, setiap SimVehicle maju dengan SimClock-nya sendiri.
+
+Contoh:
+    runner = FleetRunner(takeoff_altitude=10)
+    reports = runner.run_sync([
+        ("tcp:127.0.0.1:5762", WAYPOINTS_A),
+        ("tcp:127.0.0.1:5772", WAYPOINTS_B),
+    ])
+    print_fleet_report(reports)
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from .async_executor import AsyncMissionExecutor
+from .clock import get_clock
+from .control import arm_and_takeoff, connect_vehicle, land
+
+
+class FleetTelemetry:
+    """
+    Penampung telemetri bersama untuk seluruh armada (thread-safe).
+
+    Setiap sampel disimpan sebagai tuple:
+        (waktu, vehicle_id, leg, lat, lon, alt)
+
+    `waktu` diambil dari jam vehicle (detik), `vehicle_id` adalah indeks
+    assignment di FleetRunner.run().
+    """
+
+    def __init__(self):
+        self.samples = []
+        self._lock = threading.Lock()
+
+    def record(self, t, vehicle_id, leg, location):
+        sample = (t, vehicle_id, leg, location.lat, location.lon, location.alt)
+        with self._lock:
+            self.samples.append(sample)
+
+    def monitor(self, vehicle_id, interval=1.0):
+        """Monitor AsyncMissionExecutor yang mencatat posisi vehicle ke sink ini."""
+        async def monitor(executor):
+            while True:
+                if executor.current_leg is not None:
+                    self.record(executor.clock.now(), vehicle_id, executor.current_leg,
+                                executor.vehicle.location.global_relative_frame)
+                await executor.sleep(interval)
+
+        return monitor
+
+
+class FleetRunner:
+    """
+    Menjalankan satu misi waypoint per vehicle secara paralel.
+
+    Parameter:
+        connect_fn       : fungsi (connection_string) -> Vehicle, default connect_vehicle
+        telemetry        : FleetTelemetry bersama (dibuat otomatis jika None)
+        takeoff_altitude : float - jika diisi, arm_and_takeoff dulu sebelum misi
+        land_after       : bool - LAND setelah misi selesai
+        leg_timeout      : float - timeout per leg (detik), diteruskan ke executor
+        sample_interval  : float - periode pencatatan telemetri (detik)
+    """
+
+    def __init__(self, connect_fn=connect_vehicle, telemetry=None, takeoff_altitude=None,
+                 land_after=False, leg_timeout=None, sample_interval=1.0):
+        self.connect_fn = connect_fn
+        self.telemetry = telemetry if telemetry is not None else FleetTelemetry()
+        self.takeoff_altitude = takeoff_altitude
+        self.land_after = land_after
+        self.leg_timeout = leg_timeout
+        self.sample_interval = sample_interval
+
+    async def run(self, assignments):
+        """
+        Parameter:
+            assignments : list of (connection_string, waypoints); alamat yang
+                          sama boleh muncul lebih dari sekali
+
+        Return:
+            list of dict - satu laporan per assignment, urutan sama:
+            {"index": int, "connection": str, "results": [...],
+             "error": str atau None, "duration": detik sejak terhubung}
+        """
+        if not assignments:
+            return []
+        with ThreadPoolExecutor(max_workers=len(assignments),
+                                thread_name_prefix="fleet") as pool:
+            tasks = [self._run_vehicle(pool, index, conn, waypoints)
+                     for index, (conn, waypoints) in enumerate(assignments)]
+            return list(await asyncio.gather(*tasks))
+
+    def run_sync(self, assignments):
+        """Shortcut run() dengan asyncio.run()."""
+        return asyncio.run(self.run(assignments))
+
+    async def _run_vehicle(self, pool, index, conn, waypoints):
+        loop = asyncio.get_running_loop()
+        report = {"index": index, "connection": conn, "results": [], "error": None, "duration": 0.0}
+        vehicle = None
+        clock = started = None
+        try:
+            vehicle = await loop.run_in_executor(pool, self.connect_fn, conn)
+            clock = get_clock(vehicle=vehicle)
+            started = clock.now()
+            print(f"[FLEET] #{index} {conn} terhubung")
+            if self.takeoff_altitude is not None:
+                await loop.run_in_executor(pool, partial(arm_and_takeoff, vehicle, self.takeoff_altitude,
+                                                         clock=clock))
+
+            executor = AsyncMissionExecutor(vehicle, waypoints, leg_timeout=self.leg_timeout, clock=clock,
+                                            thread_pool=pool)
+            report["results"] = await executor.run(
+                monitors=[self.telemetry.monitor(index, self.sample_interval)]
+            )
+            if executor.abort_reason is not None:
+                report["error"] = executor.abort_reason
+
+            if self.land_after:
+                await loop.run_in_executor(pool, partial(land, vehicle, clock=clock))
+        except Exception as exc:  # satu vehicle gagal tidak menghentikan armada
+            print(f"[FLEET] #{index} {conn} gagal: {exc!r}")
+            report["error"] = repr(exc)
+        finally:
+            if vehicle is not None:
+                vehicle.close()
+            if started is not None:
+                report["duration"] = clock.now() - started
+        return report
+
+
+def print_fleet_report(reports):
+    """Cetak ringkasan waktu per leg untuk setiap vehicle (hasil FleetRunner.run)."""
+    for vehicle_report in reports:
+        status = vehicle_report["error"] or "OK"
+        print(f"\n[#{vehicle_report['index']} {vehicle_report['connection']}] {status} | "
+              f"total {vehicle_report['duration']:.1f}s")
+        for leg in vehicle_report["results"]:
+            print(f"  {leg['name']:30s} {leg['status']:9s} {leg['duration']:7.2f}s")
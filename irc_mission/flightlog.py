@@ -0,0 +1,373 @@
+"""
+flightlog.py
+------------
+Format log penerbangan berukuran tetap yang bisa dibaca dengan np.memmap.
+
+Log telemetri panjang (misalnya survey ribuan leg) lambat dan boros memori
+jika dibaca sebagai teks. Di sini setiap sampel disimpan sebagai record biner
+berukuran tetap, sehingga analis bisa mengambil "leg 37 dari 5.000 leg" hanya
+dengan membaca halaman file yang dibutuhkan.
+
+Isi file `<nama>.flog`:
+    MAGIC (8 byte) | panjang header (uint32) | schema JSON, diisi spasi
+    sampai kelipatan HEADER_ALIGN | record RECORD_DTYPE berurutan
+
+Layout record sama persis dengan telemetry.RECORD, sehingga file dari
+TelemetryRecorder bisa dikonversi tanpa decode (lihat import_telemetry()).
+
+Sidecar `<nama>.flog.idx.npz` berisi:
+    time_index : nilai `t` setiap INDEX_STRIDE record (untuk cari berdasarkan waktu)
+    legs       : satu baris per rangkaian leg (leg, start, stop, t_start, t_end)
+    count      : jumlah record saat index dibuat
+Jika sidecar hilang (misalnya program terhenti) atau `count`-nya tidak cocok
+dengan isi log (log terpotong, atau ditimpa tanpa sempat close()), FlightLog
+membangunnya ulang.
+
+Modul ini membutuhkan NumPy dan tidak diimpor otomatis oleh `irc_mission`.
+
+Contoh:
+    with FlightLogWriter("survey.flog") as log:
+        execute_waypoints(vehicle, WAYPOINTS, telemetry=log)
+
+    with FlightLog("survey.flog") as log:
+        leg37 = log.leg(37)
+        print(leg37["alt"].mean())
+"""
+
+import contextlib
+import json
+import math
+import os
+import struct
+
+import numpy as np
+
+from .telemetry import MAGIC as TELEMETRY_MAGIC
+from .telemetry import MODE_NAMES, RECORD, mode_code
+
+MAGIC = b"IRCFLOG1"
+VERSION = 1
+HEADER_ALIGN = 64
+INDEX_STRIDE = 1024
+
+RECORD_DTYPE = np.dtype([
+    ("t", "<f8"),
+    ("leg", "<i4"),
+    ("mode", "u1"),
+    ("lat", "<f8"),
+    ("lon", "<f8"),
+    ("alt", "<f4"),
+    ("dist", "<f4"),
+])
+LEG_DTYPE = np.dtype([
+    ("leg", "<i4"),
+    ("start", "<i8"),
+    ("stop", "<i8"),
+    ("t_start", "<f8"),
+    ("t_end", "<f8"),
+])
+
+assert RECORD_DTYPE.itemsize == RECORD.size
+
+
+def index_path(path):
+    """Nama file sidecar index untuk log `path`."""
+    return f"{path}.idx.npz"
+
+
+def _encode_header(dtype):
+    schema = json.dumps({"version": VERSION, "fields": dtype.descr, "index_stride": INDEX_STRIDE})
+    body = schema.encode("utf-8")
+    size = len(MAGIC) + 4 + len(body)
+    size += -size % HEADER_ALIGN
+    return MAGIC + struct.pack("<I", size) + body.ljust(size - len(MAGIC) - 4)
+
+
+def read_header(path):
+    """
+    Membaca header log.
+
+    Return:
+        tuple (header_size, dtype, schema) - schema berupa dict dari JSON header
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} bukan file flight log irc_mission")
+        (size,) = struct.unpack("<I", f.read(4))
+        schema = json.loads(f.read(size - len(MAGIC) - 4).decode("utf-8"))
+    fields = [tuple(field) for field in schema["fields"]]
+    return size, np.dtype(fields), schema
+
+
+class FlightLogWriter:
+    """
+    Penulis log penerbangan dengan buffer chunk yang dialokasikan sekali.
+
+    append() hanya mengisi satu baris di array NumPy yang sudah ada (tanpa
+    membuat tuple, bytes, atau array baru per sampel). Saat chunk penuh,
+    isinya ditulis ke file dalam satu panggilan write(). Index waktu dan leg
+    diperbarui sambil jalan dan ditulis ke sidecar saat close().
+
+    Objek ini juga bisa dipakai langsung sebagai argumen `telemetry` helper
+    misi karena punya record() dan sample_interval.
+
+    Parameter:
+        path            : str - file log tujuan (ditimpa jika sudah ada)
+        chunk_size      : int - jumlah record per penulisan ke disk
+        sample_interval : float - jeda antar sampel yang diminta dari helper (detik)
+    """
+
+    def __init__(self, path, chunk_size=4096, sample_interval=0.2):
+        self.path = path
+        self.sample_interval = sample_interval
+        self.count = 0
+        self._chunk = np.zeros(chunk_size, dtype=RECORD_DTYPE)
+        (self._t, self._leg, self._mode, self._lat,
+         self._lon, self._alt, self._dist) = (self._chunk[name] for name in RECORD_DTYPE.names)
+        self._fill = 0
+        self._time_index = []
+        self._legs = []
+        self._run_leg = None
+        self._run_start = 0
+        self._run_t_start = 0.0
+        self._last_t = 0.0
+        # Sidecar lama milik log yang ditimpa tidak boleh dipakai jika penulisan terhenti
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(index_path(path))
+        self._file = open(path, "wb")
+        self._file.write(_encode_header(RECORD_DTYPE))
+
+    def append(self, t, leg, mode, lat, lon, alt, dist=math.nan):
+        """
+        Menambahkan satu record.
+
+        Parameter:
+            t        : float - waktu sampel (detik), harus tidak menurun
+            leg      : int - nomor leg
+            mode     : int - nomor mode (lihat telemetry.mode_code())
+            lat, lon : float - koordinat (derajat)
+            alt      : float - ketinggian relatif (meter)
+            dist     : float - jarak ke target (meter), NaN jika tidak ada
+        """
+        i = self._fill
+        self._t[i] = t
+        self._leg[i] = leg
+        self._mode[i] = mode
+        self._lat[i] = lat
+        self._lon[i] = lon
+        self._alt[i] = alt
+        self._dist[i] = dist
+
+        n = self.count
+        if n % INDEX_STRIDE == 0:
+            self._time_index.append(t)
+        if leg != self._run_leg:
+            self._close_run(n)
+            self._run_leg, self._run_start, self._run_t_start = leg, n, t
+        self._last_t = t
+        self.count = n + 1
+        self._fill = i + 1
+        if self._fill == len(self._chunk):
+            self._write_chunk()
+
+    def record(self, t, leg, mode, location, dist=math.nan):
+        """Antarmuka perekam telemetri (lihat telemetry.py)."""
+        self.append(t, leg, mode_code(mode), location.lat, location.lon, location.alt, dist)
+
+    def close(self):
+        """Menulis sisa chunk, menutup file, dan menyimpan sidecar index."""
+        if self._file is None:
+            return
+        self._write_chunk()
+        self._file.close()
+        self._file = None
+        self._close_run(self.count)
+        _save_index(self.path, np.array(self._time_index, dtype="<f8"),
+                    np.array(self._legs, dtype=LEG_DTYPE), self.count)
+
+    def _close_run(self, stop):
+        if self._run_leg is not None:
+            self._legs.append((self._run_leg, self._run_start, stop, self._run_t_start, self._last_t))
+            self._run_leg = None
+
+    def _write_chunk(self):
+        if self._fill:
+            self._file.write(memoryview(self._chunk[:self._fill]).cast("B"))
+            self._fill = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _save_index(path, time_index, legs, count):
+    with open(index_path(path), "wb") as f:
+        np.savez(f, stride=np.array(INDEX_STRIDE), time_index=time_index, legs=legs,
+                 count=np.array(count))
+
+
+def _open_records(path):
+    header_size, dtype, _schema = read_header(path)
+    count = (os.path.getsize(path) - header_size) // dtype.itemsize
+    if count == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=header_size, shape=(count,))
+
+
+def build_index(path, block=1 << 20, save=True):
+    """
+    Membangun ulang index dari isi log, dibaca per blok agar memori tetap kecil.
+
+    Parameter:
+        path  : str - file log
+        block : int - jumlah record per blok baca
+        save  : bool - simpan hasilnya ke sidecar
+
+    Return:
+        tuple (time_index, legs)
+    """
+    records = _open_records(path)
+    count = len(records)
+    time_index = np.array(records["t"][::INDEX_STRIDE], dtype="<f8")
+
+    boundaries = []
+    previous = None
+    for start in range(0, count, block):
+        leg = np.asarray(records["leg"][start:start + block])
+        if previous is not None and leg[0] != previous:
+            boundaries.append(start)
+        boundaries.extend((np.flatnonzero(leg[1:] != leg[:-1]) + 1 + start).tolist())
+        previous = leg[-1]
+
+    legs = np.zeros(len(boundaries) + 1 if count else 0, dtype=LEG_DTYPE)
+    if count:
+        starts = np.array([0] + boundaries, dtype="<i8")
+        stops = np.array(boundaries + [count], dtype="<i8")
+        legs["leg"] = records["leg"][starts]
+        legs["start"] = starts
+        legs["stop"] = stops
+        legs["t_start"] = records["t"][starts]
+        legs["t_end"] = records["t"][stops - 1]
+
+    if save:
+        _save_index(path, time_index, legs, count)
+    return time_index, legs
+
+
+class FlightLog:
+    """
+    Pembaca log penerbangan berbasis np.memmap.
+
+    Tidak ada data yang dibaca saat membuka file selain header dan sidecar
+    index. Slice yang dikembalikan adalah view memmap, jadi hanya halaman
+    yang benar-benar disentuh yang dibaca dari disk.
+
+    Parameter:
+        path : str - file log
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.records = _open_records(path)
+        try:
+            with np.load(index_path(path)) as index:
+                if int(index["count"]) != len(self.records):
+                    raise ValueError("index tidak cocok dengan isi log")
+                self.time_index = index["time_index"]
+                self.legs = index["legs"]
+        except (OSError, KeyError, ValueError):
+            try:
+                self.time_index, self.legs = build_index(path)
+            except OSError:
+                self.time_index, self.legs = build_index(path, save=False)
+
+    def __len__(self):
+        return len(self.records)
+
+    def leg_numbers(self):
+        """Daftar nomor leg unik yang ada di log (terurut)."""
+        return np.unique(self.legs["leg"])
+
+    def leg(self, number):
+        """
+        Semua record milik leg `number`.
+
+        Return:
+            array RECORD_DTYPE - view memmap jika leg hanya punya satu rangkaian,
+            salinan gabungan jika leg muncul lebih dari sekali
+        """
+        runs = self.legs[self.legs["leg"] == number]
+        if len(runs) == 1:
+            return self.records[runs["start"][0]:runs["stop"][0]]
+        return np.concatenate([self.records[start:stop]
+                               for start, stop in zip(runs["start"], runs["stop"])]
+                              or [self.records[:0]])
+
+    def time_slice(self, t_start, t_end):
+        """
+        Record dengan t_start <= t < t_end, dicari lewat time_index.
+
+        Return:
+            array RECORD_DTYPE - view memmap
+        """
+        return self.records[self._locate(t_start):self._locate(t_end)]
+
+    def mode_names(self, records):
+        """Mengubah kolom `mode` sekumpulan record menjadi list nama mode."""
+        return [MODE_NAMES.get(code, "UNKNOWN") for code in records["mode"].tolist()]
+
+    def close(self):
+        """Melepas memmap."""
+        mm = getattr(self.records, "_mmap", None)
+        self.records = self.records[:0].copy()
+        if mm is not None:
+            mm.close()
+
+    def _locate(self, t):
+        # Cari blok lewat index jarang, lalu binary search di dalam satu blok saja
+        block = max(int(np.searchsorted(self.time_index, t, side="left")) - 1, 0)
+        start = block * INDEX_STRIDE
+        stop = min(start + 2 * INDEX_STRIDE, len(self.records))
+        window = np.asarray(self.records["t"][start:stop])
+        return start + int(np.searchsorted(window, t, side="left"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def import_telemetry(source, destination, block=1 << 16):
+    """
+    Mengonversi file TelemetryRecorder menjadi flight log beserta index-nya.
+
+    Layout record keduanya sama, jadi isi file disalin per blok tanpa decode.
+
+    Parameter:
+        source      : str - file telemetri (telemetry.py)
+        destination : str - file flight log tujuan
+        block       : int - jumlah record per blok salin
+
+    Return:
+        int - jumlah record yang disalin
+    """
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        if src.read(len(TELEMETRY_MAGIC)) != TELEMETRY_MAGIC:
+            raise ValueError(f"{source} bukan file telemetri irc_mission")
+        (size,) = struct.unpack("<H", src.read(2))
+        if src.read(size).decode("ascii") != RECORD.format:
+            raise ValueError(f"{source} memakai format record yang tidak dikenal")
+        dst.write(_encode_header(RECORD_DTYPE))
+        copied = 0
+        while True:
+            chunk = src.read(RECORD.size * block)
+            chunk = chunk[:len(chunk) - len(chunk) % RECORD.size]
+            if not chunk:
+                break
+            dst.write(chunk)
+            copied += len(chunk) // RECORD.size
+    build_index(destination)
+    return copied
@@ -0,0 +1,137 @@
+"""
+frames.py
+---------
+Frame koordinat waypoint dan prakomputasi target absolut.
+
+Frame yang didukung:
+    relative-to-previous : d_north/d_east dari TARGET waypoint sebelumnya
+                           (waypoint pertama dari titik awal misi)
+    relative-to-home     : d_north/d_east dari titik home/launch
+    absolute             : key `lat`, `lon` (derajat) dan `altitude` (meter, relatif home)
+
+Semua target dihitung sekali di awal misi ke dalam satu array ringkas
+(TargetTable), jadi tidak ada get_offset_location() per leg dan offset tidak
+lagi ikut bergeser oleh posisi drone saat tiba (yang selalu meleset hingga
+sejauh threshold). Kesalahan (key hilang, frame tidak dikenal, koordinat di
+luar rentang) juga ketahuan sebelum takeoff.
+
+Frame bisa dipilih untuk seluruh rute atau per waypoint lewat key `frame`.
+
+Contoh:
+    targets = resolve_targets(WAYPOINTS, vehicle.location.global_relative_frame,
+                              frame=FRAME_HOME)
+    execute_waypoints(vehicle, WAYPOINTS, targets=targets)
+"""
+
+import math
+from array import array
+
+from .distance import offset_degrees
+
+FRAME_PREVIOUS = "relative-to-previous"
+FRAME_HOME = "relative-to-home"
+FRAME_ABSOLUTE = "absolute"
+FRAMES = (FRAME_PREVIOUS, FRAME_HOME, FRAME_ABSOLUTE)
+
+
+class TargetTable:
+    """
+    Target absolut semua waypoint dalam satu array('d') berisi lat, lon, alt berurutan.
+
+    Parameter:
+        coords : array('d') - [lat0, lon0, alt0, lat1, lon1, alt1, ...]
+        names  : list of str - nama waypoint untuk log
+        home   : tuple (lat, lon, alt) - titik acuan saat target dihitung
+    """
+
+    __slots__ = ("coords", "names", "home")
+
+    def __init__(self, coords, names, home):
+        self.coords = coords
+        self.names = names
+        self.home = home
+
+    def __len__(self):
+        return len(self.coords) // 3
+
+    def __getitem__(self, i):
+        """Tuple (lat, lon, alt) target ke-i (mulai 0)."""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return tuple(self.coords[3 * i:3 * i + 3])
+
+    def __iter__(self):
+        coords = self.coords
+        for k in range(0, len(coords), 3):
+            yield coords[k], coords[k + 1], coords[k + 2]
+
+    def location(self, i):
+        """Target ke-i sebagai LocationGlobalRelative (untuk simple_goto)."""
+        from dronekit import LocationGlobalRelative
+
+        return LocationGlobalRelative(*self[i])
+
+
+def _number(wp, key, label):
+    if key not in wp:
+        raise ValueError(f"{label}: key '{key}' wajib ada")
+    value = wp[key]
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ValueError(f"{label}: '{key}' harus angka, bukan {value!r}")
+    return float(value)
+
+
+def resolve_targets(waypoints, home, frame=FRAME_PREVIOUS):
+    """
+    Menghitung target absolut semua waypoint sekaligus.
+
+    Parameter:
+        waypoints : iterable of dict - format execute_waypoints(), boleh berisi key
+                    `frame`; dibaca sekali secara berurutan (boleh generator)
+        home      : LocationGlobalRelative atau tuple (lat, lon, alt) - titik awal
+                    misi / launch
+        frame     : str - frame default untuk waypoint tanpa key `frame`
+
+    Return:
+        TargetTable
+
+    Raises:
+        ValueError - frame tidak dikenal, key wajib hilang, atau koordinat tidak valid
+    """
+    if frame not in FRAMES:
+        raise ValueError(f"Frame tidak dikenal: {frame!r} (pilih salah satu dari {FRAMES})")
+    if not isinstance(home, tuple):
+        home = (home.lat, home.lon, home.alt)
+    home_lat, home_lon = home[0], home[1]
+
+    coords = array("d")
+    names = []
+    lat, lon = home_lat, home_lon
+    for i, wp in enumerate(waypoints):
+        label = wp.get("name", f"WP{i + 1}")
+        wp_frame = wp.get("frame", frame)
+        altitude = _number(wp, "altitude", label)
+
+        if wp_frame == FRAME_ABSOLUTE:
+            lat = _number(wp, "lat", label)
+            lon = _number(wp, "lon", label)
+        elif wp_frame in (FRAME_PREVIOUS, FRAME_HOME):
+            d_north = _number(wp, "d_north", label)
+            d_east = _number(wp, "d_east", label)
+            if wp_frame == FRAME_HOME:
+                lat, lon = home_lat, home_lon
+            # Rumus yang sama dengan get_offset_location(), tanpa membuat objek dronekit
+            d_lat, d_lon = offset_degrees(lat, d_north, d_east)
+            lat += d_lat
+            lon += d_lon
+        else:
+            raise ValueError(f"{label}: frame tidak dikenal {wp_frame!r}")
+
+        if not (-90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0):
+            raise ValueError(f"{label}: koordinat di luar rentang (lat={lat:.6f}, lon={lon:.6f})")
+        coords.extend((lat, lon, altitude))
+        names.append(label)
+
+    return TargetTable(coords, names, tuple(home))
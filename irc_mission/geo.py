@@ -0,0 +1,56 @@
+"""
+geo.py
+------
+Konversi offset meter ke koordinat GPS dan perhitungan jarak antar titik.
+
+`dronekit` baru diimpor saat get_offset_location() dipanggil, sehingga modul
+ini bisa dipakai tanpa koneksi ke vehicle (misalnya untuk dry-run).
+Versi array (NumPy) untuk banyak titik sekaligus ada di geodesy.py.
+"""
+
+import math
+
+from .distance import METERS_PER_DEGREE, equirectangular_distance, offset_degrees
+
+
+def get_offset_location(original, d_north, d_east, alt):
+    """
+    Menghitung koordinat GPS baru berdasarkan offset meter dari posisi asal.
+
+    Memakai model ellipsoid yang sama dengan get_distance(), jadi jarak dari
+    posisi asal ke hasilnya sama dengan panjang offset.
+
+    Parameter:
+        original : LocationGlobalRelative - posisi asal
+        d_north  : float - offset ke utara (meter), negatif = selatan
+        d_east   : float - offset ke timur (meter), negatif = barat
+        alt      : float - ketinggian target (meter)
+
+    Return:
+        LocationGlobalRelative - koordinat target
+    """
+    from dronekit import LocationGlobalRelative
+
+    d_lat, d_lon = offset_degrees(original.lat, d_north, d_east)
+    return LocationGlobalRelative(
+        original.lat + d_lat,
+        original.lon + d_lon,
+        alt
+    )
+
+
+def get_distance(loc1, loc2):
+    """
+    Hitung jarak meter (2D) antara dua titik GPS.
+
+    Memakai model equirectangular dengan koreksi cos(lintang); model lain
+    (haversine, ecef) tersedia di distance.py.
+    """
+    return equirectangular_distance(loc1, loc2)
+
+
+def get_distance_flat(loc1, loc2):
+    """Rumus lama tanpa koreksi cos(lintang), hanya untuk perbandingan."""
+    d_lat = loc2.lat - loc1.lat
+    d_lon = loc2.lon - loc1.lon
+    return math.sqrt(d_lat ** 2 + d_lon ** 2) * METERS_PER_DEGREE
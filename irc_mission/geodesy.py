@@ -0,0 +1,167 @@
+"""
+geodesy.py
+----------
+Versi vektor (NumPy) dari get_offset_location() dan get_distance().
+
+Fungsi di geo.py bekerja untuk satu titik per pemanggilan. Untuk rute survey
+berisi ribuan titik atau replay log telemetri, modul ini menghitung target,
+panjang leg, jarak kumulatif, dan bearing dalam satu kali proses array.
+Modelnya sama dengan versi skalar di geo.py (skala WGS84 dari
+meters_per_degree() di lintang tengah). offset_locations() dan distances()
+memberi hasil yang sama per elemen sampai pembulatan floating point;
+chain_offsets() memperkirakan lintang awal tiap leg sekaligus, jadi berbeda
+dari rantai get_offset_location() kurang dari 1 mm untuk rute lokal.
+
+Modul ini membutuhkan NumPy (`pip install numpy`) dan tidak diimpor otomatis
+oleh `irc_mission`, jadi skrip misi biasa tetap jalan tanpa NumPy.
+
+Contoh:
+    lat, lon, alt = chain_offsets(home.lat, home.lon, d_north, d_east, altitude)
+    legs = leg_lengths(lat, lon)
+"""
+
+import numpy as np
+
+from .distance import WGS84_A, WGS84_E2
+# Versi skalar dengan signature lama tetap tersedia dari modul ini
+from .geo import get_distance, get_offset_location  # noqa: F401
+
+
+def offset_locations(lat, lon, alt, d_north, d_east, d_down=0.0):
+    """
+    Menggeser banyak titik sekaligus dengan offset NED (meter).
+
+    Semua argumen boleh berupa skalar atau array dengan shape yang bisa di-broadcast.
+
+    Parameter:
+        lat, lon : array - koordinat asal (derajat)
+        alt      : array - ketinggian asal (meter)
+        d_north  : array - offset ke utara (meter), negatif = selatan
+        d_east   : array - offset ke timur (meter), negatif = barat
+        d_down   : array - offset ke bawah (meter), negatif = naik
+
+    Return:
+        tuple (lat, lon, alt) - array koordinat target
+    """
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    d_lat, d_lon = offset_degrees(lat, d_north, d_east)
+    new_lat = lat + d_lat
+    new_lon = lon + d_lon
+    new_alt = np.asarray(alt, dtype=float) - np.asarray(d_down, dtype=float)
+    return new_lat, new_lon, new_alt
+
+
+def chain_offsets(lat0, lon0, d_north, d_east, altitude):
+    """
+    Menghitung target berurutan dari offset yang relatif terhadap titik sebelumnya.
+
+    Hasilnya sama dengan memanggil get_offset_location() satu per satu seperti
+    di execute_waypoints(), dengan asumsi drone tepat tiba di setiap target.
+
+    Parameter:
+        lat0, lon0 : float - posisi awal (derajat)
+        d_north    : array (N,) - offset utara tiap leg (meter)
+        d_east     : array (N,) - offset timur tiap leg (meter)
+        altitude   : array (N,) - ketinggian target tiap leg (meter)
+
+    Return:
+        tuple (lat, lon, alt) - array (N,) koordinat target
+    """
+    d_north = np.asarray(d_north, dtype=float)
+    d_east = np.asarray(d_east, dtype=float)
+
+    # Lintang awal tiap leg diperkirakan dulu dengan skala di lat0, lalu skala
+    # per leg dihitung di lintang awal itu; selisihnya dengan rantai skalar
+    # jauh di bawah 1 mm untuk rute lokal
+    start_lat = lat0 + np.concatenate(([0.0], np.cumsum(d_north)[:-1])) / meters_per_degree(lat0)[0]
+    d_lat, d_lon = offset_degrees(start_lat, d_north, d_east)
+    lat = lat0 + np.cumsum(d_lat)
+    lon = lon0 + np.cumsum(d_lon)
+    alt = np.broadcast_to(np.asarray(altitude, dtype=float), lat.shape).copy()
+    return lat, lon, alt
+
+
+def meters_per_degree(lat):
+    """Versi array dari distance.meters_per_degree()."""
+    phi = np.radians(np.asarray(lat, dtype=float))
+    w = 1 - WGS84_E2 * np.sin(phi) ** 2
+    rad = np.pi / 180
+    return WGS84_A * (1 - WGS84_E2) / (w * np.sqrt(w)) * rad, WGS84_A / np.sqrt(w) * np.cos(phi) * rad
+
+
+def offset_degrees(lat, d_north, d_east):
+    """Versi array dari distance.offset_degrees()."""
+    lat = np.asarray(lat, dtype=float)
+    d_north = np.asarray(d_north, dtype=float)
+    d_lat = d_north / meters_per_degree(lat)[0]
+    d_lat = d_north / meters_per_degree(lat + d_lat / 2)[0]
+    return d_lat, np.asarray(d_east, dtype=float) / meters_per_degree(lat + d_lat / 2)[1]
+
+
+def distances(lat1, lon1, lat2, lon2):
+    """
+    Jarak meter antar pasangan titik, versi array dari get_distance()
+    (equirectangular di lintang rata-rata tiap pasangan).
+
+    Return:
+        array - jarak dalam meter
+    """
+    lat1 = np.asarray(lat1, dtype=float)
+    lat2 = np.asarray(lat2, dtype=float)
+    k_lat, k_lon = meters_per_degree((lat1 + lat2) / 2)
+    d_lon = np.asarray(lon2, dtype=float) - np.asarray(lon1, dtype=float)
+    return np.hypot((lat2 - lat1) * k_lat, d_lon * k_lon)
+
+
+def leg_lengths(lat, lon):
+    """
+    Panjang setiap leg pada rute berurutan.
+
+    Return:
+        array (N-1,) - jarak titik i ke titik i+1 (meter)
+    """
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    return distances(lat[:-1], lon[:-1], lat[1:], lon[1:])
+
+
+def cumulative_distances(lat, lon):
+    """
+    Jarak tempuh kumulatif dari titik pertama.
+
+    Return:
+        array (N,) - elemen pertama 0, elemen terakhir total panjang rute (meter)
+    """
+    return np.concatenate(([0.0], np.cumsum(leg_lengths(lat, lon))))
+
+
+def bearings(lat, lon):
+    """
+    Bearing awal (derajat, 0 = utara, searah jarum jam) setiap leg.
+
+    Return:
+        array (N-1,) - bearing dalam rentang [0, 360)
+    """
+    phi = np.radians(np.asarray(lat, dtype=float))
+    lam = np.radians(np.asarray(lon, dtype=float))
+    d_lam = lam[1:] - lam[:-1]
+    y = np.sin(d_lam) * np.cos(phi[1:])
+    x = np.cos(phi[:-1]) * np.sin(phi[1:]) - np.sin(phi[:-1]) * np.cos(phi[1:]) * np.cos(d_lam)
+    return np.degrees(np.arctan2(y, x)) % 360.0
+
+
+def waypoints_to_arrays(waypoints):
+    """
+    Mengubah daftar waypoint dict (format execute_waypoints) menjadi array.
+
+    Return:
+        tuple (d_north, d_east, altitude, hover) - array (N,)
+    """
+    count = len(waypoints)
+    d_north = np.fromiter((wp["d_north"] for wp in waypoints), dtype=float, count=count)
+    d_east = np.fromiter((wp["d_east"] for wp in waypoints), dtype=float, count=count)
+    altitude = np.fromiter((wp["altitude"] for wp in waypoints), dtype=float, count=count)
+    hover = np.fromiter((wp.get("hover", 0) for wp in waypoints), dtype=float, count=count)
+    return d_north, d_east, altitude, hover
+
@@ -0,0 +1,366 @@
+"""
+geofence.py
+-----------
+Geofence dengan poligon inklusi/eksklusi dan batas ketinggian, diperiksa di
+setiap update posisi.
+
+Geofence menyiapkan dua index saat dibuat:
+
+    - grid seragam: setiap sel menyimpan fence yang bounding box-nya
+      menyentuh sel itu, jadi satu posisi hanya diuji terhadap beberapa
+      fence terdekat walaupun ada ratusan fence. Fence yang bounding box-nya
+      melebihi MAX_FENCE_CELLS sel (misalnya inklusi besar yang menutupi
+      seluruh area) tidak dimasukkan ke grid, tapi disimpan di daftar
+      terpisah yang diuji langsung pada setiap posisi
+    - slab per fence: verteks diurutkan per lintang, setiap slab menyimpan
+      sisi yang melintasinya. Uji titik-dalam-poligon = bisect slab (O(log n))
+      lalu ray casting hanya pada sisi di slab itu
+
+Aturan:
+    - di dalam fence eksklusi (dan di antara floor/ceiling fence itu) = pelanggaran
+    - jika ada fence inklusi, posisi harus di dalam salah satunya (dan di
+      antara floor/ceiling-nya)
+    - ketinggian di atas `ceiling` global = pelanggaran; di bawah `floor`
+      global hanya diperiksa setelah drone pernah melewati floor, dan tidak
+      saat LAND/RTL
+
+GeofenceMonitor mendaftarkan listener pada posisi vehicle (stream yang sama
+dengan ArrivalWatcher di goto). Saat pelanggaran pertama, mode langsung
+diganti ke RTL atau LOITER dari thread listener, lalu goto()/hover yang
+sedang menunggu dihentikan dengan GeofenceBreach. Waktu setiap pengecekan
+dicatat di histogram latensi.
+
+Contoh:
+    fence = Geofence([
+        Fence.from_local(home, [(-50, -50), (-50, 150), (150, 150), (150, -50)], name="lapangan"),
+        Fence.from_local(home, [(40, 40), (40, 60), (60, 60), (60, 40)], kind=EXCLUDE, name="tiang"),
+    ], ceiling=60)
+    with GeofenceMonitor(vehicle, fence, action="RTL") as monitor:
+        execute_waypoints(vehicle, WAYPOINTS, geofence=monitor)
+    print(monitor.latency.format())
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_right
+
+from .distance import meters_per_degree, offset_degrees
+from .metrics import LatencyHistogram
+
+INCLUDE = "include"
+EXCLUDE = "exclude"
+
+# Batas jumlah sel grid per fence; fence yang lebih besar diuji langsung
+MAX_FENCE_CELLS = 64
+
+
+class GeofenceBreach(RuntimeError):
+    """Misi dihentikan karena pelanggaran geofence. `breach` berisi detailnya."""
+
+    def __init__(self, breach):
+        super().__init__(f"Pelanggaran geofence: {breach['reason']}"
+                         + (f" ({breach['fence']})" if breach.get("fence") else ""))
+        self.breach = breach
+
+
+class Fence:
+    """
+    Satu poligon geofence.
+
+    Parameter:
+        vertices : list of (lat, lon) - verteks poligon (derajat)
+        kind     : str - INCLUDE (area boleh) atau EXCLUDE (area terlarang)
+        name     : str - nama untuk log
+        floor    : float - batas bawah ketinggian berlakunya fence (meter), None = tanpa batas
+        ceiling  : float - batas atas ketinggian berlakunya fence (meter), None = tanpa batas
+    """
+
+    def __init__(self, vertices, kind=INCLUDE, name=None, floor=None, ceiling=None):
+        if kind not in (INCLUDE, EXCLUDE):
+            raise ValueError(f"kind harus {INCLUDE!r} atau {EXCLUDE!r}, bukan {kind!r}")
+        vertices = [(float(lat), float(lon)) for lat, lon in vertices]
+        if len(vertices) > 3 and vertices[0] == vertices[-1]:
+            vertices = vertices[:-1]
+        if len(vertices) < 3:
+            raise ValueError("Fence butuh minimal 3 verteks")
+        self.vertices = vertices
+        self.kind = kind
+        self.name = name or kind
+        self.floor = -math.inf if floor is None else floor
+        self.ceiling = math.inf if ceiling is None else ceiling
+
+    @classmethod
+    def from_local(cls, home, points, **kwargs):
+        """
+        Fence dari titik lokal (north, east) dalam meter relatif terhadap `home`.
+
+        Parameter:
+            home   : LocationGlobalRelative atau tuple (lat, lon[, alt])
+            points : list of (north, east)
+        """
+        if not isinstance(home, tuple):
+            home = (home.lat, home.lon)
+        vertices = []
+        for north, east in points:
+            d_lat, d_lon = offset_degrees(home[0], north, east)
+            vertices.append((home[0] + d_lat, home[1] + d_lon))
+        return cls(vertices, **kwargs)
+
+    def altitude_applies(self, alt):
+        return self.floor <= alt <= self.ceiling
+
+
+class _PreparedFence:
+    """Fence dalam koordinat lokal (meter) beserta index slab-nya."""
+
+    __slots__ = ("fence", "bbox", "ys", "slabs")
+
+    def __init__(self, fence, points):
+        self.fence = fence
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        self.bbox = (min(xs), min(ys), max(xs), max(ys))
+        self.ys = sorted(set(ys))
+        # Sisi sebagai (y_min, y_max, x di y_min, dx/dy); sisi horizontal diabaikan
+        edges = []
+        for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]):
+            if y1 == y2:
+                continue
+            if y1 > y2:
+                x1, y1, x2, y2 = x2, y2, x1, y1
+            edges.append((y1, y2, x1, (x2 - x1) / (y2 - y1)))
+        # Slab i = [ys[i], ys[i+1]); berisi sisi yang melintasinya penuh
+        self.slabs = []
+        for lo, hi in zip(self.ys, self.ys[1:]):
+            self.slabs.append(tuple((y1, x1, slope) for y1, y2, x1, slope in edges
+                                    if y1 <= lo and y2 >= hi))
+
+    def contains(self, x, y):
+        x_min, y_min, x_max, y_max = self.bbox
+        if x < x_min or x > x_max or y < y_min or y >= y_max:
+            return False
+        i = bisect_right(self.ys, y) - 1
+        inside = False
+        for y1, x1, slope in self.slabs[i]:
+            if x1 + (y - y1) * slope > x:
+                inside = not inside
+        return inside
+
+
+class Geofence:
+    """
+    Kumpulan fence dengan spatial index grid.
+
+    Parameter:
+        fences    : list of Fence
+        ceiling   : float - ketinggian maksimum global (meter), None = tanpa batas
+        floor     : float - ketinggian minimum global (meter) setelah drone di udara
+        cell_size : float - ukuran sel grid (meter), None = otomatis
+    """
+
+    def __init__(self, fences, ceiling=None, floor=None, cell_size=None):
+        self.fences = list(fences)
+        self.ceiling = ceiling
+        self.floor = floor
+        self.has_inclusion = any(f.kind == INCLUDE for f in self.fences)
+
+        if self.fences:
+            self.ref_lat, self.ref_lon = self.fences[0].vertices[0]
+        else:
+            self.ref_lat = self.ref_lon = 0.0
+        self._ky, self._kx = meters_per_degree(self.ref_lat)
+
+        self._prepared = [_PreparedFence(f, [self._project(lat, lon) for lat, lon in f.vertices])
+                          for f in self.fences]
+
+        if cell_size is None:
+            if self._prepared:
+                # Median ukuran bounding box: sel seukuran fence tipikal, tidak
+                # terseret satu fence inklusi besar yang menutupi seluruh area
+                spans = sorted(max(p.bbox[2] - p.bbox[0], p.bbox[3] - p.bbox[1]) for p in self._prepared)
+                cell_size = spans[len(spans) // 2]
+            else:
+                cell_size = 1000.0
+        self.cell_size = max(cell_size, 1.0)
+
+        self._cells = {}
+        direct = []
+        for prepared in self._prepared:
+            x_min, y_min, x_max, y_max = prepared.bbox
+            columns = self._cell(x_max) - self._cell(x_min) + 1
+            rows = self._cell(y_max) - self._cell(y_min) + 1
+            if columns * rows > MAX_FENCE_CELLS:
+                direct.append(prepared)
+                continue
+            for cx in range(self._cell(x_min), self._cell(x_max) + 1):
+                for cy in range(self._cell(y_min), self._cell(y_max) + 1):
+                    self._cells.setdefault((cx, cy), []).append(prepared)
+        # Urutan per sel: eksklusi dulu agar pelanggaran ditemukan secepatnya
+        for key, cell in self._cells.items():
+            self._cells[key] = tuple(sorted(cell, key=lambda p: p.fence.kind != EXCLUDE))
+        self._direct = tuple(sorted(direct, key=lambda p: p.fence.kind != EXCLUDE))
+
+    def _project(self, lat, lon):
+        return (lon - self.ref_lon) * self._kx, (lat - self.ref_lat) * self._ky
+
+    def _cell(self, value):
+        return int(math.floor(value / self.cell_size))
+
+    def check(self, lat, lon, alt, check_floor=True):
+        """
+        Memeriksa satu posisi.
+
+        Parameter:
+            lat, lon    : float - posisi (derajat)
+            alt         : float - ketinggian relatif home (meter)
+            check_floor : bool - periksa floor global
+
+        Return:
+            None jika aman, atau tuple (reason, nama_fence) -
+            reason salah satu "ceiling", "floor", "exclusion", "outside"
+        """
+        if self.ceiling is not None and alt > self.ceiling:
+            return "ceiling", None
+        if check_floor and self.floor is not None and alt < self.floor:
+            return "floor", None
+
+        x, y = self._project(lat, lon)
+        candidates = self._cells.get((self._cell(x), self._cell(y)), ())
+        included = False
+        for prepared in candidates + self._direct:
+            fence = prepared.fence
+            if fence.kind == INCLUDE and included:
+                continue
+            if not fence.altitude_applies(alt) or not prepared.contains(x, y):
+                continue
+            if fence.kind == EXCLUDE:
+                return "exclusion", fence.name
+            included = True
+        if self.has_inclusion and not included:
+            return "outside", None
+        return None
+
+    def check_route(self, targets, start=None, step=5.0):
+        """
+        Memeriksa rute sebelum terbang: setiap target dan titik di sepanjang leg.
+
+        Parameter:
+            targets : iterable of (lat, lon, alt) - misalnya TargetTable
+            start   : tuple (lat, lon, alt) - titik awal leg pertama (opsional)
+            step    : float - jarak antar titik uji di sepanjang leg (meter)
+
+        Return:
+            list of dict - leg (1..N), lat, lon, alt, reason, fence
+        """
+        violations = []
+        previous = start
+        for leg, target in enumerate(targets, start=1):
+            if previous is None:
+                samples = [target]
+            else:
+                x1, y1 = self._project(previous[0], previous[1])
+                x2, y2 = self._project(target[0], target[1])
+                n = max(1, int(math.hypot(x2 - x1, y2 - y1) / step))
+                samples = [tuple(a + (b - a) * k / n for a, b in zip(previous, target))
+                           for k in range(1, n + 1)]
+            for lat, lon, alt in samples:
+                result = self.check(lat, lon, alt, check_floor=False)
+                if result is not None:
+                    violations.append({"leg": leg, "lat": lat, "lon": lon, "alt": alt,
+                                       "reason": result[0], "fence": result[1]})
+                    break
+            previous = target
+        return violations
+
+
+class GeofenceMonitor:
+    """
+    Memeriksa geofence di setiap update posisi vehicle dan bereaksi saat dilanggar.
+
+    Parameter:
+        vehicle   : objek Vehicle DroneKit
+        geofence  : Geofence
+        action    : str - mode saat pelanggaran, "RTL" atau "LOITER"
+        on_breach : fungsi (breach dict) yang dipanggil di thread listener (opsional)
+        clock     : jam untuk stempel waktu pelanggaran (default: jam default)
+    """
+
+    def __init__(self, vehicle, geofence, action="RTL", on_breach=None, clock=None):
+        if action not in ("RTL", "LOITER"):
+            raise ValueError(f"action harus 'RTL' atau 'LOITER', bukan {action!r}")
+        self.vehicle = vehicle
+        self.geofence = geofence
+        self.action = action
+        self.on_breach = on_breach
+        self.clock = clock
+        self.latency = LatencyHistogram("geofence.check")
+        self.breached = threading.Event()
+        self.breaches = []
+        self._floor_armed = False
+        self._started = False
+
+    def start(self):
+        if not self._started:
+            self.vehicle.location.add_attribute_listener("global_relative_frame", self._on_position)
+            self._started = True
+        return self
+
+    def stop(self):
+        if self._started:
+            self.vehicle.location.remove_attribute_listener("global_relative_frame", self._on_position)
+            self._started = False
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def raise_if_breached(self):
+        """Melempar GeofenceBreach jika sudah pernah terjadi pelanggaran."""
+        if self.breached.is_set():
+            raise GeofenceBreach(self.breaches[0])
+
+    def _on_position(self, _locations, _name, location):
+        if self.breached.is_set():
+            return
+        alt = location.alt or 0.0
+        mode = self.vehicle.mode.name
+        floor = self.geofence.floor
+        if floor is not None and not self._floor_armed and alt >= floor:
+            self._floor_armed = True
+        check_floor = self._floor_armed and mode not in ("LAND", "RTL")
+
+        start = time.perf_counter_ns()
+        result = self.geofence.check(location.lat, location.lon, alt, check_floor)
+        self.latency.record_ns(time.perf_counter_ns() - start)
+        if result is not None:
+            self._trigger(result, location, alt)
+
+    def _trigger(self, result, location, alt):
+        from dronekit import VehicleMode
+
+        from .clock import get_clock
+
+        breach = {
+            "t": get_clock(self.clock, self.vehicle).now(),
+            "reason": result[0],
+            "fence": result[1],
+            "lat": location.lat,
+            "lon": location.lon,
+            "alt": alt,
+            "action": self.action,
+        }
+        self.breaches.append(breach)
+        # Tidak memakai switch_mode(): listener berjalan di thread pesan MAVLink,
+        # jadi menunggu konfirmasi mode di sini akan memblokir update itu sendiri
+        self.vehicle.mode = VehicleMode(self.action)
+        self.breached.set()
+        print(f"[FENCE] Pelanggaran {breach['reason']}"
+              + (f" ({breach['fence']})" if breach["fence"] else "")
+              + f" di lat={location.lat:.6f}, lon={location.lon:.6f}, alt={alt:.1f}m"
+              + f" -> {self.action}")
+        if self.on_breach is not None:
+            self.on_breach(breach)
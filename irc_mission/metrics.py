@@ -0,0 +1,145 @@
+"""
+metrics.py
+----------
+Histogram latensi ringan untuk instrumentasi di thread pesan MAVLink.
+
+record() hanya menambah hitungan bucket (bucket log2 dalam mikrodetik) dan
+beberapa akumulator, jadi aman dipanggil di setiap update telemetri. Sampel
+mentah tidak disimpan; persentil diperkirakan dari batas atas bucket.
+
+Histogram yang dipakai bersama beberapa helper (misalnya latensi konfirmasi
+mode di switch_mode) diambil dari registry dengan get_histogram(nama), lalu
+diekspor sekaligus setelah terbang dengan export_histograms(path).
+
+Contoh:
+    histogram = LatencyHistogram("geofence")
+    start = time.perf_counter_ns()
+    ...
+    histogram.record_ns(time.perf_counter_ns() - start)
+    print(histogram.format())
+"""
+
+import json
+import threading
+
+BUCKETS = 40  # 2^39 us ~ 6 hari, lebih dari cukup
+
+
+class LatencyHistogram:
+    """
+    Histogram latensi dengan bucket log2 mikrodetik.
+
+    Bucket i berisi sampel dengan latensi < 2^i us (bucket 0: < 1 us).
+
+    Parameter:
+        name : str - nama metrik untuk laporan/ekspor
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        """Menambah satu sampel latensi dalam detik."""
+        micros = seconds * 1e6
+        bucket = min(int(micros).bit_length(), BUCKETS - 1) if micros >= 1 else 0
+        with self._lock:
+            self.counts[bucket] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds < self.min:
+                self.min = seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def record_ns(self, nanoseconds):
+        """Menambah satu sampel latensi dalam nanodetik (hasil perf_counter_ns)."""
+        self.record(nanoseconds / 1e9)
+
+    def record_error(self):
+        """Menghitung satu operasi yang gagal (timeout), tanpa sampel latensi."""
+        with self._lock:
+            self.errors += 1
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else float("nan")
+
+    def percentile(self, q):
+        """
+        Perkiraan persentil ke-q (0-100) dalam detik: batas atas bucket yang
+        memuat sampel itu, dibatasi nilai maksimum yang tercatat.
+        """
+        if not self.count:
+            return float("nan")
+        rank = q / 100.0 * self.count
+        seen = 0
+        for bucket, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return min((1 << bucket) / 1e6, self.max)
+        return self.max
+
+    def to_dict(self):
+        """Ringkasan dan isi bucket (untuk ekspor JSON)."""
+        return {
+            "name": self.name,
+            "count": self.count,
+            "errors": self.errors,
+            "mean": self.mean if self.count else None,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "p50": self.percentile(50) if self.count else None,
+            "p90": self.percentile(90) if self.count else None,
+            "p99": self.percentile(99) if self.count else None,
+            "buckets_us": {f"<{1 << i}": n for i, n in enumerate(self.counts) if n},
+        }
+
+    def format(self, unit="us"):
+        """Satu baris ringkasan, misalnya untuk log akhir misi."""
+        scale = {"us": 1e6, "ms": 1e3, "s": 1.0}[unit]
+        errors = f" gagal={self.errors}" if self.errors else ""
+        if not self.count:
+            return f"{self.name}: belum ada sampel{errors}"
+        return (f"{self.name}: n={self.count} mean={self.mean * scale:.1f}{unit} "
+                f"p50={self.percentile(50) * scale:.1f}{unit} p99={self.percentile(99) * scale:.1f}{unit} "
+                f"max={self.max * scale:.1f}{unit}{errors}")
+
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def get_histogram(name):
+    """Histogram bersama dengan nama tertentu dari registry (dibuat jika belum ada)."""
+    with _registry_lock:
+        histogram = _registry.get(name)
+        if histogram is None:
+            histogram = _registry[name] = LatencyHistogram(name)
+        return histogram
+
+
+def registered_histograms(prefix=""):
+    """Histogram di registry yang namanya diawali `prefix`, urut nama."""
+    with _registry_lock:
+        return [_registry[name] for name in sorted(_registry) if name.startswith(prefix)]
+
+
+def export_histograms(path, histograms=None):
+    """
+    Menyimpan beberapa histogram ke file JSON.
+
+    Parameter:
+        path       : str - file tujuan
+        histograms : iterable of LatencyHistogram, None = semua histogram di registry
+    """
+    if histograms is None:
+        histograms = registered_histograms()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([h.to_dict() for h in histograms], f, indent=2)
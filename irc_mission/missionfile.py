@@ -0,0 +1,382 @@
+"""
+missionfile.py
+--------------
+Format file misi deklaratif (YAML/JSON/CSV/JSON Lines) dan import/export
+file `.waypoints` QGroundControl/Mission Planner.
+
+Rute tidak perlu lagi ditulis sebagai list Python di skrip. Isi file memakai
+skema waypoint yang sama dengan execute_waypoints():
+
+    # misi.yaml
+    name: Multi waypoint
+    frame: relative-to-previous      # opsional, lihat frames.py
+    defaults: {altitude: 10, hover: 0}
+    waypoints:
+      - {name: WP1 - Timur, d_north: 0, d_east: 25, hover: 2}
+      - {name: WP2 - Timur Laut, d_north: 15, d_east: -10, altitude: 12}
+
+    # misi.csv - metadata di baris komentar sebelum header
+    # name: Survey blok A
+    # frame: relative-to-home
+    name,d_north,d_east,altitude,hover
+    S1,0,0,20,0
+
+    # misi.jsonl - baris pertama boleh {"mission": {name, frame, defaults}}
+    {"mission": {"frame": "absolute"}}
+    {"name": "T1", "lat": -6.5567, "lon": 106.731, "altitude": 15}
+
+CSV, JSON Lines, dan `.waypoints` dibaca secara streaming: MissionFile hanya
+membaca header saat dibuka, lalu setiap iterasi membuka file lagi dan
+menghasilkan waypoint satu per satu. Survey 100 ribu titik tidak pernah
+berada di memori sebagai list dict. YAML dan JSON dibaca utuh (cocok untuk
+rute tulisan tangan). YAML butuh PyYAML.
+
+Contoh:
+    mission = load_mission("survey.csv")
+    execute_waypoints(vehicle, mission)          # target dihitung sekali, waypoint di-stream
+    save_mission("survey.waypoints", mission, home=vehicle.location.global_relative_frame)
+"""
+
+import csv
+import itertools
+import json
+import os
+
+from .auto_mission import normalize_waypoints
+from .frames import FRAME_ABSOLUTE, FRAME_PREVIOUS, resolve_targets
+
+NUMERIC_KEYS = frozenset({"d_north", "d_east", "lat", "lon", "altitude", "hover", "threshold", "timeout"})
+CSV_COLUMNS = ("name", "frame", "d_north", "d_east", "lat", "lon", "altitude", "hover", "threshold", "timeout")
+HEADER_KEYS = ("name", "frame", "defaults")
+
+# Konstanta MAVLink untuk format QGC WPL 110
+WPL_HEADER = "QGC WPL 110"
+MAV_FRAME_GLOBAL_RELATIVE_ALT = 3
+MAV_CMD_NAV_WAYPOINT = 16
+MAV_CMD_NAV_LOITER_TIME = 19
+
+
+def _format(path):
+    ext = os.path.splitext(str(path))[1].lower()
+    formats = {".yaml": "yaml", ".yml": "yaml", ".json": "json", ".jsonl": "jsonl",
+               ".csv": "csv", ".waypoints": "wpl", ".txt": "wpl"}
+    if ext not in formats:
+        raise ValueError(f"Format file misi tidak dikenal: {path} (pakai {', '.join(sorted(formats))})")
+    return formats[ext]
+
+
+def _number(value):
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+class MissionFile:
+    """
+    File misi yang waypoint-nya dibaca ulang setiap kali diiterasi.
+
+    Bisa langsung dipakai di execute_waypoints(), compile_plan(),
+    resolve_targets(), optimize_route(), dll. sebagai pengganti list.
+
+    Atribut:
+        path     : str - lokasi file
+        format   : str - yaml, json, jsonl, csv, atau wpl
+        name     : str - nama misi (dari header, default nama file)
+        frame    : str - frame misi; diterapkan ke waypoint tanpa key `frame`
+        defaults : dict - nilai default untuk setiap waypoint
+        home     : tuple (lat, lon, 0.0) - home dari file `.waypoints` (item 0), atau None.
+                   Ketinggian 0 karena ketinggian waypoint relatif home, jadi
+                   aman dipakai sebagai home di compile_plan()/resolve_targets()
+        home_msl : float - ketinggian home di atas permukaan laut (z item 0), atau None
+        skipped  : int - item `.waypoints` yang bukan waypoint (takeoff, land, dll.)
+                   dan dilewati pada iterasi terakhir
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.format = _format(self.path)
+        self.name = os.path.splitext(os.path.basename(self.path))[0]
+        self.frame = FRAME_PREVIOUS
+        self.defaults = {}
+        self.home = None
+        self.home_msl = None
+        self.skipped = 0
+        self._document = None
+
+        if self.format in ("yaml", "json"):
+            self._document = self._load_document()
+            header = {k: self._document[k] for k in HEADER_KEYS if k in self._document}
+        elif self.format == "jsonl":
+            header = self._jsonl_header()
+        elif self.format == "csv":
+            header = self._csv_header()
+        else:
+            header = {"frame": FRAME_ABSOLUTE}
+            home = self._wpl_home()
+            if home is not None:
+                # z item 0 adalah MSL, bukan titik nol ketinggian relatif
+                self.home = (home[0], home[1], 0.0)
+                self.home_msl = home[2]
+        self.name = header.get("name", self.name)
+        self.frame = header.get("frame", self.frame)
+        self.defaults = dict(header.get("defaults") or {})
+
+    def __iter__(self):
+        base = dict(self.defaults)
+        base.setdefault("frame", self.frame)
+        if self._document is not None:
+            rows = iter(normalize_waypoints(self._document.get("waypoints", [])))
+        else:
+            rows = {"jsonl": self._iter_jsonl, "csv": self._iter_csv, "wpl": self._iter_wpl}[self.format]()
+        for wp in rows:
+            yield {**base, **wp}
+
+    def __repr__(self):
+        return f"MissionFile({self.path!r}, format={self.format}, frame={self.frame})"
+
+    # ------------------------------------------------------------------ YAML / JSON
+
+    def _load_document(self):
+        with open(self.path, encoding="utf-8") as f:
+            if self.format == "json":
+                document = json.load(f)
+            else:
+                import yaml
+
+                document = yaml.safe_load(f)
+        if isinstance(document, list):
+            document = {"waypoints": document}
+        if not isinstance(document, dict) or not isinstance(document.get("waypoints", []), list):
+            raise ValueError(f"{self.path}: isi harus list waypoint atau mapping dengan key 'waypoints'")
+        return document
+
+    # ------------------------------------------------------------------ JSON Lines
+
+    def _jsonl_header(self):
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    first = json.loads(line)
+                    return first.get("mission", {}) if isinstance(first, dict) else {}
+        return {}
+
+    def _iter_jsonl(self):
+        with open(self.path, encoding="utf-8") as f:
+            for number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                wp = json.loads(line)
+                if "mission" in wp:
+                    continue
+                if not isinstance(wp, dict):
+                    raise ValueError(f"{self.path}:{number}: setiap baris harus object JSON")
+                yield wp
+
+    # ------------------------------------------------------------------ CSV
+
+    def _csv_header(self):
+        header = {}
+        with open(self.path, encoding="utf-8", newline="") as f:
+            for line in f:
+                if not line.startswith("#"):
+                    break
+                key, sep, value = line[1:].partition(":")
+                key = key.strip()
+                if sep and key in ("name", "frame"):
+                    header[key] = value.strip()
+                elif sep and key == "defaults":
+                    header[key] = json.loads(value)
+        return header
+
+    def _iter_csv(self):
+        with open(self.path, encoding="utf-8", newline="") as f:
+            lines = (line for line in f if not line.startswith("#") and line.strip())
+            reader = csv.reader(lines)
+            header = next(reader, None)
+            if header is None:
+                return
+            # Konversi per kolom ditentukan sekali dari header
+            columns = [(i, key.strip(), key.strip() in NUMERIC_KEYS) for i, key in enumerate(header)]
+            for number, row in enumerate(reader, start=1):
+                wp = {}
+                for i, key, numeric in columns:
+                    value = row[i].strip() if i < len(row) else ""
+                    if not value:
+                        continue
+                    if numeric:
+                        try:
+                            wp[key] = _number(value)
+                        except ValueError:
+                            raise ValueError(f"{self.path}: baris data {number}: "
+                                             f"'{key}' bukan angka ({value!r})") from None
+                    else:
+                        wp[key] = value
+                yield wp
+
+    # ------------------------------------------------------------------ QGC .waypoints
+
+    def _wpl_rows(self):
+        with open(self.path, encoding="utf-8") as f:
+            first = f.readline().strip()
+            if not first.startswith("QGC WPL"):
+                raise ValueError(f"{self.path}: bukan file QGC WPL (baris pertama {first!r})")
+            for number, line in enumerate(f, start=2):
+                fields = line.split()
+                if not fields:
+                    continue
+                if len(fields) < 12:
+                    raise ValueError(f"{self.path}:{number}: butuh 12 kolom, ada {len(fields)}")
+                index, _current, frame, command = (int(v) for v in fields[:4])
+                p1, p2, p3, p4, x, y, z = (float(v) for v in fields[4:11])
+                yield index, frame, command, p1, p2, x, y, z
+
+    def _wpl_home(self):
+        for index, _frame, _command, _p1, _p2, x, y, z in self._wpl_rows():
+            return (x, y, z) if index == 0 else None
+        return None
+
+    def _iter_wpl(self):
+        self.skipped = 0
+        pending = None
+        for index, frame, command, p1, p2, x, y, z in self._wpl_rows():
+            if index == 0:
+                continue  # item 0 = home
+            if command == MAV_CMD_NAV_LOITER_TIME and pending is not None:
+                # Hover disimpan sebagai LOITER_TIME di titik yang sama (lihat compile_mission)
+                pending["hover"] = _number(p1)
+                continue
+            if pending is not None:
+                yield pending
+                pending = None
+            if command != MAV_CMD_NAV_WAYPOINT or frame != MAV_FRAME_GLOBAL_RELATIVE_ALT:
+                self.skipped += 1
+                continue
+            pending = {"name": f"WP{index}", "lat": x, "lon": y, "altitude": _number(z)}
+            if p1 > 0:
+                pending["hover"] = _number(p1)
+            if p2 > 0:
+                pending["threshold"] = _number(p2)
+        if pending is not None:
+            yield pending
+
+
+def load_mission(path):
+    """
+    Membuka file misi. Waypoint dibaca saat diiterasi (streaming untuk CSV,
+    JSON Lines, dan `.waypoints`).
+
+    Parameter:
+        path : str - file .yaml/.yml, .json, .jsonl, .csv, atau .waypoints
+
+    Return:
+        MissionFile
+    """
+    return MissionFile(path)
+
+
+def save_mission(path, waypoints, name=None, frame=None, defaults=None, home=None,
+                 default_threshold=1.5):
+    """
+    Menyimpan rute ke file misi; format dari ekstensi `path`.
+
+    CSV dan JSON Lines ditulis streaming dari iterable `waypoints`. Untuk
+    `.waypoints` semua target dihitung dulu (resolve_targets), jadi `home`
+    wajib diisi jika ada waypoint frame relatif.
+
+    Parameter:
+        path              : str - file tujuan
+        waypoints         : iterable of dict/tuple - rute (boleh MissionFile)
+        name              : str - nama misi (default: name MissionFile atau nama file)
+        frame             : str - frame misi (default: frame MissionFile atau relative-to-previous)
+        defaults          : dict - nilai default waypoint yang ditulis di header
+        home              : LocationGlobalRelative atau tuple - home untuk `.waypoints`
+        default_threshold : float - radius tiba `.waypoints` jika waypoint tidak punya threshold
+
+    Return:
+        int - jumlah waypoint yang ditulis
+    """
+    fmt = _format(path)
+    if isinstance(waypoints, MissionFile):
+        name = name if name is not None else waypoints.name
+        frame = frame if frame is not None else waypoints.frame
+    frame = frame or FRAME_PREVIOUS
+    name = name if name is not None else os.path.splitext(os.path.basename(str(path)))[0]
+    rows = (wp if isinstance(wp, dict) else _from_tuple(wp, i) for i, wp in enumerate(waypoints, start=1))
+
+    if fmt == "wpl":
+        return _save_wpl(path, rows, frame, home, default_threshold)
+
+    header = {"name": name, "frame": frame}
+    if defaults:
+        header["defaults"] = defaults
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if fmt in ("yaml", "json"):
+            document = dict(header, waypoints=[_strip(wp, frame) for wp in rows])
+            count = len(document["waypoints"])
+            if fmt == "json":
+                json.dump(document, f, indent=2, ensure_ascii=False)
+                f.write("\n")
+            else:
+                import yaml
+
+                yaml.safe_dump(document, f, sort_keys=False, allow_unicode=True)
+        elif fmt == "jsonl":
+            f.write(json.dumps({"mission": header}, ensure_ascii=False) + "\n")
+            for wp in rows:
+                f.write(json.dumps(_strip(wp, frame), ensure_ascii=False) + "\n")
+                count += 1
+        else:
+            f.write(f"# name: {name}\n# frame: {frame}\n")
+            if defaults:
+                f.write(f"# defaults: {json.dumps(defaults)}\n")
+            rows = iter(rows)
+            first = next(rows, None)
+            if first is None:
+                return 0
+            # Kolom standar sesuai frame misi, ditambah kolom lain yang ada di
+            # waypoint pertama. Kolom yang tidak diisi waypoint dibiarkan kosong.
+            position = ("lat", "lon") if frame == FRAME_ABSOLUTE else ("d_north", "d_east")
+            columns = ["name", *position, "altitude", "hover", "threshold"]
+            columns += [c for c in CSV_COLUMNS if c in _strip(first, frame) and c not in columns]
+            columns += [c for c in first if c not in CSV_COLUMNS]
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction="raise")
+            writer.writeheader()
+            for wp in itertools.chain([first], rows):
+                writer.writerow(_strip(wp, frame))
+                count += 1
+    return count
+
+
+def _from_tuple(wp, i):
+    d_north, d_east, altitude = wp[:3]
+    return {"name": wp[3] if len(wp) > 3 else f"WP{i}", "d_north": d_north, "d_east": d_east,
+            "altitude": altitude}
+
+
+def _strip(wp, frame):
+    """Hapus key `frame` yang sama dengan frame misi (tidak perlu ditulis per waypoint)."""
+    if wp.get("frame") == frame:
+        wp = {k: v for k, v in wp.items() if k != "frame"}
+    return wp
+
+
+def _save_wpl(path, rows, frame, home, default_threshold):
+    waypoints = list(rows)
+    if home is None:
+        if any(wp.get("frame", frame) != FRAME_ABSOLUTE for wp in waypoints):
+            raise ValueError("home wajib diisi untuk menyimpan waypoint frame relatif ke .waypoints")
+        home = (waypoints[0]["lat"], waypoints[0]["lon"], 0.0) if waypoints else (0.0, 0.0, 0.0)
+    targets = resolve_targets(waypoints, home, frame)
+    home = targets.home
+
+    def row(index, current, mav_frame, command, p1, p2, lat, lon, alt):
+        return (f"{index}\t{current}\t{mav_frame}\t{command}\t{p1:.8f}\t{p2:.8f}\t0.00000000\t"
+                f"0.00000000\t{lat:.8f}\t{lon:.8f}\t{alt:.6f}\t1\n")
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(WPL_HEADER + "\n")
+        f.write(row(0, 1, 0, MAV_CMD_NAV_WAYPOINT, 0, 0, home[0], home[1], home[2] or 0.0))
+        for i, (wp, (lat, lon, alt)) in enumerate(zip(waypoints, targets), start=1):
+            f.write(row(i, 0, MAV_FRAME_GLOBAL_RELATIVE_ALT, MAV_CMD_NAV_WAYPOINT,
+                        wp.get("hover", 0), wp.get("threshold", default_threshold), lat, lon, alt))
+    return len(waypoints)
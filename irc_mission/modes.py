@@ -0,0 +1,17 @@
+"""
+modes.py
+--------
+Nomor custom_mode ArduCopter untuk setiap nama mode.
+
+Dipakai bersama oleh sim.py (field custom_mode pesan HEARTBEAT) dan
+telemetry.py (kolom mode di record biner), jadi modul perekam tidak perlu
+memuat simulator hanya untuk tabel ini.
+
+Contoh:
+    COPTER_MODES["GUIDED"]   # 4
+"""
+
+COPTER_MODES = {
+    "STABILIZE": 0, "ACRO": 1, "ALT_HOLD": 2, "AUTO": 3, "GUIDED": 4, "LOITER": 5,
+    "RTL": 6, "CIRCLE": 7, "LAND": 9, "BRAKE": 17,
+}
@@ -0,0 +1,277 @@
+"""
+navigation.py
+-------------
+Helper navigasi GUIDED: goto ke offset atau koordinat, hover LOITER, dan
+eksekusi daftar waypoint.
+"""
+
+from .arrival import ArrivalWatcher
+from .clock import get_clock
+from .connection import LinkLost
+from .control import switch_mode
+from .distance import DEFAULT_MODEL, distance_function
+from .frames import FRAME_ABSOLUTE, FRAME_PREVIOUS, resolve_targets
+from .geo import get_offset_location
+from .streams import PHASE_HOVER
+from .telemetry import get_recorder
+
+
+def goto(vehicle, d_north, d_east, altitude, label="target", threshold=1.5,
+         distance_model=DEFAULT_MODEL, clock=None, leg=0, telemetry=None,
+         origin=None, time_to_go=None, geofence=None, battery=None, link=None, streams=None):
+    """
+    Terbang ke titik offset dari posisi saat ini dan tunggu hingga tiba.
+
+    Parameter:
+        vehicle   : objek Vehicle DroneKit
+        d_north   : float - offset ke utara (meter)
+        d_east    : float - offset ke timur (meter)
+        altitude  : float - ketinggian terbang (meter)
+        label     : str   - nama titik untuk log
+        threshold : float - jarak dalam meter untuk dianggap tiba
+        distance_model : str - model jarak (lihat distance.py)
+        clock     : jam yang dipakai (default: jam vehicle atau jam default, lihat clock.py)
+        leg       : int - nomor leg untuk telemetri
+        telemetry : perekam telemetri (default: perekam default, lihat telemetry.py)
+        origin    : LocationGlobalRelative - titik acuan offset (default: posisi saat ini)
+        time_to_go : float - anggap tiba jika sisa waktu terbang (jarak / groundspeed)
+                     <= nilai ini (detik), None = hanya threshold
+        geofence  : GeofenceMonitor - hentikan dengan GeofenceBreach jika geofence
+                    dilanggar (lihat geofence.py), None = tanpa geofence
+        battery   : BatteryMonitor - hentikan dengan EnergyAbort jika energi tidak cukup
+                    untuk pulang (lihat energy.py), None = tanpa pemantauan energi
+        link      : LinkMonitor - hentikan dengan LinkLost jika HEARTBEAT berhenti
+                    (lihat connection.py), None = tanpa pemantauan link
+        streams   : StreamRateController - rate stream cruise/approach per leg
+                    (lihat streams.py), None = rate tidak diubah
+
+    Return:
+        LocationGlobalRelative - koordinat target yang dituju
+    """
+    current = origin if origin is not None else vehicle.location.global_relative_frame
+    target = get_offset_location(current, d_north, d_east, altitude)
+    return goto_location(vehicle, target, label=label, threshold=threshold,
+                         distance_model=distance_model, clock=clock, leg=leg,
+                         telemetry=telemetry, time_to_go=time_to_go, geofence=geofence,
+                         battery=battery, link=link, streams=streams)
+
+
+def goto_location(vehicle, target, label="target", threshold=1.5, distance_model=DEFAULT_MODEL,
+                  clock=None, leg=0, telemetry=None, time_to_go=None, geofence=None,
+                  battery=None, link=None, streams=None):
+    """
+    Terbang ke koordinat absolut dan tunggu hingga tiba.
+
+    Parameter:
+        vehicle   : objek Vehicle DroneKit
+        target    : LocationGlobalRelative - koordinat tujuan
+        (parameter lain sama dengan goto())
+
+    Return:
+        LocationGlobalRelative - `target`
+
+    Raises:
+        GeofenceBreach - jika `geofence` dilanggar sebelum atau selama leg
+        EnergyAbort    - jika `battery` memicu RTL sebelum atau selama leg
+        LinkLost       - jika `link` mendeteksi HEARTBEAT berhenti selama leg
+    """
+    clock = get_clock(clock, vehicle)
+    recorder = get_recorder(telemetry)
+    guards = _guards(geofence, battery, link)
+    # Jangan kembali ke GUIDED setelah monitor memindahkan drone ke RTL/LOITER
+    _raise_if_aborted(guards)
+    if vehicle.mode.name != "GUIDED":
+        switch_mode(vehicle, "GUIDED", clock=clock)
+
+    # Konstanta jarak dihitung sekali per leg di lintang target
+    distance_fn = distance_function(distance_model, ref_lat=target.lat)
+    if streams is not None:
+        streams.begin_leg(target, distance_fn)
+
+    print(f"[NAV] Menuju {label} | Alt target: {target.alt}m...")
+    vehicle.simple_goto(target)
+
+    # Dibangunkan langsung oleh update posisi, bukan polling tiap 1 detik
+    watcher = ArrivalWatcher(vehicle, distance_fn, clock)
+    watcher.wait_until_arrived(
+        target, threshold,
+        on_progress=lambda dist, pos: recorder.record(clock.now(), leg, vehicle.mode.name, pos, dist),
+        progress_interval=recorder.sample_interval,
+        time_to_go=time_to_go,
+        abort=[guard.breached for guard in guards] or None,
+    )
+    _raise_if_aborted(guards)
+    # Sampel saat tiba selalu direkam, agar replay melihat titik keputusan yang sama
+    pos = vehicle.location.global_relative_frame
+    recorder.record(clock.now(), leg, vehicle.mode.name, pos, distance_fn(pos, target))
+    print(f"[NAV] Tiba di {label}")
+    return target
+
+
+def loiter_at_current(vehicle, duration, label="", clock=None, leg=0, telemetry=None,
+                      geofence=None, battery=None, link=None, streams=None):
+    """
+    Beralih ke mode LOITER dan hover di posisi saat ini selama durasi tertentu.
+
+    Parameter:
+        vehicle  : objek Vehicle DroneKit
+        duration : int - durasi hover dalam detik
+        label    : str - nama titik untuk log
+        clock    : jam yang dipakai (default: jam default)
+        leg      : int - nomor leg untuk telemetri
+        telemetry : perekam telemetri (default: perekam default)
+        geofence : GeofenceMonitor - hentikan hover dengan GeofenceBreach jika dilanggar
+        battery  : BatteryMonitor - hentikan hover dengan EnergyAbort jika harus pulang
+        link     : LinkMonitor - hentikan hover dengan LinkLost jika link putus
+        streams  : StreamRateController - pindah ke rate fase hover
+    """
+    clock = get_clock(clock, vehicle)
+    recorder = get_recorder(telemetry)
+    guards = _guards(geofence, battery, link)
+    _raise_if_aborted(guards)
+    switch_mode(vehicle, "LOITER", clock=clock)
+    if streams is not None:
+        streams.set_phase(PHASE_HOVER)
+    pos = vehicle.location.global_relative_frame
+    print(f"[LOITER] Hover di {label if label else 'posisi saat ini'} selama {duration}s")
+    print(f"  Posisi terkunci: lat={pos.lat:.6f}, lon={pos.lon:.6f}, alt={pos.alt:.2f}m")
+
+    _hold(vehicle, duration, clock, recorder, leg, guards)
+    print(f"[LOITER] Selesai di {label}")
+
+
+def _guards(*monitors):
+    """Monitor yang bisa menghentikan misi (punya `breached` dan `raise_if_breached()`)."""
+    return [guard for guard in monitors if guard is not None]
+
+
+def _raise_if_aborted(guards):
+    for guard in guards:
+        guard.raise_if_breached()
+
+
+def _hold(vehicle, duration, clock, recorder, leg, guards=()):
+    """Diam selama `duration` detik sambil merekam telemetri (tanpa jarak ke target)."""
+    end = clock.now() + duration
+    while True:
+        remaining = end - clock.now()
+        if remaining <= 0:
+            break
+        recorder.record(clock.now(), leg, vehicle.mode.name, vehicle.location.global_relative_frame)
+        if not guards:
+            clock.sleep(min(recorder.sample_interval, remaining))
+            continue
+        # Dibangunkan langsung oleh monitor pertama; monitor lain dicek tiap sampel
+        clock.wait(guards[0].breached, min(recorder.sample_interval, remaining))
+        _raise_if_aborted(guards)
+
+
+def execute_waypoints(vehicle, waypoints, default_threshold=1.5, distance_model=DEFAULT_MODEL,
+                      clock=None, telemetry=None, acceptance_radius=None, time_to_go=None,
+                      frame=FRAME_PREVIOUS, targets=None, geofence=None, battery=None,
+                      link=None, start=1, streams=None):
+    """
+    Mengeksekusi daftar waypoint secara berurutan.
+
+    Semua target absolut dihitung sekali di awal (lihat frames.py) dari posisi
+    drone saat fungsi ini dipanggil. Dengan frame default
+    "relative-to-previous", offset setiap waypoint dihitung dari TARGET
+    sebelumnya, bukan dari posisi drone saat tiba, jadi meleset-nya posisi
+    tiba tidak terakumulasi dari leg ke leg.
+
+    Mode look-ahead (acceptance_radius dan/atau time_to_go diisi): di sudut
+    tanpa hover, target berikutnya dikirim lebih awal, yaitu saat drone masuk
+    acceptance_radius atau sisa waktunya <= time_to_go. Drone tidak perlu
+    mengerem sampai hampir berhenti di setiap sudut. Waypoint dengan hover dan
+    waypoint terakhir tetap memakai threshold biasa.
+
+    Setiap waypoint adalah dictionary dengan key:
+        name      : str   - nama titik untuk log (opsional, default WP<i>)
+        d_north   : float - offset ke utara dalam meter (wajib, kecuali frame absolute)
+        d_east    : float - offset ke timur dalam meter (wajib, kecuali frame absolute)
+        lat, lon  : float - koordinat (wajib untuk frame absolute)
+        altitude  : float - ketinggian terbang dalam meter (wajib)
+        hover     : float - durasi diam di titik ini dalam detik (opsional, default 0)
+        threshold : float - jarak tiba dalam meter (opsional)
+        frame     : str   - frame waypoint ini (opsional, default parameter `frame`)
+
+    Parameter:
+        vehicle   : objek Vehicle DroneKit
+        waypoints : list of dict - daftar waypoint (atau iterable yang bisa dibaca
+                    ulang, misalnya MissionFile dari missionfile.py)
+        default_threshold : float - threshold default jika tidak ditentukan per waypoint
+        distance_model    : str - model jarak untuk deteksi tiba (lihat distance.py)
+        clock             : jam yang dipakai (default: jam default)
+        telemetry         : perekam telemetri, nomor leg = urutan waypoint (1..N)
+        acceptance_radius : float - radius look-ahead di sudut tanpa hover (meter)
+        time_to_go        : float - sisa waktu look-ahead di sudut tanpa hover (detik)
+        frame             : str - "relative-to-previous", "relative-to-home", atau "absolute"
+        targets           : TargetTable - target yang sudah dihitung resolve_targets()
+                            (misalnya saat validasi sebelum takeoff); None = hitung di sini
+        geofence          : GeofenceMonitor - misi dihentikan dengan GeofenceBreach saat
+                            geofence dilanggar; drone sudah dialihkan ke RTL/LOITER oleh monitor
+        battery           : BatteryMonitor - misi dihentikan dengan EnergyAbort saat energi
+                            tidak cukup lagi untuk pulang; drone sudah dialihkan ke RTL
+        link              : LinkMonitor - misi dihentikan dengan LinkLost (atribut `leg`
+                            berisi leg yang terputus) saat HEARTBEAT berhenti
+        start             : int - mulai dari waypoint ke-`start` (1..N), misalnya untuk
+                            melanjutkan misi setelah reconnect; butuh `targets` dari
+                            awal misi agar target frame relatif tidak bergeser
+        streams           : StreamRateController - rate stream per fase (cruise,
+                            approach, hover) selama misi (lihat streams.py)
+
+    Raises:
+        GeofenceBreach - jika `geofence` dilanggar
+        EnergyAbort    - jika `battery` memicu RTL
+        LinkLost       - jika `link` putus
+    """
+    guards = _guards(geofence, battery, link)
+    clock = get_clock(clock, vehicle)
+    recorder = get_recorder(telemetry)
+    if targets is None:
+        targets = resolve_targets(waypoints, vehicle.location.global_relative_frame, frame)
+    total = len(targets)
+    if start > 1:
+        print(f"[INFO] Melanjutkan eksekusi dari waypoint {start}/{total}...")
+    else:
+        print(f"[INFO] Memulai eksekusi {total} waypoint...")
+
+    lookahead = acceptance_radius is not None or time_to_go is not None
+    if lookahead:
+        print(f"[INFO] Mode look-ahead: radius={acceptance_radius}m, time_to_go={time_to_go}s")
+
+    for i, wp in enumerate(waypoints, start=1):
+        if i < start:
+            continue
+        name      = wp.get("name", f"WP{i}")
+        altitude  = wp["altitude"]
+        hover     = wp.get("hover", 0)
+        threshold = wp.get("threshold", default_threshold)
+
+        print(f"\n[WP {i}/{total}] {name}")
+        if wp.get("frame", frame) == FRAME_ABSOLUTE:
+            print(f"  Target: lat={wp['lat']:.6f}, lon={wp['lon']:.6f}, Alt={altitude}m")
+        else:
+            print(f"  Target: N={wp['d_north']:+.1f}m, E={wp['d_east']:+.1f}m, Alt={altitude}m")
+
+        corner = lookahead and hover <= 0 and i < total
+        if corner and acceptance_radius is not None:
+            threshold = max(threshold, acceptance_radius)
+
+        try:
+            goto_location(vehicle, targets.location(i - 1), label=name, threshold=threshold,
+                          distance_model=distance_model, clock=clock, leg=i, telemetry=recorder,
+                          time_to_go=time_to_go if corner else None, geofence=geofence,
+                          battery=battery, link=link, streams=streams)
+
+            # Hover sebentar jika ditentukan
+            if hover > 0:
+                print(f"  Hover {hover} detik di {name}...")
+                if streams is not None:
+                    streams.set_phase(PHASE_HOVER)
+                _hold(vehicle, hover, clock, recorder, i, guards)
+        except LinkLost as exc:
+            exc.leg = i
+            raise
+
+    print("\n[INFO] Semua waypoint selesai dieksekusi.")
@@ -0,0 +1,354 @@
+"""
+plan.py
+-------
+Compiler dan validator misi sebelum terbang, dengan cache rencana hasil compile.
+
+WAYPOINTS (dict) dan MISSION_WAYPOINTS (tuple) hanyalah list Python; typo key
+atau ketinggian di luar batas baru ketahuan saat drone sudah di udara.
+compile_plan() memeriksa seluruh rute sekaligus sebelum takeoff:
+
+    - skema: key yang tidak dikenal (typo), key wajib, tipe angka, hover/threshold
+    - batas ketinggian dan jarak maksimum dari home
+    - target absolut semua waypoint (frames.py), panjang leg, perkiraan waktu
+      dan energi
+
+Semua kesalahan dikumpulkan dan dilempar sekaligus sebagai PlanError.
+
+Hasilnya (CompiledPlan) disimpan sebagai JSON di folder cache dengan nama
+hash SHA-256 dari isi rute dan opsi compile. Peluncuran berikutnya dengan
+misi yang sama langsung memuat rencana itu tanpa validasi dan perhitungan
+ulang. Waypoint frame relatif disimpan sebagai offset meter (d_north/d_east);
+saat dipakai, bind() menghitung ulang targetnya dengan resolve_targets() di
+home yang sebenarnya, jadi offset timur tetap benar di lintang mana pun
+(waypoint absolute tidak ikut bergeser). Panjang leg dan perkiraan waktu
+rute relatif tidak bergantung pada home, karena itu home hanya ikut menjadi
+bagian key jika rute berisi waypoint absolute (dibulatkan ~10 m).
+
+Contoh:
+    plan = compile_plan(WAYPOINTS, vehicle.location.global_relative_frame, max_altitude=50)
+    print_plan_report(plan)
+    execute_plan(vehicle, plan)
+"""
+
+import hashlib
+import json
+import math
+import os
+from array import array
+
+from .auto_mission import normalize_waypoints
+from .frames import FRAME_ABSOLUTE, FRAME_PREVIOUS, FRAMES, TargetTable, resolve_targets
+
+PLAN_VERSION = 1
+
+WAYPOINT_KEYS = frozenset({
+    "name", "d_north", "d_east", "lat", "lon", "altitude", "hover", "threshold", "frame", "timeout",
+})
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "irc_mission", "plans",
+)
+
+# Presisi pembulatan home di key cache untuk rute dengan waypoint absolute (~11 m)
+HOME_KEY_DECIMALS = 4
+
+
+class PlanError(ValueError):
+    """Rute tidak lolos validasi. `errors` berisi semua pesan kesalahan."""
+
+    def __init__(self, errors):
+        super().__init__("Rute tidak valid:\n  - " + "\n  - ".join(errors))
+        self.errors = errors
+
+
+class CompiledPlan:
+    """
+    Rute yang sudah divalidasi beserta target dan perkiraannya.
+
+    Atribut:
+        key       : str - hash isi rute dan opsi compile
+        waypoints : list of dict - waypoint yang sudah dinormalisasi
+        home      : tuple (lat, lon, alt) - home saat compile
+        targets   : TargetTable - target absolut relatif terhadap `home`
+        absolute  : array('b') - 1 jika target berasal dari frame absolute
+        legs      : array('d') - panjang tiap leg 3D (meter), leg 1 dari home
+        times     : array('d') - perkiraan waktu tiap leg termasuk hover (detik)
+        distance  : float - total jarak (meter)
+        duration  : float - total perkiraan waktu (detik)
+        energy_wh : float - perkiraan energi (Wh)
+        options   : dict - opsi compile
+        cached    : bool - dimuat dari cache
+    """
+
+    def __init__(self, key, waypoints, home, targets, absolute, legs, times,
+                 energy_wh, options, cached=False):
+        self.key = key
+        self.waypoints = waypoints
+        self.home = home
+        self.targets = targets
+        self.absolute = absolute
+        self.legs = legs
+        self.times = times
+        self.distance = sum(legs)
+        self.duration = sum(times)
+        self.energy_wh = energy_wh
+        self.options = options
+        self.cached = cached
+
+    def __len__(self):
+        return len(self.waypoints)
+
+    def bind(self, home):
+        """
+        Target untuk home sebenarnya saat misi dimulai.
+
+        Target dihitung ulang dari offset meter waypoint di `home` (bukan
+        digeser selisih derajat, yang salah skala untuk offset timur jika
+        lintang home berbeda); waypoint absolute tetap.
+
+        Parameter:
+            home : LocationGlobalRelative atau tuple (lat, lon, alt)
+
+        Return:
+            TargetTable
+        """
+        if not isinstance(home, tuple):
+            home = (home.lat, home.lon, home.alt)
+        home = tuple(float(v or 0.0) for v in home)
+        if home == self.home:
+            return self.targets
+        return resolve_targets(self.waypoints, home, self.options["frame"])
+
+    def to_dict(self):
+        return {
+            "version": PLAN_VERSION,
+            "key": self.key,
+            "waypoints": self.waypoints,
+            "home": list(self.home),
+            "targets": self.targets.coords.tolist(),
+            "absolute": self.absolute.tolist(),
+            "legs": self.legs.tolist(),
+            "times": self.times.tolist(),
+            "energy_wh": self.energy_wh,
+            "options": self.options,
+        }
+
+    @classmethod
+    def from_dict(cls, data, cached=False):
+        waypoints = data["waypoints"]
+        home = tuple(data["home"])
+        names = [wp.get("name", f"WP{i}") for i, wp in enumerate(waypoints, start=1)]
+        targets = TargetTable(array("d", data["targets"]), names, home)
+        return cls(data["key"], waypoints, home, targets, array("b", data["absolute"]),
+                   array("d", data["legs"]), array("d", data["times"]),
+                   data["energy_wh"], data["options"], cached=cached)
+
+
+def plan_key(waypoints, home, options):
+    """
+    Hash SHA-256 isi rute dan opsi compile (JSON kanonik).
+
+    Home hanya ikut dihitung (dibulatkan) jika ada waypoint frame absolute,
+    karena hanya di situ panjang leg dan validasi bergantung pada home.
+    """
+    payload = {"version": PLAN_VERSION, "waypoints": waypoints, "options": options}
+    frame = options["frame"]
+    if any(wp.get("frame", frame) == FRAME_ABSOLUTE for wp in waypoints):
+        payload["home"] = [round(home[0], HOME_KEY_DECIMALS), round(home[1], HOME_KEY_DECIMALS)]
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _check_schema(waypoints, frame, min_altitude, max_altitude):
+    """Memeriksa skema semua waypoint. Return list pesan kesalahan."""
+    errors = []
+    for i, wp in enumerate(waypoints, start=1):
+        label = f"WP{i}" + (f" ({wp['name']})" if "name" in wp else "")
+        unknown = sorted(set(wp) - WAYPOINT_KEYS)
+        if unknown:
+            errors.append(f"{label}: key tidak dikenal {unknown} "
+                          f"(yang diizinkan: {', '.join(sorted(WAYPOINT_KEYS))})")
+
+        wp_frame = wp.get("frame", frame)
+        if wp_frame not in FRAMES:
+            errors.append(f"{label}: frame tidak dikenal {wp_frame!r}")
+            continue
+        required = ("lat", "lon", "altitude") if wp_frame == FRAME_ABSOLUTE else ("d_north", "d_east", "altitude")
+        for key in required:
+            value = wp.get(key)
+            if key not in wp:
+                errors.append(f"{label}: key '{key}' wajib ada untuk frame {wp_frame}")
+            elif isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                errors.append(f"{label}: '{key}' harus angka, bukan {value!r}")
+
+        altitude = wp.get("altitude")
+        if isinstance(altitude, (int, float)) and not min_altitude <= altitude <= max_altitude:
+            errors.append(f"{label}: altitude {altitude}m di luar batas "
+                          f"{min_altitude}-{max_altitude}m")
+        for key in ("hover", "timeout"):
+            value = wp.get(key, 0)
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                errors.append(f"{label}: '{key}' harus angka >= 0, bukan {value!r}")
+        threshold = wp.get("threshold", 1.0)
+        if isinstance(threshold, bool) or not isinstance(threshold, (int, float)) or threshold <= 0:
+            errors.append(f"{label}: 'threshold' harus angka > 0, bukan {threshold!r}")
+    return errors
+
+
+def _local(point, home):
+    """(north, east, alt) meter dari home, untuk panjang leg."""
+    from .distance import local_offset
+
+    north, east = local_offset(home[0], home[1], point[0], point[1])
+    return north, east, point[2]
+
+
+def load_plan(key, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Memuat rencana dari cache.
+
+    Return:
+        CompiledPlan atau None jika tidak ada / versi berbeda / rusak
+    """
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != PLAN_VERSION or data.get("key") != key:
+        return None
+    return CompiledPlan.from_dict(data, cached=True)
+
+
+def save_plan(plan, cache_dir=DEFAULT_CACHE_DIR):
+    """Menyimpan rencana ke cache (ditulis ke file sementara lalu di-rename)."""
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{plan.key}.json")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(plan.to_dict(), f, separators=(",", ":"))
+    os.replace(tmp, path)
+    return path
+
+
+def compile_plan(route, home=None, frame=FRAME_PREVIOUS, default_threshold=1.5,
+                 min_altitude=2.0, max_altitude=120.0, max_distance=None,
+                 cruise_speed=5.0, climb_speed=2.5, power_w=200.0,
+                 cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Memvalidasi dan meng-compile rute, memakai cache jika isi rute sama.
+
+    Parameter:
+        route             : list of dict/tuple - format execute_waypoints/MISSION_WAYPOINTS
+        home              : LocationGlobalRelative atau tuple (lat, lon, alt) - titik
+                            awal misi. None = home nominal (0, 0, 0), hanya untuk rute
+                            tanpa waypoint absolute (misalnya saat --dry-run)
+        frame             : str - frame default waypoint (lihat frames.py)
+        default_threshold : float - threshold jika waypoint tidak punya `threshold`
+        min_altitude      : float - ketinggian minimum waypoint (meter)
+        max_altitude      : float - ketinggian maksimum waypoint (meter)
+        max_distance      : float - jarak horizontal maksimum target dari home (meter)
+        cruise_speed      : float - kecepatan horizontal untuk perkiraan waktu (m/s)
+        climb_speed       : float - kecepatan vertikal untuk perkiraan waktu (m/s)
+        power_w           : float - daya rata-rata untuk perkiraan energi (watt),
+                            perkiraan kasar; sesuaikan dengan drone
+        cache_dir         : str - folder cache, None = tanpa cache
+
+    Return:
+        CompiledPlan - `cached` True jika dimuat dari cache
+
+    Raises:
+        PlanError - berisi semua kesalahan validasi
+    """
+    malformed = [f"WP{i}: tuple harus (d_north, d_east, altitude[, label]), bukan {wp!r}"
+                 for i, wp in enumerate(route, start=1)
+                 if not isinstance(wp, dict) and (not isinstance(wp, (tuple, list)) or not 3 <= len(wp) <= 4)]
+    if malformed:
+        raise PlanError(malformed)
+    waypoints = [dict(wp) for wp in normalize_waypoints(route)]
+    options = {
+        "frame": frame, "default_threshold": default_threshold,
+        "min_altitude": min_altitude, "max_altitude": max_altitude, "max_distance": max_distance,
+        "cruise_speed": cruise_speed, "climb_speed": climb_speed, "power_w": power_w,
+    }
+
+    if home is None:
+        home = (0.0, 0.0, 0.0)
+        if any(wp.get("frame", frame) == FRAME_ABSOLUTE for wp in waypoints):
+            raise PlanError(["Rute berisi waypoint absolute, home wajib diisi"])
+    elif not isinstance(home, tuple):
+        home = (home.lat, home.lon, home.alt)
+    home = tuple(float(v or 0.0) for v in home)
+
+    key = plan_key(waypoints, home, options)
+    if cache_dir is not None:
+        plan = load_plan(key, cache_dir)
+        if plan is not None:
+            if plan.home != home:
+                plan.targets = plan.bind(home)
+                plan.home = home
+            return plan
+
+    if frame not in FRAMES:
+        raise PlanError([f"Frame tidak dikenal: {frame!r} (pilih salah satu dari {FRAMES})"])
+    errors = _check_schema(waypoints, frame, min_altitude, max_altitude)
+    if errors:
+        raise PlanError(errors)
+    try:
+        targets = resolve_targets(waypoints, home, frame)
+    except ValueError as exc:
+        raise PlanError([str(exc)]) from None
+
+    absolute = array("b", (wp.get("frame", frame) == FRAME_ABSOLUTE for wp in waypoints))
+    legs = array("d")
+    times = array("d")
+    previous = (0.0, 0.0, home[2])
+    for wp, target in zip(waypoints, targets):
+        point = _local(target, home)
+        horizontal = math.hypot(point[0] - previous[0], point[1] - previous[1])
+        vertical = abs(point[2] - previous[2])
+        if max_distance is not None and math.hypot(point[0], point[1]) > max_distance:
+            errors.append(f"{wp.get('name', f'WP{len(legs) + 1}')}: "
+                          f"{math.hypot(point[0], point[1]):.0f}m dari home, batas {max_distance}m")
+        legs.append(math.hypot(horizontal, vertical))
+        times.append(max(horizontal / cruise_speed, vertical / climb_speed) + wp.get("hover", 0))
+        previous = point
+    if errors:
+        raise PlanError(errors)
+
+    plan = CompiledPlan(key, waypoints, home, targets, absolute, legs, times,
+                        energy_wh=power_w * sum(times) / 3600.0, options=options)
+    if cache_dir is not None:
+        save_plan(plan, cache_dir)
+    return plan
+
+
+def execute_plan(vehicle, plan, **kwargs):
+    """
+    Menerbangkan CompiledPlan dengan execute_waypoints(), target di-bind ke
+    posisi drone saat ini.
+
+    Parameter:
+        vehicle : objek Vehicle DroneKit
+        plan    : CompiledPlan
+        kwargs  : argumen tambahan execute_waypoints() (clock, telemetry, look-ahead, ...)
+    """
+    from .navigation import execute_waypoints
+
+    kwargs.setdefault("default_threshold", plan.options["default_threshold"])
+    targets = plan.bind(vehicle.location.global_relative_frame)
+    execute_waypoints(vehicle, plan.waypoints, targets=targets, frame=plan.options["frame"], **kwargs)
+
+
+def print_plan_report(plan):
+    """Mencetak ringkasan CompiledPlan per leg."""
+    source = "cache" if plan.cached else "compile baru"
+    print(f"[PLAN] {len(plan)} waypoint | {plan.distance:.0f} m | ~{plan.duration:.0f} s | "
+          f"~{plan.energy_wh:.1f} Wh | {source} ({plan.key[:12]})")
+    print(f"  {'#':>4} {'nama':<24} {'alt':>6} {'leg':>8} {'waktu':>7}")
+    for i, (wp, leg, duration) in enumerate(zip(plan.waypoints, plan.legs, plan.times), start=1):
+        name = str(wp.get("name", f"WP{i}"))[:24]
+        print(f"  {i:>4} {name:<24} {wp['altitude']:>5}m {leg:>7.1f}m {duration:>6.1f}s")
+
@@ -0,0 +1,337 @@
+"""
+replay.py
+---------
+Menjalankan ulang logika misi terhadap telemetri hasil rekaman.
+
+Tujuannya untuk uji regresi perubahan threshold tiba, timeout, atau urutan
+mode tanpa menerbangkan drone lagi. Helper misi yang asli (execute_waypoints,
+goto, loiter_at_current, fly_to_and_loiter di contoh, dll.) dijalankan apa
+adanya terhadap ReplayVehicle:
+
+    - posisi dan mode dibaca dari rekaman, sampel demi sampel (streaming dari
+      disk, tidak pernah dimuat seluruhnya); groundspeed diturunkan dari
+      perpindahan antar dua sampel posisi berurutan
+    - perintah helper (simple_goto, ganti mode) tidak mengubah rekaman, hanya
+      dicatat beserta waktunya
+    - waktu mengikuti stempel waktu rekaman lewat SimClock, jadi rekaman
+      berjam-jam selesai secepat CPU membaca sampel
+
+Keputusan yang dilaporkan:
+    arrival : helper berhenti menunggu posisi (listener posisi dilepas) setelah
+              simple_goto; dicatat jaraknya ke target saat itu
+    mode    : permintaan ganti mode, kapan rekaman menunjukkan mode itu, dan
+              apakah melewati mode_timeout (switch_mode akan timeout)
+
+Catatan: setelah keputusan replay pertama yang berbeda dari rekaman, rekaman
+tidak lagi persis mewakili apa yang akan dilakukan drone. Bandingkan
+`recorded_end` dengan `arrival_t` per leg untuk melihat seberapa jauh bergesernya.
+
+Contoh:
+    report = replay_mission(
+        "misi.flog",
+        lambda vehicle, clock: execute_waypoints(vehicle, WAYPOINTS, default_threshold=2.0),
+    )
+    print_replay_report(report)
+"""
+
+import contextlib
+import os
+import time
+
+from .clock import SimClock, get_clock, set_default_clock
+from .distance import distance_function
+from .geo import get_distance
+from .sim import SimLocation, SimLocations, SimMode, _Observable
+from .telemetry import MAGIC as TELEMETRY_MAGIC
+from .telemetry import get_recorder, read_telemetry, set_default_recorder
+
+
+class ReplayFinished(Exception):
+    """Rekaman habis sebelum misi yang di-replay selesai."""
+
+
+def iter_samples(path, block=1 << 16):
+    """
+    Membaca sampel (t, leg, mode, lat, lon, alt, dist) dari file telemetri
+    (telemetry.py) atau flight log (flightlog.py) secara streaming.
+
+    Parameter:
+        path  : str - file rekaman
+        block : int - jumlah record per blok baca untuk flight log
+
+    Return:
+        generator of tuple - mode berupa nama
+    """
+    with open(path, "rb") as f:
+        magic = f.read(len(TELEMETRY_MAGIC))
+    if magic == TELEMETRY_MAGIC:
+        yield from read_telemetry(path)
+        return
+
+    from .flightlog import FlightLog
+    from .telemetry import MODE_NAMES
+
+    with FlightLog(path) as log:
+        records = log.records
+        for start in range(0, len(records), block):
+            for t, leg, code, lat, lon, alt, dist in records[start:start + block].tolist():
+                yield t, leg, MODE_NAMES.get(code, "UNKNOWN"), lat, lon, alt, dist
+
+
+class ReplayLocations(SimLocations):
+    """`vehicle.location` yang mencatat kapan helper mulai/berhenti menunggu posisi."""
+
+    def __init__(self, location, vehicle):
+        super().__init__(location)
+        self._vehicle = vehicle
+
+    def remove_attribute_listener(self, attr_name, fn):
+        super().remove_attribute_listener(attr_name, fn)
+        if attr_name == "global_relative_frame":
+            self._vehicle._on_wait_finished()
+
+
+class ReplayVehicle(_Observable):
+    """
+    Vehicle pengganti yang posisinya diputar dari rekaman.
+
+    Dipakai bersama SimClock: setiap step() membaca satu sampel berikutnya,
+    memajukan `time` ke stempel waktu sampel, lalu memanggil attribute
+    listener posisi. Rekaman tidak menyimpan kecepatan, jadi `groundspeed`
+    dihitung dari jarak dan selisih waktu terhadap sampel sebelumnya.
+
+    Parameter:
+        samples      : iterable of tuple - (t, leg, mode, lat, lon, alt, dist)
+        mode_timeout : float - batas konfirmasi mode untuk laporan (detik)
+        end_grace    : float - setelah rekaman habis, waktu tetap boleh maju
+                       sejauh ini (detik) dengan state terakhir, agar polling
+                       yang lebih jarang dari rekaman masih melihat sampel akhir
+    """
+
+    def __init__(self, samples, mode_timeout=10.0, end_grace=5.0):
+        super().__init__()
+        self._samples = iter(samples)
+        first = next(self._samples, None)
+        if first is None:
+            raise ValueError("Rekaman kosong")
+        t, leg, mode, lat, lon, alt, dist = first
+        self.mode_timeout = mode_timeout
+        self.end_grace = end_grace
+        self.end_time = None
+        self._period = 0.1
+        self.time = t
+        self.start_time = t
+        self.samples = 1
+        self.groundspeed = 0.0
+        # Skala jarak dihitung sekali di lintang awal rekaman (murah per sampel)
+        self._step_distance = distance_function(ref_lat=lat)
+        self.location = ReplayLocations(SimLocation(lat, lon, alt), self)
+        self._mode = SimMode(mode)
+        self.legs = []          # per simple_goto: dict goto_t, target, arrival_t, dist
+        self.mode_switches = []  # per permintaan mode: dict mode, requested, confirmed
+        self.recorded_legs = {}  # leg rekaman -> [t_awal, t_tiba] (sampel yang punya jarak)
+        self._pending_mode = None
+        self._track_leg(leg, t, dist)
+
+    # ------------------------------------------------------------------ API DroneKit
+
+    @property
+    def mode(self):
+        return self._mode
+
+    @mode.setter
+    def mode(self, value):
+        pending = self._pending_mode
+        if pending is not None and pending["mode"] == value.name:
+            return  # kirim ulang oleh switch_mode: latensi tetap dari perintah pertama
+        request = {"mode": value.name, "requested": self.time, "confirmed": None}
+        self.mode_switches.append(request)
+        if value.name == self._mode.name:
+            request["confirmed"] = self.time
+        else:
+            self._pending_mode = request
+
+    @property
+    def armed(self):
+        return True
+
+    @armed.setter
+    def armed(self, value):
+        pass
+
+    @property
+    def is_armable(self):
+        return True
+
+    def simple_takeoff(self, altitude):
+        pass
+
+    def simple_goto(self, location, airspeed=None, groundspeed=None):
+        self.legs.append({"goto_t": self.time, "target": location, "arrival_t": None, "dist": None})
+
+    def add_message_listener(self, name, fn):
+        pass
+
+    def remove_message_listener(self, name, fn):
+        pass
+
+    def close(self):
+        pass
+
+    # ------------------------------------------------------------------ replay
+
+    def step(self):
+        """Memutar satu sampel berikutnya. ReplayFinished jika rekaman habis."""
+        sample = next(self._samples, None) if self.end_time is None else None
+        if sample is None:
+            if self.end_time is None:
+                self.end_time = self.time
+            if self.time - self.end_time >= self.end_grace:
+                raise ReplayFinished(f"Rekaman habis di t={self.end_time:.1f}s")
+            self.time += self._period
+            return
+        t, leg, mode, lat, lon, alt, dist = sample
+        location = SimLocation(lat, lon, alt)
+        if t > self.time:
+            self._period = t - self.time
+            self.groundspeed = self._step_distance(self.location.global_relative_frame, location) / self._period
+        self.time = t
+        self.samples += 1
+        if mode != self._mode.name:
+            self._mode = SimMode(mode)
+            pending = self._pending_mode
+            if pending is not None and pending["mode"] == mode:
+                pending["confirmed"] = t
+                self._pending_mode = None
+            self.notify_attribute_listeners("mode", self._mode)
+        self._track_leg(leg, t, dist)
+        self.location.global_relative_frame = location
+        self.location.notify_attribute_listeners("global_relative_frame", location)
+
+    def _track_leg(self, leg, t, dist):
+        # Sampel hover/loiter (dist NaN) tidak menggeser waktu tiba rekaman
+        if dist != dist:
+            return
+        span = self.recorded_legs.get(leg)
+        if span is None:
+            self.recorded_legs[leg] = [t, t]
+        else:
+            span[1] = t
+
+    def _on_wait_finished(self):
+        if self.legs and self.legs[-1]["arrival_t"] is None:
+            leg = self.legs[-1]
+            leg["arrival_t"] = self.time
+            leg["dist"] = get_distance(self.location.global_relative_frame, leg["target"])
+
+    def report(self):
+        """
+        Ringkasan keputusan replay.
+
+        Return:
+            dict - legs, mode_switches (dengan latency dan timeout), samples, duration
+        """
+        legs = []
+        for i, leg in enumerate(self.legs, start=1):
+            recorded = self.recorded_legs.get(i)
+            legs.append({
+                "leg": i,
+                "goto_t": leg["goto_t"],
+                "arrival_t": leg["arrival_t"],
+                "dist": leg["dist"],
+                "recorded_end": recorded[1] if recorded else None,
+            })
+        switches = []
+        for request in self.mode_switches:
+            latency = None
+            if request["confirmed"] is not None:
+                latency = request["confirmed"] - request["requested"]
+            switches.append(dict(request, latency=latency,
+                                 timeout=latency is None or latency > self.mode_timeout))
+        end = self.time if self.end_time is None else self.end_time
+        return {
+            "samples": self.samples,
+            "duration": end - self.start_time,
+            "legs": legs,
+            "mode_switches": switches,
+        }
+
+
+class _NullRecorder:
+    """Perekam telemetri yang membuang semua sampel (agar replay tidak mencetak)."""
+
+    def __init__(self, sample_interval):
+        self.sample_interval = sample_interval
+
+    def record(self, t, leg, mode, location, dist=float("nan")):
+        pass
+
+
+def replay_mission(source, mission, mode_timeout=10.0, quiet=True):
+    """
+    Menjalankan `mission` terhadap rekaman dan melaporkan keputusannya.
+
+    Selama replay, jam default diganti SimClock milik ReplayVehicle, sehingga
+    helper yang tidak menerima argumen `clock` (misalnya fungsi di skrip
+    contoh) juga mengikuti waktu rekaman.
+
+    Parameter:
+        source       : str atau iterable - path file rekaman, atau iterable sampel
+        mission      : fungsi (vehicle, clock) yang menjalankan helper misi
+        mode_timeout : float - batas konfirmasi mode untuk laporan (detik)
+        quiet        : bool - buang output print() dan telemetri helper
+
+    Return:
+        dict - hasil ReplayVehicle.report() ditambah `finished` (bool),
+               `error` (str atau None), dan `wall` (detik waktu nyata)
+    """
+    samples = iter_samples(source) if isinstance(source, (str, os.PathLike)) else source
+    vehicle = ReplayVehicle(samples, mode_timeout=mode_timeout)
+    clock = SimClock(vehicle)
+
+    previous_clock, previous_recorder = get_clock(), get_recorder()
+    set_default_clock(clock)
+    if quiet:
+        set_default_recorder(_NullRecorder(previous_recorder.sample_interval))
+    error = None
+    start = time.perf_counter()
+    try:
+        with contextlib.ExitStack() as stack:
+            if quiet:
+                devnull = stack.enter_context(open(os.devnull, "w"))
+                stack.enter_context(contextlib.redirect_stdout(devnull))
+            mission(vehicle, clock)
+    except ReplayFinished as exc:
+        error = str(exc)
+    finally:
+        set_default_clock(previous_clock)
+        set_default_recorder(previous_recorder)
+
+    report = vehicle.report()
+    report.update(finished=error is None, error=error, wall=time.perf_counter() - start)
+    return report
+
+
+def print_replay_report(report):
+    """Mencetak hasil replay_mission() dalam bentuk tabel."""
+    status = "selesai" if report["finished"] else f"TIDAK SELESAI ({report['error']})"
+    print(f"[REPLAY] {report['samples']} sampel, {report['duration']:.1f}s rekaman "
+          f"dalam {report['wall']:.2f}s | misi {status}")
+
+    print(f"  {'Leg':>4} {'goto':>9} {'tiba':>9} {'jarak':>7} {'rekaman':>9} {'selisih':>8}")
+    for leg in report["legs"]:
+        arrival = "-" if leg["arrival_t"] is None else f"{leg['arrival_t']:.1f}"
+        dist = "-" if leg["dist"] is None else f"{leg['dist']:.2f}"
+        recorded = "-" if leg["recorded_end"] is None else f"{leg['recorded_end']:.1f}"
+        delta = "-"
+        if leg["arrival_t"] is not None and leg["recorded_end"] is not None:
+            delta = f"{leg['arrival_t'] - leg['recorded_end']:+.1f}"
+        print(f"  {leg['leg']:>4} {leg['goto_t']:>9.1f} {arrival:>9} {dist:>7} {recorded:>9} {delta:>8}")
+
+    for switch in report["mode_switches"]:
+        if switch["latency"] is None:
+            result = "tidak pernah terkonfirmasi"
+        else:
+            result = f"terkonfirmasi setelah {switch['latency']:.2f}s"
+        flag = " [TIMEOUT]" if switch["timeout"] else ""
+        print(f"  [MODE] {switch['mode']} diminta t={switch['requested']:.1f}s, {result}{flag}")
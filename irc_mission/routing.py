@@ -0,0 +1,379 @@
+"""
+routing.py
+----------
+Optimasi urutan waypoint untuk memperpendek jarak (dan waktu) terbang.
+
+WAYPOINTS dan MISSION_WAYPOINTS diterbangkan sesuai urutan tulisan. Untuk
+misi inspeksi dengan ratusan titik tanpa urutan tertentu, itu boros baterai.
+optimize_route() menyusun ulang titik-titiknya:
+
+    1. nearest neighbour dari titik awal (posisi drone saat execute_waypoints
+       dimulai) sebagai rute awal
+    2. perbaikan 2-opt (membalik segmen rute) dan Or-opt (memindah 1-3 titik
+       berurutan ke tempat lain), hanya mencoba kandidat dari k tetangga
+       terdekat setiap titik
+
+Tetangga dicari dengan spatial index grid, sehingga ribuan titik tetap cepat
+tanpa matriks jarak n x n. Titik awal selalu tetap; titik akhir bisa bebas,
+tetap (waypoint terakhir), atau kembali ke home.
+
+Frame input mengikuti frames.py (parameter `frame` atau key `frame` per
+waypoint): relative-to-previous (default, sama seperti execute_waypoints),
+relative-to-home, atau absolute (butuh `home` untuk mengubah lat/lon ke
+meter). Semua titik diubah ke koordinat lokal dari titik awal sebelum
+dioptimasi. Output selalu frame relative-to-previous (key `frame` diisi
+eksplisit), dengan offset dihitung ulang untuk urutan baru.
+
+Contoh:
+    waypoints, report = optimize_route(INSPECTION_POINTS, return_home=True)
+    print_route_report(report)
+    execute_waypoints(vehicle, waypoints)
+"""
+
+import math
+import time
+
+from .auto_mission import normalize_waypoints
+from .distance import local_offset
+from .frames import FRAME_ABSOLUTE, FRAME_HOME, FRAME_PREVIOUS, FRAMES
+
+
+class GridIndex:
+    """
+    Spatial index grid seragam untuk titik 2D (north, east dalam meter).
+
+    Parameter:
+        points    : list of (north, east)
+        cell_size : float - ukuran sel (meter), None = otomatis dari kerapatan titik
+    """
+
+    def __init__(self, points, cell_size=None):
+        self.points = points
+        if cell_size is None:
+            if points:
+                norths = [p[0] for p in points]
+                easts = [p[1] for p in points]
+                area = max(max(norths) - min(norths), 1.0) * max(max(easts) - min(easts), 1.0)
+                cell_size = math.sqrt(area / len(points)) * 2
+            else:
+                cell_size = 1.0
+        self.cell_size = max(cell_size, 1e-6)
+        self.size = len(points)
+        self.cells = {}
+        for i, (north, east) in enumerate(points):
+            self.cells.setdefault(self._cell(north, east), []).append(i)
+
+    def _cell(self, north, east):
+        return int(math.floor(north / self.cell_size)), int(math.floor(east / self.cell_size))
+
+    def remove(self, i):
+        """Menghapus titik `i` dari index (dipakai saat nearest neighbour)."""
+        self.cells[self._cell(*self.points[i])].remove(i)
+        self.size -= 1
+
+    def nearest(self, north, east, k=1, cost=None):
+        """
+        k titik terdekat dari (north, east).
+
+        Parameter:
+            k    : int - jumlah titik
+            cost : fungsi (i) -> float, biaya ke titik i; default jarak horizontal.
+                   Harus >= jarak horizontal agar pencarian per cincin tetap benar.
+
+        Return:
+            list of (biaya, i) - terurut dari yang terdekat
+        """
+        cx, cy = self._cell(north, east)
+        if cost is None:
+            points = self.points
+
+            def cost(i):
+                return math.hypot(points[i][0] - north, points[i][1] - east)
+
+        found = []
+        remaining = self.size
+        ring = 0
+        while remaining > 0:
+            for dx in range(-ring, ring + 1):
+                for dy in range(-ring, ring + 1):
+                    if max(abs(dx), abs(dy)) != ring:
+                        continue
+                    for i in self.cells.get((cx + dx, cy + dy), ()):
+                        found.append((cost(i), i))
+                        remaining -= 1
+            # Titik di luar cincin ini minimal berjarak ring * cell_size
+            if len(found) >= k:
+                found.sort()
+                if found[k - 1][0] <= ring * self.cell_size:
+                    break
+            ring += 1
+        found.sort()
+        return found[:k]
+
+
+def _local_points(waypoints, start_altitude, frame=FRAME_PREVIOUS, home=None):
+    """
+    Ubah waypoint menjadi koordinat lokal (north, east, alt) dari titik awal.
+
+    Offset relative-to-previous dirangkai, relative-to-home dipakai langsung,
+    dan lat/lon frame absolute diproyeksikan terhadap `home` (lat, lon).
+    """
+    if frame not in FRAMES:
+        raise ValueError(f"Frame tidak dikenal: {frame!r} (pilih salah satu dari {FRAMES})")
+    north = east = 0.0
+    points = []
+    for i, wp in enumerate(waypoints):
+        wp_frame = wp.get("frame", frame)
+        if wp_frame == FRAME_PREVIOUS:
+            north += wp["d_north"]
+            east += wp["d_east"]
+        elif wp_frame == FRAME_HOME:
+            north, east = wp["d_north"], wp["d_east"]
+        elif wp_frame == FRAME_ABSOLUTE:
+            if home is None:
+                raise ValueError(f"{wp.get('name', f'WP{i + 1}')}: frame absolute butuh `home`")
+            north, east = local_offset(home[0], home[1], wp["lat"], wp["lon"])
+        else:
+            raise ValueError(f"{wp.get('name', f'WP{i + 1}')}: frame tidak dikenal {wp_frame!r}")
+        points.append((north, east, wp["altitude"]))
+    if start_altitude is None:
+        start_altitude = points[0][2] if points else 0.0
+    return points, (0.0, 0.0, start_altitude)
+
+
+def route_length(points, order, start, end=None, altitude_weight=0.0):
+    """
+    Panjang rute (meter) dari `start` melalui points[order] lalu ke `end` (opsional).
+
+    Biaya tiap leg = jarak horizontal + altitude_weight * |beda ketinggian|.
+    """
+    total = 0.0
+    previous = start
+    sequence = [points[i] for i in order] + ([end] if end is not None else [])
+    for point in sequence:
+        total += math.hypot(point[0] - previous[0], point[1] - previous[1])
+        total += altitude_weight * abs(point[2] - previous[2])
+        previous = point
+    return total
+
+
+def optimize_route(route, return_home=False, keep_first=False, keep_last=False,
+                   altitude_weight=0.0, neighbors=8, max_passes=50, start_altitude=None,
+                   cruise_speed=None, frame=FRAME_PREVIOUS, home=None):
+    """
+    Menyusun ulang waypoint agar total jarak terbang minimum.
+
+    Parameter:
+        route           : list of dict/tuple - waypoint format execute_waypoints/MISSION_WAYPOINTS
+        return_home     : bool - rute diakhiri kembali ke titik awal
+        keep_first      : bool - waypoint pertama tetap menjadi yang pertama
+        keep_last       : bool - waypoint terakhir tetap menjadi yang terakhir
+        altitude_weight : float - bobot biaya per meter perubahan ketinggian
+                          (0 = hanya jarak horizontal, 1 = naik 1 m setara terbang 1 m)
+        neighbors       : int - jumlah tetangga kandidat untuk 2-opt/Or-opt
+        max_passes      : int - batas putaran perbaikan
+        start_altitude  : float - ketinggian titik awal (default: ketinggian waypoint pertama)
+        cruise_speed    : float - kecepatan jelajah (m/s) untuk perkiraan waktu (opsional)
+        frame           : str - frame default waypoint tanpa key `frame` (lihat frames.py)
+        home            : LocationGlobalRelative atau tuple (lat, lon[, alt]) - titik awal,
+                          wajib jika ada waypoint frame absolute
+
+    Return:
+        tuple (waypoints, report)
+            waypoints : list of dict - urutan baru dalam frame relative-to-previous,
+                        offset dihitung ulang
+            report    : dict - order, original, seeded, optimized, saved, saved_pct,
+                        passes, elapsed, dan time_saved jika cruise_speed diisi
+    """
+    if keep_last and return_home:
+        raise ValueError("keep_last dan return_home tidak bisa dipakai bersamaan")
+
+    started = time.perf_counter()
+    waypoints = normalize_waypoints(route)
+    if home is not None and not isinstance(home, tuple):
+        home = (home.lat, home.lon, home.alt)
+    points, start = _local_points(waypoints, start_altitude, frame, home)
+    n = len(points)
+    end = start if return_home else None
+    original = route_length(points, range(n), start, end, altitude_weight)
+
+    # Node 0..n-1 = waypoint, n = titik awal, n+1 = titik akhir (home, atau
+    # node semu berbiaya 0 jika ujung rute bebas / waypoint terakhir dikunci)
+    coords = points + [start, start]
+    START, END = n, n + 1
+    norths = [p[0] for p in coords]
+    easts = [p[1] for p in coords]
+    alts = [p[2] * altitude_weight for p in coords]
+    open_end = not return_home
+    hypot = math.hypot
+
+    def cost(a, b):
+        if open_end and (a == END or b == END):
+            return 0.0
+        return hypot(norths[a] - norths[b], easts[a] - easts[b]) + abs(alts[a] - alts[b])
+
+    fixed_head = [START] + ([0] if keep_first and n else [])
+    fixed_tail = ([n - 1] if keep_last and n > (1 if keep_first else 0) else []) + [END]
+    free = [i for i in range(n) if i not in fixed_head and i not in fixed_tail]
+
+    index = GridIndex([(points[i][0], points[i][1]) for i in free])
+
+    # 1. Nearest neighbour
+    order = list(fixed_head)
+    for slot in range(len(free)):
+        here = coords[order[-1]]
+        best = index.nearest(here[0], here[1], 1,
+                             cost=lambda j, here=here: _leg_cost(here, points[free[j]], altitude_weight))
+        j = best[0][1]
+        index.remove(j)
+        order.append(free[j])
+    order.extend(fixed_tail)
+    seeded = _tour_cost(order, cost)
+
+    # 2. Daftar tetangga kandidat (dari index lengkap, tanpa titik yang dihapus)
+    full_index = GridIndex([(p[0], p[1]) for p in points])
+    candidates = [[j for _, j in full_index.nearest(p[0], p[1], neighbors + 1) if j != i]
+                  for i, p in enumerate(points)]
+
+    lo = len(fixed_head)              # posisi pertama yang boleh bergerak
+    hi = len(order) - len(fixed_tail)  # posisi setelah titik bebas terakhir
+    passes = 0
+    improved = True
+    while improved and passes < max_passes:
+        passes += 1
+        improved = _two_opt(order, candidates, cost, lo, hi)
+        improved = _or_opt(order, candidates, cost, lo, hi) or improved
+
+    optimized = _tour_cost(order, cost)
+
+    result = _to_waypoints(waypoints, points, start, [i for i in order if i < n])
+    report = {
+        "order": [i for i in order if i < n],
+        "original": original,
+        "seeded": seeded,
+        "optimized": optimized,
+        "saved": original - optimized,
+        "saved_pct": (original - optimized) / original * 100 if original else 0.0,
+        "passes": passes,
+        "elapsed": time.perf_counter() - started,
+    }
+    if cruise_speed:
+        report["time_saved"] = report["saved"] / cruise_speed
+    return result, report
+
+
+def _leg_cost(a, b, altitude_weight):
+    return math.hypot(a[0] - b[0], a[1] - b[1]) + altitude_weight * abs(a[2] - b[2])
+
+
+def _tour_cost(order, cost):
+    return sum(cost(a, b) for a, b in zip(order, order[1:]))
+
+
+def _two_opt(order, candidates, cost, lo, hi):
+    """
+    Perbaikan 2-opt dengan kandidat tetangga. Membalik order[i+1..j] jika lebih pendek.
+
+    Edge baru selalu (a, c) dengan c tetangga a. Karena kandidat terurut dari
+    yang terdekat, pencarian berhenti begitu cost(a, c) tidak lebih pendek dari
+    edge a yang akan dilepas (tidak mungkin ada perbaikan lagi).
+    """
+    position = {node: p for p, node in enumerate(order)}
+    improved_any = False
+    improved = True
+    while improved:
+        improved = False
+        for p in range(lo, hi):
+            a = order[p]
+            d_succ = cost(a, order[p + 1])
+            d_pred = cost(order[p - 1], a)
+            longest = max(d_succ, d_pred)
+            for c in candidates[a]:
+                d_ac = cost(a, c)
+                if d_ac >= longest:
+                    break
+                q = position[c]
+                low, high = min(p, q), max(p, q)
+                for i, j, removed in ((low, high, d_succ), (low - 1, high - 1, d_pred)):
+                    # Segmen yang dibalik order[i+1..j] harus seluruhnya bebas
+                    if d_ac >= removed or i + 1 < lo or j >= hi or i >= j:
+                        continue
+                    n1, n2, n3, n4 = order[i], order[i + 1], order[j], order[j + 1]
+                    delta = cost(n1, n3) + cost(n2, n4) - cost(n1, n2) - cost(n3, n4)
+                    if delta < -1e-9:
+                        order[i + 1:j + 1] = order[i + 1:j + 1][::-1]
+                        for k in range(i + 1, j + 1):
+                            position[order[k]] = k
+                        improved = improved_any = True
+                        break
+                else:
+                    continue
+                break
+    return improved_any
+
+
+def _or_opt(order, candidates, cost, lo, hi):
+    """Memindah segmen 1-3 titik ke antara titik tetangga lain (boleh terbalik)."""
+    improved = False
+    for length in (1, 2, 3):
+        position = {node: p for p, node in enumerate(order)}
+        for i in range(lo, hi - length + 1):
+            segment = order[i:i + length]
+            prev_node, next_node = order[i - 1], order[i + length]
+            first, last = segment[0], segment[-1]
+            gain = cost(prev_node, first) + cost(last, next_node) - cost(prev_node, next_node)
+            if gain <= 1e-9:
+                continue
+            best = None
+            for c in candidates[first] if length == 1 else candidates[first] + candidates[last]:
+                q = position[c]
+                for a_pos in (q - 1, q):
+                    b_pos = a_pos + 1
+                    # Sisipkan di antara order[a_pos] dan order[b_pos], di luar segmen
+                    if a_pos < lo - 1 or b_pos > hi or i - 1 <= a_pos < i + length:
+                        continue
+                    a, b = order[a_pos], order[b_pos]
+                    forward = cost(a, first) + cost(last, b)
+                    backward = cost(a, last) + cost(first, b)
+                    delta = min(forward, backward) - cost(a, b) - gain
+                    if delta < -1e-9 and (best is None or delta < best[0]):
+                        best = (delta, a_pos, backward < forward)
+            if best is None:
+                continue
+            _, a_pos, reverse = best
+            moved = segment[::-1] if reverse else segment
+            rest = order[:i] + order[i + length:]
+            insert_at = a_pos + 1 if a_pos < i else a_pos + 1 - length
+            order[:] = rest[:insert_at] + moved + rest[insert_at:]
+            position = {node: p for p, node in enumerate(order)}
+            improved = True
+    return improved
+
+
+def _to_waypoints(waypoints, points, start, order):
+    """Menyusun ulang dict waypoint dan menghitung ulang offset relative-to-previous."""
+    result = []
+    previous = start
+    for i in order:
+        point = points[i]
+        wp = dict(waypoints[i])
+        wp.pop("lat", None)
+        wp.pop("lon", None)
+        wp["frame"] = FRAME_PREVIOUS
+        wp["d_north"] = point[0] - previous[0]
+        wp["d_east"] = point[1] - previous[1]
+        result.append(wp)
+        previous = point
+    return result
+
+
+def print_route_report(report):
+    """Mencetak ringkasan hasil optimize_route()."""
+    print(f"[ROUTE] {len(report['order'])} waypoint | {report['passes']} putaran | "
+          f"{report['elapsed'] * 1000:.0f} ms")
+    print(f"  Urutan asli      : {report['original']:10.1f} m")
+    print(f"  Nearest neighbour: {report['seeded']:10.1f} m")
+    print(f"  Setelah 2-opt/Or : {report['optimized']:10.1f} m")
+    print(f"  Hemat            : {report['saved']:10.1f} m ({report['saved_pct']:.1f}%)")
+    if "time_saved" in report:
+        print(f"  Perkiraan waktu  : {report['time_saved']:10.1f} s lebih cepat")
@@ -0,0 +1,488 @@
+"""
+sim.py
+------
+Simulator vehicle ringan di dalam proses Python, untuk menguji misi tanpa SITL.
+
+SimVehicle meniru bagian API Vehicle DroneKit yang dipakai skrip-skrip bootcamp:
+`mode`, `armed`, `is_armable`, `simple_takeoff()`, `simple_goto()`,
+`location.global_relative_frame`, `battery`, `parameters`, `version`,
+attribute listener, dan message listener (GLOBAL_POSITION_INT, HEARTBEAT,
+SYS_STATUS). drop_link() memutus semua update ke listener untuk sementara,
+untuk menguji deteksi link putus dan reconnect. send_mavlink() menerima
+MAV_CMD_SET_MESSAGE_INTERVAL untuk GLOBAL_POSITION_INT dan HEARTBEAT
+(interval 0 = kembali ke rate awal).
+
+Model geraknya kinematik sederhana: kecepatan horizontal dibatasi `max_speed`
+dan percepatan `accel` (sehingga drone melambat saat mendekati target dan di
+setiap sudut), sedangkan ketinggian dibatasi laju naik/turun. Fisika dihitung
+dengan langkah waktu tetap `dt`, jadi hasilnya deterministik untuk urutan
+perintah yang sama. Baterai dikuras selama armed dengan daya hover ditambah
+komponen kecepatan dan laju naik (model yang sama dengan energy.py).
+
+Waktu simulasi bisa dijalankan dua cara:
+    - step()/advance(detik) secara manual (paling deterministik), atau
+    - start(speedup=100) di thread latar, 100x lebih cepat dari waktu nyata.
+
+Mode yang didukung: GUIDED, LOITER, BRAKE, LAND, RTL (mode lain = hold posisi).
+Misi AUTO (vehicle.commands) tidak disimulasikan.
+
+Contoh:
+    vehicle = SimVehicle().start(speedup=100)
+    arm_and_takeoff(vehicle, 10)
+    execute_waypoints(vehicle, WAYPOINTS)
+    vehicle.close()
+"""
+
+import math
+import threading
+import time
+from types import SimpleNamespace
+
+from .distance import local_offset, offset_degrees
+from .modes import COPTER_MODES
+
+ARMABLE_MODES = ("GUIDED", "LOITER", "STABILIZE", "ALT_HOLD", "BRAKE")
+MAV_MODE_FLAG_SAFETY_ARMED = 128
+
+# Baterai 4S: tegangan penuh/kosong (linier terhadap sisa energi, cukup untuk simulasi)
+BATTERY_FULL_V = 16.8
+BATTERY_EMPTY_V = 14.0
+GRAVITY = 9.81
+CLIMB_EFFICIENCY = 0.5
+
+SIM_VERSION = "APM:Copter-4.5.0 (SimVehicle)"
+
+MAV_CMD_SET_MESSAGE_INTERVAL = 511
+MSG_ID_HEARTBEAT = 0
+MSG_ID_GLOBAL_POSITION_INT = 33
+
+
+class SimLocation:
+    """Pengganti LocationGlobalRelative yang tidak bergantung pada dronekit."""
+
+    __slots__ = ("lat", "lon", "alt")
+
+    def __init__(self, lat, lon, alt):
+        self.lat = lat
+        self.lon = lon
+        self.alt = alt
+
+    def __str__(self):
+        return f"LocationGlobalRelative:lat={self.lat},lon={self.lon},alt={self.alt}"
+
+
+class SimMode:
+    """Pengganti VehicleMode: cukup punya atribut `name`."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"VehicleMode:{self.name}"
+
+
+class SimBattery:
+    """Pengganti objek Battery DroneKit: voltage (V), current (A), level (%)."""
+
+    __slots__ = ("voltage", "current", "level")
+
+    def __init__(self, voltage, current, level):
+        self.voltage = voltage
+        self.current = current
+        self.level = level
+
+    def __str__(self):
+        return f"Battery:voltage={self.voltage},current={self.current},level={self.level}"
+
+
+class SimMessageFactory:
+    """Pengganti vehicle.message_factory: cukup command_long_encode()."""
+
+    def command_long_encode(self, target_system, target_component, command, confirmation, *params):
+        return SimpleNamespace(command=command, confirmation=confirmation, params=params)
+
+
+class _Observable:
+    """Attribute listener ala DroneKit (`add_attribute_listener`, wildcard '*')."""
+
+    def __init__(self):
+        self._attribute_listeners = {}
+
+    def add_attribute_listener(self, attr_name, fn):
+        self._attribute_listeners.setdefault(attr_name, []).append(fn)
+
+    def remove_attribute_listener(self, attr_name, fn):
+        listeners = self._attribute_listeners.get(attr_name, [])
+        if fn in listeners:
+            listeners.remove(fn)
+
+    def notify_attribute_listeners(self, attr_name, value):
+        for key in (attr_name, "*"):
+            for fn in list(self._attribute_listeners.get(key, ())):
+                fn(self, attr_name, value)
+
+
+class SimLocations(_Observable):
+    """Pengganti `vehicle.location`."""
+
+    def __init__(self, location):
+        super().__init__()
+        self.global_relative_frame = location
+
+
+class SimVehicle(_Observable):
+    """
+    Vehicle simulasi dengan model kinematik dan jam virtual.
+
+    Parameter:
+        home_lat, home_lon : float - posisi home (derajat)
+        max_speed          : float - kecepatan horizontal maksimum (m/s)
+        accel              : float - percepatan/perlambatan horizontal (m/s²)
+        climb_rate         : float - laju naik dan turun di GUIDED (m/s)
+        land_speed         : float - laju turun mode LAND (m/s)
+        rtl_altitude       : float - ketinggian minimum saat RTL (meter)
+        armable_after      : float - detik simulasi sampai is_armable True (EKF/GPS siap)
+        mode_delay         : float - jeda perintah mode sampai terkonfirmasi (detik)
+        dt                 : float - langkah fisika (detik)
+        position_rate      : float - frekuensi update posisi ke listener (Hz)
+        battery_wh         : float - kapasitas baterai (Wh)
+        hover_power        : float - daya saat hover (watt)
+        cruise_power       : float - daya saat terbang datar di max_speed (watt)
+        mass_kg            : float - massa untuk daya tambahan saat naik (kg)
+        sysid              : int - system id di HEARTBEAT (SYSID_THISMAV)
+    """
+
+    def __init__(self, home_lat=-6.5569, home_lon=106.7308, max_speed=5.0, accel=2.5,
+                 climb_rate=2.5, land_speed=1.0, rtl_altitude=15.0, armable_after=2.0,
+                 mode_delay=0.3, dt=0.05, position_rate=10.0, battery_wh=80.0,
+                 hover_power=180.0, cruise_power=230.0, mass_kg=1.5, sysid=1):
+        super().__init__()
+        self.home_lat = home_lat
+        self.home_lon = home_lon
+        self.max_speed = max_speed
+        self.accel = accel
+        self.climb_rate = climb_rate
+        self.land_speed = land_speed
+        self.rtl_altitude = rtl_altitude
+        self.armable_after = armable_after
+        self.mode_delay = mode_delay
+        self.dt = dt
+        self.position_period = 1.0 / position_rate
+        self.battery_wh = battery_wh
+        self.hover_power = hover_power
+        self.cruise_power = cruise_power
+        self.mass_kg = mass_kg
+        self.sysid = sysid
+        self.version = SIM_VERSION
+        self.parameters = {
+            "SYSID_THISMAV": float(sysid), "RTL_ALT": rtl_altitude * 100.0,
+            "WPNAV_SPEED": max_speed * 100.0, "WPNAV_ACCEL": accel * 100.0,
+            "PILOT_SPEED_UP": climb_rate * 100.0, "LAND_SPEED": land_speed * 100.0,
+        }
+
+        self.time = 0.0
+        self.location = SimLocations(SimLocation(home_lat, home_lon, 0.0))
+        self._north = 0.0
+        self._east = 0.0
+        self._alt = 0.0
+        self._vel_north = 0.0
+        self._vel_east = 0.0
+        self._target = None          # (north, east) atau None = hold
+        self._target_alt = 0.0
+        self._mode = SimMode("STABILIZE")
+        self._pending_mode = None    # (nama, waktu_aktif)
+        self._armed = False
+        self._used_wh = 0.0
+        self._power = 0.0
+        self.battery = SimBattery(BATTERY_FULL_V, 0.0, 100)
+        self._message_listeners = {}
+        self._next_position = 0.0
+        self._next_heartbeat = 0.0
+        self.heartbeat_period = 1.0
+        self._default_periods = {MSG_ID_GLOBAL_POSITION_INT: self.position_period,
+                                 MSG_ID_HEARTBEAT: self.heartbeat_period}
+        self.message_factory = SimMessageFactory()
+        self._link_down_until = None
+
+        self._lock = threading.RLock()
+        self._thread = None
+        self._running = False
+
+    # --- Atribut ala DroneKit ---
+
+    @property
+    def mode(self):
+        return self._mode
+
+    @mode.setter
+    def mode(self, value):
+        with self._lock:
+            name = getattr(value, "name", value)
+            if not self.link_up:
+                return  # perintah hilang selama link putus
+            if self._pending_mode is not None and self._pending_mode[0] == name:
+                return  # perintah ulang untuk mode yang sama tidak mereset jeda
+            self._pending_mode = (name, self.time + self.mode_delay)
+
+    @property
+    def armed(self):
+        return self._armed
+
+    @armed.setter
+    def armed(self, value):
+        with self._lock:
+            if value and not (self.is_armable and self._mode.name in ARMABLE_MODES):
+                return  # flight controller menolak arm
+            if value != self._armed:
+                self._armed = bool(value)
+                self.notify_attribute_listeners("armed", self._armed)
+
+    @property
+    def is_armable(self):
+        return self.time >= self.armable_after
+
+    @property
+    def velocity(self):
+        return [self._vel_north, self._vel_east, 0.0]
+
+    @property
+    def groundspeed(self):
+        return math.hypot(self._vel_north, self._vel_east)
+
+    @property
+    def home_location(self):
+        return SimLocation(self.home_lat, self.home_lon, 0.0)
+
+    def simple_takeoff(self, altitude):
+        with self._lock:
+            if self._armed and self._mode.name == "GUIDED":
+                self._target = (self._north, self._east)
+                self._target_alt = altitude
+
+    def simple_goto(self, location, airspeed=None, groundspeed=None):
+        with self._lock:
+            if self._mode.name != "GUIDED" or not self.link_up:
+                return
+            self._target = self._to_local(location.lat, location.lon)
+            if location.alt is not None:
+                self._target_alt = location.alt
+
+    def add_message_listener(self, name, fn):
+        self._message_listeners.setdefault(name, []).append(fn)
+
+    def remove_message_listener(self, name, fn):
+        listeners = self._message_listeners.get(name, [])
+        if fn in listeners:
+            listeners.remove(fn)
+
+    def close(self):
+        self.stop()
+
+    def send_mavlink(self, message):
+        """
+        Menerima COMMAND_LONG dari message_factory. Hanya
+        MAV_CMD_SET_MESSAGE_INTERVAL untuk GLOBAL_POSITION_INT dan HEARTBEAT
+        yang diproses; perintah lain diabaikan.
+        """
+        with self._lock:
+            if not self.link_up or getattr(message, "command", None) != MAV_CMD_SET_MESSAGE_INTERVAL:
+                return
+            message_id, interval_us = int(message.params[0]), message.params[1]
+            if interval_us < 0:
+                return  # menghentikan stream tidak disimulasikan
+            if interval_us == 0:
+                period = self._default_periods.get(message_id)
+                if period is None:
+                    return
+            else:
+                period = max(self.dt, interval_us / 1e6)
+            if message_id == MSG_ID_GLOBAL_POSITION_INT:
+                self.position_period = period
+                self._next_position = min(self._next_position, self.time + period)
+            elif message_id == MSG_ID_HEARTBEAT:
+                self.heartbeat_period = period
+                self._next_heartbeat = min(self._next_heartbeat, self.time + period)
+
+    def drop_link(self, seconds):
+        """
+        Putuskan link selama `seconds` detik simulasi: fisika tetap berjalan dan
+        perintah yang sudah diterima tetap dijalankan, tetapi tidak ada update
+        atribut maupun pesan ke listener.
+        """
+        with self._lock:
+            self._link_down_until = self.time + seconds
+
+    @property
+    def link_up(self):
+        return self._link_down_until is None or self.time >= self._link_down_until
+
+    # --- Jam simulasi ---
+
+    def step(self):
+        """Majukan simulasi satu langkah `dt`."""
+        with self._lock:
+            self.time += self.dt
+            self._apply_pending_mode()
+            self._update_mode_targets()
+            self._integrate()
+            if self.link_up:
+                self._publish()
+
+    def advance(self, seconds):
+        """Majukan simulasi sebanyak `seconds` detik (dibulatkan ke kelipatan dt)."""
+        for _ in range(max(1, int(round(seconds / self.dt)))):
+            self.step()
+
+    def start(self, speedup=100.0):
+        """
+        Jalankan simulasi di thread latar.
+
+        Parameter:
+            speedup : float - kelipatan waktu nyata, None = secepat mungkin
+
+        Return:
+            self (agar bisa ditulis `vehicle = SimVehicle().start()`)
+        """
+        self._running = True
+        period = None if not speedup else self.dt / speedup
+
+        def loop():
+            while self._running:
+                self.step()
+                if period:
+                    time.sleep(period)
+                else:
+                    time.sleep(0)  # beri kesempatan thread lain
+
+        self._thread = threading.Thread(target=loop, name="SimVehicle", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    # --- Internal ---
+
+    def _to_local(self, lat, lon):
+        return local_offset(self.home_lat, self.home_lon, lat, lon)
+
+    def _apply_pending_mode(self):
+        if self._pending_mode is None or self.time < self._pending_mode[1]:
+            return
+        name = self._pending_mode[0]
+        self._pending_mode = None
+        if name == self._mode.name:
+            return
+        self._mode = SimMode(name)
+        if name in ("LOITER", "BRAKE", "GUIDED", "LAND"):
+            self._target = (self._north, self._east)
+            self._target_alt = self._alt
+        if self.link_up:
+            self.notify_attribute_listeners("mode", self._mode)
+
+    def _update_mode_targets(self):
+        name = self._mode.name
+        if name == "LAND":
+            self._target_alt = 0.0
+        elif name == "RTL":
+            if math.hypot(self._north, self._east) > 1.0:
+                self._target_alt = max(self._alt, self.rtl_altitude)
+                if self._alt >= self._target_alt - 0.5:
+                    self._target = (0.0, 0.0)
+            else:
+                self._target = (0.0, 0.0)
+                self._target_alt = 0.0
+
+    def _integrate(self):
+        if not self._armed:
+            self._vel_north = self._vel_east = 0.0
+            return
+
+        dt = self.dt
+        # Vertikal: dibatasi laju naik/turun
+        rate = self.land_speed if self._mode.name in ("LAND", "RTL") and self._target_alt == 0 \
+            else self.climb_rate
+        d_alt = self._target_alt - self._alt
+        climb = max(-rate * dt, min(rate * dt, d_alt))
+        self._alt += climb
+
+        # Horizontal: hanya bergerak jika sudah di udara
+        if self._target is not None and self._alt > 1.0:
+            d_north = self._target[0] - self._north
+            d_east = self._target[1] - self._east
+            dist = math.hypot(d_north, d_east)
+            if dist > 1e-3:
+                speed = min(self.max_speed, math.sqrt(2 * self.accel * dist))
+                want_north = d_north / dist * speed
+                want_east = d_east / dist * speed
+            else:
+                want_north = want_east = 0.0
+            dv_north = want_north - self._vel_north
+            dv_east = want_east - self._vel_east
+            dv = math.hypot(dv_north, dv_east)
+            max_dv = self.accel * dt
+            if dv > max_dv:
+                dv_north *= max_dv / dv
+                dv_east *= max_dv / dv
+            self._vel_north += dv_north
+            self._vel_east += dv_east
+            self._north += self._vel_north * dt
+            self._east += self._vel_east * dt
+        else:
+            self._vel_north = self._vel_east = 0.0
+
+        # Daya: hover + komponen kecepatan horizontal + energi potensial saat naik
+        speed = math.hypot(self._vel_north, self._vel_east) / self.max_speed
+        self._power = (self.hover_power + (self.cruise_power - self.hover_power) * speed * speed
+                       + self.mass_kg * GRAVITY * max(climb, 0.0) / dt / CLIMB_EFFICIENCY)
+        self._used_wh += self._power * dt / 3600.0
+
+        if self._alt <= 0.0 and self._target_alt <= 0.0:
+            self._alt = 0.0
+            if self._mode.name in ("LAND", "RTL"):
+                self._armed = False
+                self.notify_attribute_listeners("armed", False)
+
+    def _publish(self):
+        if self.time + 1e-9 >= self._next_position:
+            self._next_position = self.time + self.position_period
+            d_lat, d_lon = offset_degrees(self.home_lat, self._north, self._east)
+            lat, lon = self.home_lat + d_lat, self.home_lon + d_lon
+            location = SimLocation(lat, lon, self._alt)
+            self.location.global_relative_frame = location
+            self.location.notify_attribute_listeners("global_relative_frame", location)
+            self.notify_attribute_listeners("location", self.location)
+            self._emit("GLOBAL_POSITION_INT", SimpleNamespace(
+                time_boot_ms=int(self.time * 1000), lat=int(lat * 1e7), lon=int(lon * 1e7),
+                relative_alt=int(self._alt * 1000),
+                vx=int(self._vel_north * 100), vy=int(self._vel_east * 100), vz=0,
+            ))
+        if self.time + 1e-9 >= self._next_heartbeat:
+            self._next_heartbeat = self.time + self.heartbeat_period
+            self._publish_battery()
+            self._emit("HEARTBEAT", SimpleNamespace(
+                custom_mode=COPTER_MODES.get(self._mode.name, 0),
+                base_mode=MAV_MODE_FLAG_SAFETY_ARMED if self._armed else 0,
+                get_srcSystem=lambda: self.sysid,
+            ))
+
+    def _publish_battery(self):
+        charge = max(0.0, 1.0 - self._used_wh / self.battery_wh)
+        voltage = BATTERY_EMPTY_V + (BATTERY_FULL_V - BATTERY_EMPTY_V) * charge
+        current = self._power / voltage if self._armed else 0.0
+        self.battery = SimBattery(round(voltage, 3), round(current, 2), int(charge * 100))
+        self.notify_attribute_listeners("battery", self.battery)
+        self._emit("SYS_STATUS", SimpleNamespace(
+            voltage_battery=int(voltage * 1000), current_battery=int(current * 100),
+            battery_remaining=self.battery.level,
+        ))
+
+    def _emit(self, name, message):
+        for key in (name, "*"):
+            for fn in list(self._message_listeners.get(key, ())):
+                fn(self, name, message)
@@ -0,0 +1,157 @@
+"""
+snapshot.py
+-----------
+Snapshot telemetri immutable yang diperbarui dari thread pesan MAVLink.
+
+Di DroneKit, setiap akses `vehicle.location.global_relative_frame` membuat
+objek LocationGlobalRelative baru. Loop yang membaca posisi dua-tiga kali
+per iterasi (jarak, lalu alt, lalu log) membayar alokasi itu berkali-kali,
+dan nilainya bisa berasal dari update yang berbeda jika pesan baru datang
+di antara dua akses.
+
+TelemetryFeed membangun satu TelemetrySnapshot per pesan GLOBAL_POSITION_INT
+(dan saat mode/armed berubah) langsung dari field integer pesan, lalu
+menukar referensi `latest`. Penukaran referensi bersifat atomik, dan
+snapshot tidak bisa diubah setelah dibuat, jadi loop cukup mengambil
+`feed.latest` sekali per tick: satu pembacaan atribut tanpa alokasi, dan
+semua field konsisten dari update yang sama.
+
+Snapshot punya atribut `lat`, `lon`, `alt`, jadi bisa langsung dipakai di
+get_offset_location(), get_distance(), dan fungsi jarak distance.py.
+
+Contoh:
+    with TelemetryFeed(vehicle) as feed:
+        for _ in range(10):
+            snap = feed.latest
+            print(f"{snap.mode} | lat={snap.lat:.6f}, lon={snap.lon:.6f}, alt={snap.alt:.2f}m")
+            sleep(1)
+"""
+
+import math
+import threading
+
+from .clock import get_clock
+
+_set = object.__setattr__
+
+
+class TelemetrySnapshot:
+    """
+    Satu keadaan telemetri yang konsisten, tidak bisa diubah.
+
+    Atribut:
+        seq   : int - nomor urut update (naik setiap snapshot baru)
+        t     : float - waktu diterima menurut jam feed (detik)
+        lat   : float - lintang (derajat)
+        lon   : float - bujur (derajat)
+        alt   : float - ketinggian relatif home (meter)
+        vn    : float - kecepatan ke utara (m/s)
+        ve    : float - kecepatan ke timur (m/s)
+        mode  : str - nama mode terbang
+        armed : bool
+    """
+
+    __slots__ = ("seq", "t", "lat", "lon", "alt", "vn", "ve", "mode", "armed")
+
+    def __init__(self, seq, t, lat, lon, alt, vn, ve, mode, armed):
+        _set(self, "seq", seq)
+        _set(self, "t", t)
+        _set(self, "lat", lat)
+        _set(self, "lon", lon)
+        _set(self, "alt", alt)
+        _set(self, "vn", vn)
+        _set(self, "ve", ve)
+        _set(self, "mode", mode)
+        _set(self, "armed", armed)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"TelemetrySnapshot tidak bisa diubah ({name})")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"TelemetrySnapshot tidak bisa diubah ({name})")
+
+    @property
+    def groundspeed(self):
+        return math.hypot(self.vn, self.ve)
+
+    def replace(self, seq, t, **changes):
+        """Snapshot baru dengan beberapa field diganti."""
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(changes, seq=seq, t=t)
+        return TelemetrySnapshot(**fields)
+
+    def __repr__(self):
+        return (f"TelemetrySnapshot(seq={self.seq}, t={self.t:.2f}, lat={self.lat:.7f}, "
+                f"lon={self.lon:.7f}, alt={self.alt:.2f}, mode={self.mode}, armed={self.armed})")
+
+    def __str__(self):
+        return f"LocationGlobalRelative:lat={self.lat},lon={self.lon},alt={self.alt}"
+
+
+class TelemetryFeed:
+    """
+    Menjaga `latest`: TelemetrySnapshot terbaru dari vehicle.
+
+    Posisi dan kecepatan dibaca dari pesan GLOBAL_POSITION_INT (lat/lon 1e7,
+    relative_alt mm, vx/vy cm/s); mode dan armed dari attribute listener.
+    Listener bisa dipanggil dari thread yang berbeda (misalnya SimVehicle yang
+    dimajukan beberapa thread), jadi penulisan `latest` dijaga lock agar
+    update mode tidak tertimpa update posisi. Pembaca tidak perlu lock:
+    cukup mengambil `feed.latest`.
+
+    Parameter:
+        vehicle : objek Vehicle DroneKit
+        clock   : jam untuk stempel waktu snapshot (default: jam default)
+    """
+
+    def __init__(self, vehicle, clock=None):
+        self.vehicle = vehicle
+        self.clock = get_clock(clock, vehicle)
+        self.latest = None
+        self._lock = threading.Lock()
+        self._started = False
+
+    def start(self):
+        if self._started:
+            return self
+        pos = self.vehicle.location.global_relative_frame
+        self.latest = TelemetrySnapshot(0, self.clock.now(), pos.lat, pos.lon, pos.alt or 0.0,
+                                        0.0, 0.0, self.vehicle.mode.name, bool(self.vehicle.armed))
+        self.vehicle.add_message_listener("GLOBAL_POSITION_INT", self._on_position)
+        self.vehicle.add_attribute_listener("mode", self._on_mode)
+        self.vehicle.add_attribute_listener("armed", self._on_armed)
+        self._started = True
+        return self
+
+    def stop(self):
+        if self._started:
+            self.vehicle.remove_message_listener("GLOBAL_POSITION_INT", self._on_position)
+            self.vehicle.remove_attribute_listener("mode", self._on_mode)
+            self.vehicle.remove_attribute_listener("armed", self._on_armed)
+            self._started = False
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def _on_position(self, _vehicle, _name, message):
+        with self._lock:
+            last = self.latest
+            self.latest = TelemetrySnapshot(
+                last.seq + 1, self.clock.now(), message.lat / 1e7, message.lon / 1e7,
+                message.relative_alt / 1000.0, message.vx / 100.0, message.vy / 100.0,
+                last.mode, last.armed,
+            )
+
+    def _on_mode(self, _vehicle, _name, mode):
+        with self._lock:
+            last = self.latest
+            self.latest = last.replace(last.seq + 1, self.clock.now(), mode=mode.name)
+
+    def _on_armed(self, _vehicle, _name, armed):
+        with self._lock:
+            last = self.latest
+            self.latest = last.replace(last.seq + 1, self.clock.now(), armed=bool(armed))
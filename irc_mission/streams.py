@@ -0,0 +1,277 @@
+"""
+streams.py
+----------
+Pengaturan rate stream MAVLink per fase misi.
+
+Loop tiba di goto() hanya bisa bereaksi secepat pesan posisi datang, tetapi
+stream rate bawaan SITL/ArduPilot seragam untuk seluruh penerbangan.
+StreamRateController meminta rate per pesan dengan MAV_CMD_SET_MESSAGE_INTERVAL
+sesuai fase:
+
+    - cruise   : di tengah leg, posisi cukup jarang (hemat bandwidth link)
+    - approach : dalam `approach_distance` dari target, posisi dan HEARTBEAT rapat
+    - hover    : diam di titik, posisi jarang
+    - landing  : turun ke tanah, posisi rapat
+
+goto()/execute_waypoints() memberi tahu awal setiap leg (begin_leg); fase
+approach dideteksi sendiri oleh controller di listener posisi, jadi rate naik
+tepat saat drone masuk radius approach, bukan pada sampel telemetri
+berikutnya. Perintah hanya dikirim untuk pesan yang rate-nya berubah.
+
+Setiap pesan yang dipantau dicatat jeda antar kedatangannya per fase, untuk
+laporan rate teramati dan jitter (simpangan baku jeda) di print_stream_report().
+Jeda juga masuk histogram registry `stream.<PESAN>`.
+
+Contoh:
+    with StreamRateController(vehicle) as streams:
+        arm_and_takeoff(vehicle, 10)
+        execute_waypoints(vehicle, WAYPOINTS, streams=streams)
+        land(vehicle, streams=streams)
+    print_stream_report(streams)
+"""
+
+import math
+import threading
+
+from .clock import get_clock
+from .metrics import get_histogram
+
+PHASE_CRUISE = "cruise"
+PHASE_APPROACH = "approach"
+PHASE_HOVER = "hover"
+PHASE_LANDING = "landing"
+PHASES = (PHASE_CRUISE, PHASE_APPROACH, PHASE_HOVER, PHASE_LANDING)
+
+MAV_CMD_SET_MESSAGE_INTERVAL = 511
+
+# ID pesan MAVLink common untuk pesan yang bisa diatur rate-nya
+MESSAGE_IDS = {
+    "HEARTBEAT": 0,
+    "SYS_STATUS": 1,
+    "ATTITUDE": 30,
+    "GLOBAL_POSITION_INT": 33,
+    "VFR_HUD": 74,
+}
+
+# Rate (Hz) per fase; pesan yang tidak disebut tidak diubah
+DEFAULT_RATES = {
+    PHASE_CRUISE: {"GLOBAL_POSITION_INT": 4.0, "HEARTBEAT": 1.0},
+    PHASE_APPROACH: {"GLOBAL_POSITION_INT": 20.0, "HEARTBEAT": 2.0},
+    PHASE_HOVER: {"GLOBAL_POSITION_INT": 2.0, "HEARTBEAT": 1.0},
+    PHASE_LANDING: {"GLOBAL_POSITION_INT": 10.0, "HEARTBEAT": 2.0},
+}
+
+
+def set_message_interval(vehicle, message, rate_hz):
+    """
+    Meminta flight controller mengirim `message` dengan rate tertentu.
+
+    Parameter:
+        vehicle : objek Vehicle DroneKit
+        message : str - nama pesan (key MESSAGE_IDS)
+        rate_hz : float - rate yang diminta, 0 = hentikan stream pesan itu,
+                  None = kembali ke rate bawaan flight controller
+    """
+    if rate_hz is None:
+        interval_us = 0
+    else:
+        interval_us = int(1e6 / rate_hz) if rate_hz > 0 else -1
+    msg = vehicle.message_factory.command_long_encode(
+        0, 0, MAV_CMD_SET_MESSAGE_INTERVAL, 0,
+        MESSAGE_IDS[message], interval_us, 0, 0, 0, 0, 0,
+    )
+    vehicle.send_mavlink(msg)
+
+
+class _StreamStats:
+    """Akumulator jeda antar pesan: banyak jeda, total, total kuadrat, maksimum."""
+
+    __slots__ = ("count", "total", "total_sq", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.max = 0.0
+
+    def add(self, gap):
+        self.count += 1
+        self.total += gap
+        self.total_sq += gap * gap
+        if gap > self.max:
+            self.max = gap
+
+    @property
+    def rate(self):
+        return self.count / self.total if self.total > 0 else float("nan")
+
+    @property
+    def jitter(self):
+        if self.count < 2:
+            return float("nan")
+        mean = self.total / self.count
+        return math.sqrt(max(0.0, self.total_sq / self.count - mean * mean))
+
+
+class StreamRateController:
+    """
+    Mengganti rate stream MAVLink sesuai fase misi dan mencatat rate teramati.
+
+    Parameter:
+        vehicle           : objek Vehicle DroneKit
+        rates             : dict fase -> {nama pesan: Hz} (default DEFAULT_RATES)
+        approach_distance : float - jarak ke target untuk masuk fase approach (meter)
+        clock             : jam untuk stempel waktu pesan (default: jam default)
+    """
+
+    def __init__(self, vehicle, rates=None, approach_distance=10.0, clock=None):
+        self.vehicle = vehicle
+        self.rates = rates if rates is not None else DEFAULT_RATES
+        self.approach_distance = approach_distance
+        self.clock = get_clock(clock, vehicle)
+        self.messages = sorted({name for phase in self.rates.values() for name in phase})
+        self.phase = None
+        self.requested = {}
+        self.changes = 0
+        self.stats = {}
+        self._histograms = {name: get_histogram(f"stream.{name}") for name in self.messages}
+        self._last = {}
+        self._target = None
+        self._distance_fn = None
+        self._lock = threading.Lock()
+        self._started = False
+
+    def start(self):
+        if not self._started:
+            for name in self.messages:
+                self.vehicle.add_message_listener(name, self._on_message)
+            self.vehicle.location.add_attribute_listener("global_relative_frame", self._on_position)
+            self._started = True
+        return self
+
+    def _detach(self):
+        if self._started:
+            for name in self.messages:
+                self.vehicle.remove_message_listener(name, self._on_message)
+            self.vehicle.location.remove_attribute_listener("global_relative_frame", self._on_position)
+            self._started = False
+
+    def stop(self):
+        """Lepas listener dan kembalikan pesan yang pernah diatur ke rate bawaan."""
+        self._detach()
+        with self._lock:
+            requested, self.requested = self.requested, {}
+            self.phase = None
+            self._target = None
+        for name in requested:
+            set_message_interval(self.vehicle, name, None)
+        if requested:
+            print("[STREAM] Rate bawaan dipulihkan: " + ", ".join(requested))
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def set_phase(self, phase):
+        """Pindah fase dan kirim SET_MESSAGE_INTERVAL untuk rate yang berubah."""
+        with self._lock:
+            if phase == self.phase:
+                return
+            self.phase = phase
+            if phase != PHASE_CRUISE:
+                self._target = None
+            # Jeda yang melintasi pergantian rate tidak dihitung ke fase mana pun
+            self._last.clear()
+            changed = {name: hz for name, hz in self.rates.get(phase, {}).items()
+                       if self.requested.get(name) != hz}
+            self.requested.update(changed)
+            self.changes += len(changed)
+        for name, hz in changed.items():
+            set_message_interval(self.vehicle, name, hz)
+        if changed:
+            print(f"[STREAM] Fase {phase}: "
+                  + ", ".join(f"{name} {hz:g}Hz" for name, hz in changed.items()))
+
+    def rebind(self, vehicle):
+        """
+        Pindah ke `vehicle` lain (misalnya koneksi baru setelah reconnect) dan
+        kirim ulang rate fase saat ini, karena koneksi baru mulai lagi dari
+        rate bawaan flight controller. Vehicle lama tidak dikirimi perintah.
+        """
+        started = self._started
+        self._detach()
+        self.vehicle = vehicle
+        if started:
+            self.start()
+        with self._lock:
+            rates = dict(self.rates.get(self.phase, {}))
+            self.requested = dict(rates)
+            self._last.clear()
+        for name, hz in rates.items():
+            set_message_interval(self.vehicle, name, hz)
+
+    def begin_leg(self, target, distance_fn):
+        """Awal leg menuju `target`: fase cruise sampai masuk radius approach."""
+        self.set_phase(PHASE_CRUISE)
+        with self._lock:
+            self._distance_fn = distance_fn
+            self._target = target
+
+    def _on_position(self, _locations, _name, location):
+        target = self._target
+        if target is None or self.phase != PHASE_CRUISE:
+            return
+        if self._distance_fn(location, target) <= self.approach_distance:
+            self.set_phase(PHASE_APPROACH)
+
+    def _on_message(self, _vehicle, name, _message):
+        now = self.clock.now()
+        with self._lock:
+            last = self._last.get(name)
+            self._last[name] = now
+            if last is None or self.phase is None:
+                return
+            gap = now - last
+            stats = self.stats.get((self.phase, name))
+            if stats is None:
+                stats = self.stats[(self.phase, name)] = _StreamStats()
+            stats.add(gap)
+        self._histograms[name].record(gap)
+
+    def report(self):
+        """
+        Rate teramati per fase dan pesan.
+
+        Return:
+            list of dict - phase, message, requested (Hz), rate (Hz), jitter (detik),
+            max_gap (detik), samples
+        """
+        with self._lock:
+            items = list(self.stats.items())
+        order = {phase: i for i, phase in enumerate(PHASES)}
+        rows = []
+        for (phase, name), stats in sorted(items, key=lambda item: (order.get(item[0][0], len(order)),
+                                                                    item[0])):
+            rows.append({
+                "phase": phase,
+                "message": name,
+                "requested": self.rates.get(phase, {}).get(name),
+                "rate": stats.rate,
+                "jitter": stats.jitter,
+                "max_gap": stats.max,
+                "samples": stats.count,
+            })
+        return rows
+
+
+def print_stream_report(controller):
+    """Mencetak rate diminta vs teramati dan jitter per fase."""
+    print(f"[STREAM] {controller.changes} perubahan rate")
+    print(f"  {'fase':<9} {'pesan':<20} {'minta':>7} {'teramati':>9} {'jitter':>9} {'maks':>8} {'n':>6}")
+    for row in controller.report():
+        requested = f"{row['requested']:g}Hz" if row["requested"] is not None else "-"
+        print(f"  {row['phase']:<9} {row['message']:<20} {requested:>7} {row['rate']:>7.1f}Hz "
+              f"{row['jitter'] * 1e3:>7.1f}ms {row['max_gap'] * 1e3:>6.0f}ms {row['samples']:>6}")
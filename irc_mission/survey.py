@@ -0,0 +1,337 @@
+"""
+survey.py
+---------
+Generator pola survey/coverage: lawnmower (isi poligon), spiral ke dalam,
+dan expanding square.
+
+Pola di modul 03 (kotak, segitiga, zigzag) dibuat manual. Untuk pemetaan,
+jarak antar lintasan ditentukan lebar footprint sensor di tanah dan overlap
+samping:
+
+    spacing = footprint * (1 - overlap)
+
+Poligon ditulis dalam meter lokal (north, east) relatif terhadap home,
+sama seperti offset waypoint. Semua perhitungan geometri dilakukan dengan
+array NumPy (potongan garis sapuan x sisi poligon sekaligus), jadi lahan
+berukuran kilometer selesai dalam hitungan milidetik.
+
+Output berupa list dict format WAYPOINTS, siap untuk execute_waypoints(),
+compile_plan(), save_mission(), atau optimize_route():
+    frame relative-to-previous (default) : d_north/d_east berantai dari `start`
+    frame relative-to-home               : d_north/d_east = koordinat lokal titik
+
+Modul ini membutuhkan NumPy dan tidak diimpor otomatis oleh `irc_mission`.
+
+Contoh:
+    field = [(0, 0), (0, 300), (200, 350), (250, 0)]
+    waypoints = lawnmower(field, altitude=40, footprint=camera_footprint(40), overlap=0.3)
+    execute_waypoints(vehicle, waypoints)
+"""
+
+import numpy as np
+
+from .frames import FRAME_HOME, FRAME_PREVIOUS
+
+
+def camera_footprint(altitude, sensor_width=6.17, focal_length=4.5):
+    """
+    Lebar footprint kamera nadir di tanah (meter).
+
+    Parameter:
+        altitude     : float - ketinggian di atas tanah (meter)
+        sensor_width : float - lebar sensor (mm), default sensor 1/2.3"
+        focal_length : float - panjang fokus lensa (mm)
+    """
+    return altitude * sensor_width / focal_length
+
+
+def line_spacing(footprint, overlap):
+    """
+    Jarak antar lintasan (meter) untuk footprint dan overlap samping.
+
+    Parameter:
+        footprint : float - lebar footprint sensor di tanah (meter)
+        overlap   : float - overlap samping, 0 <= overlap < 1
+    """
+    if not 0 <= overlap < 1:
+        raise ValueError(f"overlap harus 0 <= overlap < 1, bukan {overlap}")
+    if footprint <= 0:
+        raise ValueError(f"footprint harus > 0, bukan {footprint}")
+    return footprint * (1 - overlap)
+
+
+def _spacing(spacing, footprint, overlap):
+    if spacing is None:
+        if footprint is None:
+            raise ValueError("Isi spacing, atau footprint (dan overlap)")
+        return line_spacing(footprint, overlap)
+    if spacing <= 0:
+        raise ValueError(f"spacing harus > 0, bukan {spacing}")
+    return float(spacing)
+
+
+def _polygon(polygon):
+    """Array (N, 2) north, east berlawanan arah jarum jam (dilihat dari atas: north ke atas, east ke kanan)."""
+    points = np.asarray(polygon, dtype=float)
+    if points.ndim != 2 or points.shape[1] != 2 or len(points) < 3:
+        raise ValueError("Poligon harus berisi minimal 3 titik (north, east)")
+    if np.allclose(points[0], points[-1]):
+        points = points[:-1]
+    # Luas bertanda dalam sistem (x=east, y=north); positif = berlawanan jarum jam
+    east, north = points[:, 1], points[:, 0]
+    area = 0.5 * np.sum(east * np.roll(north, -1) - np.roll(east, -1) * north)
+    if abs(area) < 1e-9:
+        raise ValueError("Luas poligon nol")
+    return points if area > 0 else points[::-1]
+
+
+def _to_waypoints(north, east, altitude, prefix, frame, start, hover):
+    if frame == FRAME_PREVIOUS:
+        d_north = np.diff(north, prepend=start[0])
+        d_east = np.diff(east, prepend=start[1])
+        extra = {}
+    elif frame == FRAME_HOME:
+        d_north, d_east = north, east
+        extra = {"frame": FRAME_HOME}
+    else:
+        raise ValueError(f"Frame survey harus {FRAME_PREVIOUS!r} atau {FRAME_HOME!r}, bukan {frame!r}")
+    # + 0.0 mengubah -0.0 menjadi 0.0 agar output rapi
+    d_north = (np.round(d_north, 3) + 0.0).tolist()
+    d_east = (np.round(d_east, 3) + 0.0).tolist()
+    if hover:
+        extra["hover"] = hover
+    return [
+        {"name": f"{prefix}{i}", "d_north": dn, "d_east": de, "altitude": altitude, **extra}
+        for i, (dn, de) in enumerate(zip(d_north, d_east), start=1)
+    ]
+
+
+def sweep_lines(polygon, spacing, angle=None):
+    """
+    Titik masuk/keluar garis sapuan lawnmower di dalam poligon.
+
+    Garis sapuan sejajar arah `angle` dan berjarak `spacing`; garis pertama
+    dan terakhir berada spacing/2 dari tepi, jadi footprint menutup batas
+    lahan. Arah tiap garis bergantian (boustrophedon). Pada poligon cekung,
+    satu garis bisa terpotong menjadi beberapa segmen; semuanya diikuti
+    berurutan di garis yang sama.
+
+    Parameter:
+        polygon : list of (north, east) - batas lahan (meter)
+        spacing : float - jarak antar garis (meter)
+        angle   : float - arah sapuan dalam derajat dari utara searah jarum jam;
+                  None = sejajar sisi terpanjang poligon
+
+    Return:
+        array (M, 2) - titik (north, east) berurutan
+    """
+    points = _polygon(polygon)
+    edges = np.roll(points, -1, axis=0) - points
+    if angle is None:
+        longest = np.argmax(np.hypot(edges[:, 0], edges[:, 1]))
+        angle = np.degrees(np.arctan2(edges[longest, 1], edges[longest, 0]))
+
+    # Putar agar arah sapuan menjadi sumbu u; garis sapuan = v konstan
+    theta = np.radians(angle)
+    along = np.array([np.cos(theta), np.sin(theta)])    # (north, east)
+    across = np.array([-np.sin(theta), np.cos(theta)])
+    u = points @ along
+    v = points @ across
+
+    v_min, v_max = v.min(), v.max()
+    count = max(int(np.ceil((v_max - v_min) / spacing - 1e-9)), 1)
+    lines = v_min + (v_max - v_min - (count - 1) * spacing) / 2 + spacing * np.arange(count)
+
+    # Perpotongan setiap garis (L,) dengan setiap sisi (E,) sekaligus: matriks (L, E)
+    v1, v2 = v, np.roll(v, -1)
+    u1, u2 = u, np.roll(u, -1)
+    low, high = np.minimum(v1, v2), np.maximum(v1, v2)
+    level = lines[:, None]
+    # Sisi dihitung setengah-terbuka [low, high) agar verteks tidak terhitung dua kali
+    hit = (level >= low) & (level < high)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (level - v1) / (v2 - v1)
+    cross_u = np.where(hit, u1 + t * (u2 - u1), np.nan)
+
+    # Garis ganjil disapu berlawanan arah: urutkan berdasarkan u * arah, NaN di belakang
+    direction = np.where(np.arange(count) % 2 == 0, 1.0, -1.0)[:, None]
+    keyed = np.sort(cross_u * direction, axis=1) * direction
+    valid = ~np.isnan(keyed)
+    rows = np.broadcast_to(lines[:, None], keyed.shape)
+    su, sv = keyed[valid], rows[valid]
+    return np.outer(su, along) + np.outer(sv, across)
+
+
+def lawnmower(polygon, altitude, spacing=None, footprint=None, overlap=0.2, angle=None,
+              frame=FRAME_PREVIOUS, start=(0.0, 0.0), prefix="S", hover=0):
+    """
+    Pola lawnmower (boustrophedon) yang mengisi poligon.
+
+    Parameter:
+        polygon   : list of (north, east) - batas lahan dalam meter dari home
+        altitude  : float - ketinggian terbang (meter)
+        spacing   : float - jarak antar lintasan (meter); jika None dihitung dari
+                    footprint dan overlap
+        footprint : float - lebar footprint sensor di tanah (meter)
+        overlap   : float - overlap samping (0..1)
+        angle     : float - arah lintasan (derajat dari utara), None = sisi terpanjang
+        frame     : str - relative-to-previous atau relative-to-home
+        start     : tuple (north, east) - posisi awal untuk offset waypoint pertama
+        prefix    : str - awalan nama waypoint
+        hover     : float - hover di setiap waypoint (detik)
+
+    Return:
+        list of dict - format WAYPOINTS
+    """
+    path = sweep_lines(polygon, _spacing(spacing, footprint, overlap), angle)
+    return _to_waypoints(path[:, 0], path[:, 1], altitude, prefix, frame, start, hover)
+
+
+def _offset_ring(points, directions, normals, distance):
+    """Verteks poligon dari garis-garis sisi yang digeser `distance` ke dalam."""
+    shifted = points + normals * distance
+    prev_points, prev_dirs = np.roll(shifted, 1, axis=0), np.roll(directions, 1, axis=0)
+    # Perpotongan garis sisi sebelumnya dan sisi ini (cross product 2D)
+    denom = prev_dirs[:, 0] * directions[:, 1] - prev_dirs[:, 1] * directions[:, 0]
+    delta = shifted - prev_points
+    s = (delta[:, 0] * directions[:, 1] - delta[:, 1] * directions[:, 0]) / denom
+    return prev_points + prev_dirs * s[:, None]
+
+
+def _inset(points, directions, normals, distance):
+    """
+    Poligon hasil menggeser semua sisi `distance` ke dalam. Sisi yang habis
+    (arahnya berbalik) dibuang, sehingga poligon tidak beraturan tetap
+    menyusut dengan benar.
+
+    Return:
+        tuple (ring, points, directions, normals) - ring None jika poligon habis;
+        sisi yang tersisa dipakai lagi untuk inset yang lebih dalam
+    """
+    while len(points) >= 3:
+        ring = _offset_ring(points, directions, normals, distance)
+        ring_dirs = np.roll(ring, -1, axis=0) - ring
+        flipped = np.einsum("ij,ij->i", ring_dirs, directions) <= 1e-9
+        if not flipped.any():
+            return ring, points, directions, normals
+        # Sisi i ring ada di garis sisi i; sisi yang berbalik sudah habis
+        points, directions, normals = points[~flipped], directions[~flipped], normals[~flipped]
+    return None, points, directions, normals
+
+
+def spiral_rings(polygon, spacing):
+    """
+    Lintasan ring konsentris ke dalam untuk poligon konveks.
+
+    Ring pertama berada spacing/2 dari tepi, ring berikutnya bergeser
+    `spacing` ke dalam sampai poligon habis. Jika sisa tengah yang belum
+    tertutup footprint ring terakhir masih punya lebar (lebih sempit dari
+    spacing, sehingga tidak muat satu ring lagi), ditambahkan satu lintasan
+    terbuka di garis tengah sisa itu.
+
+    Return:
+        list of array (K, 2) - lintasan (north, east) dari luar ke dalam. Ring
+        sudah ditutup (verteks pertama diulang di akhir); elemen terakhir bisa
+        berupa lintasan tengah yang terbuka
+    """
+    points = _polygon(polygon)
+    directions = np.roll(points, -1, axis=0) - points
+    following = np.roll(directions, -1, axis=0)
+    # Pada poligon berlawanan jarum jam, belokan konveks punya cross (north, east) negatif
+    cross = directions[:, 0] * following[:, 1] - directions[:, 1] * following[:, 0]
+    if np.any(cross > 1e-9):
+        raise ValueError("Pola spiral butuh poligon konveks; pakai lawnmower untuk poligon cekung")
+    # Verteks segaris tidak membentuk sudut; sisinya digabung dengan sisi sebelumnya
+    keep = np.roll(np.abs(cross) > 1e-9, 1)
+    points, directions = points[keep], directions[keep]
+
+    lengths = np.hypot(directions[:, 0], directions[:, 1])
+    # Normal ke dalam = sisi kiri arah sisi (poligon berlawanan jarum jam)
+    normals = np.column_stack((directions[:, 1], -directions[:, 0])) / lengths[:, None]
+
+    paths = []
+    distance = spacing / 2
+    edges = (points, directions, normals)
+    while True:
+        ring, *remaining = _inset(*edges, distance)
+        if ring is None:
+            break
+        paths.append(np.vstack((ring, ring[:1])))
+        edges = remaining
+        distance += spacing
+
+    # Bagian yang belum tertutup: poligon yang digeser spacing/2 melewati ring terakhir
+    core = _inset(*edges, distance - spacing / 2)[0]
+    if core is not None:
+        paths.append(sweep_lines(core, spacing))
+    return paths
+
+
+def spiral(polygon, altitude, spacing=None, footprint=None, overlap=0.2,
+           frame=FRAME_PREVIOUS, start=(0.0, 0.0), prefix="R", hover=0):
+    """
+    Pola spiral ke dalam (ring konsentris) untuk poligon konveks.
+
+    Setiap ring diterbangkan penuh lalu pindah ke ring berikutnya di sudut
+    yang sama; sisa tengah yang terlalu sempit untuk satu ring lagi
+    diterbangkan sebagai lintasan lurus di garis tengahnya. Parameter sama
+    dengan lawnmower().
+
+    Return:
+        list of dict - format WAYPOINTS
+    """
+    path = np.concatenate(spiral_rings(polygon, _spacing(spacing, footprint, overlap)))
+    return _to_waypoints(path[:, 0], path[:, 1], altitude, prefix, frame, start, hover)
+
+
+def expanding_square(altitude, radius, spacing=None, footprint=None, overlap=0.2,
+                     center=(0.0, 0.0), heading=0.0, frame=FRAME_PREVIOUS,
+                     start=(0.0, 0.0), prefix="E", hover=0):
+    """
+    Pola expanding square (SAR) dari titik pusat.
+
+    Panjang leg: s, s, 2s, 2s, 3s, 3s, ... dengan arah berputar 90 derajat
+    searah jarum jam, sampai leg terluar di keempat arah minimal
+    radius - s/2 dari pusat (footprint menutup sampai `radius`). Leg
+    terakhir dipotong di sudut kotak agar tidak keluar dari area.
+
+    Parameter:
+        altitude : float - ketinggian terbang (meter)
+        radius   : float - setengah lebar area yang dicari (meter)
+        spacing  : float - jarak antar lintasan (meter), atau dari footprint/overlap
+        center   : tuple (north, east) - titik pusat (meter dari home)
+        heading  : float - arah leg pertama (derajat dari utara)
+        (parameter lain sama dengan lawnmower())
+
+    Return:
+        list of dict - format WAYPOINTS (titik pertama = pusat)
+    """
+    spacing = _spacing(spacing, footprint, overlap)
+    # Leg terluar harus minimal radius - spacing/2 dari pusat ke empat arah,
+    # agar footprint menutup sampai `radius`. Rentang pola tumbuh sekitar
+    # spacing/2 per leg, jadi jumlah leg ini selalu cukup lalu dipotong.
+    reach_target = radius - spacing / 2
+    legs = 4 * int(np.ceil(max(radius, 0.0) / spacing)) + 4
+    k = np.arange(legs)
+    lengths = spacing * (k // 2 + 1)
+    turns = np.radians(90.0 * (k % 4))
+    # Sumbu a = arah leg pertama, b = 90 derajat searah jarum jam darinya
+    a = np.concatenate(([0.0], np.cumsum(lengths * np.cos(turns))))
+    b = np.concatenate(([0.0], np.cumsum(lengths * np.sin(turns))))
+    reach = np.minimum.reduce([np.maximum.accumulate(a), -np.minimum.accumulate(a),
+                               np.maximum.accumulate(b), -np.minimum.accumulate(b)])
+    # Titik yang mencapai target baru menyentuh sisi terakhir; leg berikutnya
+    # menyusuri sisi itu dan dipotong di batas kotak yang sudah terbentuk.
+    # Radius <= s/2 cukup ditutup footprint di titik pusat saja.
+    reached = int(np.argmax(reach >= reach_target - 1e-9))
+    a, b = a[:reached + 2].copy(), b[:reached + 2].copy()
+    if reached:
+        a[-1] = np.clip(a[-1], a[:-1].min(), a[:-1].max())
+        b[-1] = np.clip(b[-1], b[:-1].min(), b[:-1].max())
+    else:
+        a, b = a[:1], b[:1]
+
+    theta = np.radians(heading)
+    north = center[0] + a * np.cos(theta) - b * np.sin(theta)
+    east = center[1] + a * np.sin(theta) + b * np.cos(theta)
+    return _to_waypoints(north, east, altitude, prefix, frame, start, hover)
@@ -0,0 +1,246 @@
+"""
+telemetry.py
+------------
+Perekam telemetri terstruktur untuk helper misi.
+
+Sebelumnya setiap iterasi polling di goto/arm_and_takeoff/land memanggil
+print() secara sinkron, dan tidak ada data yang bisa dianalisis setelah
+terbang. Sekarang helper hanya memanggil `recorder.record(...)`:
+
+    ConsoleRecorder   : default, langsung mencetak satu baris per sampel
+    TelemetryRecorder : menyimpan sampel di ring buffer; thread latar menulis
+                        batch ke file biner dan mencetak ringkasan ke konsol
+                        dengan laju yang bisa diatur
+
+Setiap sampel berisi:
+    (t, leg, mode, lat, lon, alt, dist)
+
+`leg` adalah nomor waypoint (1..N), LEG_TAKEOFF, LEG_LAND, atau 0 untuk goto
+tanpa nomor. `dist` adalah jarak ke target dalam meter (NaN jika tidak ada).
+
+Format file: MAGIC, panjang format (uint16), string format struct, lalu
+record berukuran tetap sesuai RECORD. Baca kembali dengan read_telemetry().
+
+Contoh:
+    with TelemetryRecorder("misi.tlm", console_interval=2.0) as recorder:
+        execute_waypoints(vehicle, WAYPOINTS, telemetry=recorder)
+"""
+
+import math
+import struct
+import threading
+from collections import deque
+
+from .modes import COPTER_MODES
+
+MAGIC = b"IRCTLM1\n"
+# t (float64), leg (int32), mode (uint8), lat, lon (float64), alt, dist (float32)
+RECORD = struct.Struct("<diBddff")
+
+LEG_TAKEOFF = -1
+LEG_LAND = -2
+
+UNKNOWN_MODE = 255
+MODE_NAMES = {number: name for name, number in COPTER_MODES.items()}
+
+
+def mode_code(mode_name):
+    """Nomor custom_mode ArduCopter untuk nama mode (UNKNOWN_MODE jika tidak dikenal)."""
+    return COPTER_MODES.get(mode_name, UNKNOWN_MODE)
+
+
+def format_sample(sample):
+    """
+    Mengubah satu sampel menjadi baris log yang mudah dibaca.
+
+    Parameter:
+        sample : tuple - (t, leg, mode, lat, lon, alt, dist)
+
+    Return:
+        str
+    """
+    _t, leg, mode, _lat, _lon, alt, dist = sample
+    if leg == LEG_TAKEOFF:
+        phase = "TAKEOFF"
+    elif leg == LEG_LAND:
+        phase = "LAND"
+    else:
+        phase = f"LEG {leg}"
+    line = f"  [{phase}] {mode}"
+    if not math.isnan(dist):
+        line += f" | Jarak: {dist:.1f}m"
+    return line + f" | Alt: {alt:.2f}m"
+
+
+class ConsoleRecorder:
+    """
+    Perekam paling sederhana: setiap sampel langsung dicetak ke konsol.
+
+    Parameter:
+        sample_interval : float - jeda antar sampel yang diminta dari helper (detik)
+    """
+
+    def __init__(self, sample_interval=1.0):
+        self.sample_interval = sample_interval
+
+    def record(self, t, leg, mode, location, dist=math.nan):
+        print(format_sample((t, leg, mode, location.lat, location.lon, location.alt, dist)))
+
+
+class TelemetryRecorder:
+    """
+    Perekam telemetri dengan ring buffer dan thread flush di latar belakang.
+
+    record() hanya menambahkan tuple ke deque, tanpa I/O. Thread latar
+    mengambil isi buffer setiap `flush_interval` detik (atau lebih cepat jika
+    sudah terkumpul `batch_size` sampel), menulisnya sebagai satu blok biner,
+    lalu mencetak sampel terakhir jika sudah lewat `console_interval` detik.
+    Jika buffer penuh sebelum di-flush, sampel tertua dibuang dan dihitung
+    di `dropped`.
+
+    Parameter:
+        path             : str - file tujuan, None = hanya konsol
+        capacity         : int - ukuran ring buffer (sampel)
+        batch_size       : int - jumlah sampel yang memicu flush lebih awal
+        flush_interval   : float - jeda maksimum antar flush (detik, waktu nyata)
+        console_interval : float - jeda antar baris konsol (detik, waktu sampel),
+                           None = tanpa output konsol
+        sample_interval  : float - jeda antar sampel yang diminta dari helper (detik)
+    """
+
+    def __init__(self, path=None, capacity=8192, batch_size=512, flush_interval=0.5,
+                 console_interval=1.0, sample_interval=0.2):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.console_interval = console_interval
+        self.sample_interval = sample_interval
+        self.written = 0
+        self.dropped = 0
+        self._buffer = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # menjaga urutan tulis antar flush()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._last_console = None
+        self._file = None
+        self._thread = None
+
+    def start(self):
+        """Membuka file (jika ada) dan menjalankan thread flush. Return self."""
+        if self._thread is not None:
+            return self
+        if self.path is not None:
+            self._file = open(self.path, "wb")
+            fmt = RECORD.format.encode("ascii")
+            self._file.write(MAGIC + struct.pack("<H", len(fmt)) + fmt)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="telemetry-flush", daemon=True)
+        self._thread.start()
+        return self
+
+    def record(self, t, leg, mode, location, dist=math.nan):
+        """
+        Menambahkan satu sampel ke buffer (aman dipanggil dari thread mana saja).
+
+        Parameter:
+            t        : float - waktu sampel (detik, dari clock)
+            leg      : int - nomor leg / LEG_TAKEOFF / LEG_LAND
+            mode     : str - nama mode saat ini
+            location : LocationGlobalRelative - posisi saat ini
+            dist     : float - jarak ke target (meter), NaN jika tidak ada
+        """
+        sample = (t, leg, mode, location.lat, location.lon, location.alt, dist)
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append(sample)
+            if len(self._buffer) >= self.batch_size:
+                self._wake.set()
+
+    def flush(self):
+        """Menulis seluruh isi buffer ke file dan konsol sekarang juga."""
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self._buffer)
+                self._buffer.clear()
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch):
+        if self._file is not None:
+            pack = RECORD.pack
+            self._file.write(b"".join(
+                pack(t, leg, mode_code(mode), lat, lon, alt, dist)
+                for t, leg, mode, lat, lon, alt, dist in batch
+            ))
+            self._file.flush()
+        self.written += len(batch)
+        if self.console_interval is not None:
+            last = batch[-1]
+            if self._last_console is None or last[0] - self._last_console >= self.console_interval:
+                self._last_console = last[0]
+                print(format_sample(last))
+
+    def close(self):
+        """Menghentikan thread, menulis sisa buffer, dan menutup file."""
+        if self._thread is not None:
+            self._stop.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_telemetry(path):
+    """
+    Membaca file hasil TelemetryRecorder secara streaming.
+
+    Parameter:
+        path : str - file telemetri
+
+    Return:
+        generator of tuple - (t, leg, mode, lat, lon, alt, dist), mode berupa nama
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} bukan file telemetri irc_mission")
+        (size,) = struct.unpack("<H", f.read(2))
+        record = struct.Struct(f.read(size).decode("ascii"))
+        while True:
+            chunk = f.read(record.size * 1024)
+            # Record terakhir yang terpotong (misalnya program terhenti) diabaikan
+            chunk = chunk[:len(chunk) - len(chunk) % record.size]
+            if not chunk:
+                break
+            for t, leg, code, lat, lon, alt, dist in record.iter_unpack(chunk):
+                yield t, leg, MODE_NAMES.get(code, "UNKNOWN"), lat, lon, alt, dist
+
+
+_default_recorder = ConsoleRecorder()
+
+
+def get_recorder(recorder=None):
+    """Kembalikan `recorder` jika diisi, selain itu perekam default."""
+    return recorder if recorder is not None else _default_recorder
+
+
+def set_default_recorder(recorder):
+    """Ganti perekam default yang dipakai helper tanpa argumen `telemetry`."""
+    global _default_recorder
+    _default_recorder = recorder if recorder is not None else ConsoleRecorder()
@@ -12,99 +12,24 @@ Profil ketinggian:
     -> WP4 (20m) -> WP5 (12m) -> WP6 (8m)
     -> Landing
 
+Sebelum terbang, energi tiap leg (jarak, naik/turun, hover) dihitung dan
+dibandingkan dengan kapasitas baterai. Selama terbang GUIDED, BatteryMonitor
+memicu RTL lebih awal jika sisa baterai tidak cukup lagi untuk pulang.
+
 Pastikan Mission Planner SITL sudah berjalan.
 Koneksi default: tcp:127.0.0.1:5762
 """
 
-import time
-import math
-from dronekit import connect, VehicleMode, LocationGlobalRelative
-
-
-# --- Helper Functions ---
-
-def switch_mode(vehicle, mode_name, timeout=10):
-    """Berpindah mode dan menunggu konfirmasi."""
-    vehicle.mode = VehicleMode(mode_name)
-    start = time.time()
-    while vehicle.mode.name != mode_name:
-        if time.time() - start > timeout:
-            print(f"[WARN] Timeout: {mode_name}")
-            return False
-        time.sleep(0.5)
-    print(f"[MODE] {mode_name}")
-    return True
-
-
-def arm_and_takeoff(vehicle, target_altitude):
-    """Arm drone dan takeoff ke ketinggian yang ditentukan."""
-    print("[INFO] Menunggu drone siap...")
-    while not vehicle.is_armable:
-        time.sleep(1)
-    switch_mode(vehicle, "GUIDED")
-    vehicle.armed = True
-    while not vehicle.armed:
-        time.sleep(1)
-    print("[INFO] Drone ter-arm")
-    vehicle.simple_takeoff(target_altitude)
-    while True:
-        alt = vehicle.location.global_relative_frame.alt
-        print(f"  Naik... {alt:.2f}m")
-        if alt >= target_altitude * 0.95:
-            print(f"[INFO] Ketinggian {target_altitude}m tercapai")
-            break
-        time.sleep(1)
-
-
-def get_offset_location(original, d_north, d_east, alt):
-    """Hitung koordinat GPS baru dari offset meter."""
-    earth_radius = 6378137.0
-    d_lat = d_north / earth_radius
-    d_lon = d_east / (earth_radius * math.cos(math.radians(original.lat)))
-    return LocationGlobalRelative(
-        original.lat + math.degrees(d_lat),
-        original.lon + math.degrees(d_lon),
-        alt
-    )
-
-
-def get_distance(loc1, loc2):
-    """Hitung jarak meter antara dua titik GPS."""
-    d_lat = loc2.lat - loc1.lat
-    d_lon = loc2.lon - loc1.lon
-    return math.sqrt(d_lat ** 2 + d_lon ** 2) * 1.113195e5
-
-
-def goto_with_altitude(vehicle, d_north, d_east, target_alt, label, threshold=1.5):
-    """
-    Terbang ke titik offset pada ketinggian yang ditentukan.
-    Menampilkan informasi ketinggian saat ini vs target secara real-time.
-
-    Parameter:
-        vehicle    : objek Vehicle DroneKit
-        d_north    : float - offset ke utara (meter)
-        d_east     : float - offset ke timur (meter)
-        target_alt : float - ketinggian target (meter)
-        label      : str   - nama titik untuk log
-        threshold  : float - jarak tiba dalam meter
-    """
-    if vehicle.mode.name != "GUIDED":
-        switch_mode(vehicle, "GUIDED")
-
-    current = vehicle.location.global_relative_frame
-    target = get_offset_location(current, d_north, d_east, target_alt)
-
-    print(f"[NAV] Menuju {label} | Alt target: {target_alt}m...")
-    vehicle.simple_goto(target)
-
-    while True:
-        dist = get_distance(vehicle.location.global_relative_frame, target)
-        alt = vehicle.location.global_relative_frame.alt
-        print(f"  Jarak: {dist:.1f}m | Alt: {alt:.2f}m -> target: {target_alt}m")
-        if dist <= threshold:
-            print(f"[NAV] Tiba di {label} | Alt akhir: {alt:.2f}m")
-            break
-        time.sleep(1)
+import sys
+from pathlib import Path
+
+# Paket irc_mission berada di root repository
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from irc_mission import (  # noqa: E402
+    BatteryMonitor, EnergyAbort, EnergyModel, arm_and_takeoff, connect_vehicle,
+    estimate_energy, goto, land, parse_mission_args, print_energy_report, sleep,
+)
+from irc_mission.auto_mission import run_auto_route  # noqa: E402
 
 
 # --- Definisi Waypoint dengan Ketinggian Berbeda ---
@@ -126,41 +51,79 @@ MISSION_WAYPOINTS = [
     (15,  0,   8,  "WP6 - Rendah, kembali ke barat"),
 ]
 
-# --- Main Program ---
-
-print("=" * 60)
-print("  05 Altitude Change Mission")
-print("  Misi zigzag dengan variasi ketinggian di setiap waypoint")
-print("=" * 60)
-
-print("\nProfil ketinggian misi:")
-print("  Takeoff")
-alts = [wp[2] for wp in MISSION_WAYPOINTS]
-for i, (_, _, alt, label) in enumerate(MISSION_WAYPOINTS, start=1):
-    bar = "#" * int(alt / 2)
-    print(f"  {label:30s} {alt:3d}m  {bar}")
-
-print("\n[1] Koneksi ke SITL...")
-vehicle = connect('tcp:127.0.0.1:5762', wait_ready=True)
-print(f"    Terhubung. Mode: {vehicle.mode.name}")
-
-print("\n[2] Arm dan Takeoff ke 8m...")
-arm_and_takeoff(vehicle, target_altitude=8)
-
-print(f"\n[3] Eksekusi {len(MISSION_WAYPOINTS)} waypoint dengan variasi ketinggian...")
-
-for i, (d_north, d_east, altitude, label) in enumerate(MISSION_WAYPOINTS, start=1):
-    print(f"\n  --- Waypoint {i}/{len(MISSION_WAYPOINTS)} ---")
-    goto_with_altitude(vehicle, d_north, d_east, altitude, label)
-    time.sleep(2)
-
-# Landing
-print("\n[4] Landing...")
-switch_mode(vehicle, "LAND")
-while vehicle.location.global_relative_frame.alt > 0.2:
-    print(f"  Mendarat... {vehicle.location.global_relative_frame.alt:.2f}m")
-    time.sleep(1)
-
-print("\n[DONE] Misi altitude change selesai.")
-print("  Ketinggian yang dilalui:", " -> ".join(f"{wp[2]}m" for wp in MISSION_WAYPOINTS))
-vehicle.close()
\ No newline at end of file
+# Kapasitas baterai (Wh) dan model daya drone; sesuaikan dengan pack dan frame
+BATTERY_WH = 80.0
+ENERGY_MODEL = EnergyModel(hover_power_w=180, cruise_power_w=230, mass_kg=1.5)
+
+
+def main():
+    args = parse_mission_args(__doc__, allow_auto=True)
+
+    print("=" * 60)
+    print("  05 Altitude Change Mission")
+    print("  Misi zigzag dengan variasi ketinggian di setiap waypoint")
+    print("=" * 60)
+
+    print("\nProfil ketinggian misi:")
+    print("  Takeoff")
+    for _, _, alt, label in MISSION_WAYPOINTS:
+        bar = "#" * int(alt / 2)
+        print(f"  {label:30s} {alt:3d}m  {bar}")
+
+    # Jeda 2 detik di setiap titik ikut dihitung sebagai hover
+    route = [
+        {"name": label, "d_north": d_north, "d_east": d_east, "altitude": altitude, "hover": 2}
+        for d_north, d_east, altitude, label in MISSION_WAYPOINTS
+    ]
+    print()
+    estimate = estimate_energy(route, (0.0, 0.0, 8.0), ENERGY_MODEL)
+    print_energy_report(estimate, BATTERY_WH)
+    if estimate.check(BATTERY_WH):
+        print("\n[ABORT] Baterai tidak cukup untuk rute ini.")
+        return
+
+    if args.dry_run:
+        return
+
+    print("\n[1] Koneksi ke SITL...")
+    vehicle = connect_vehicle(args.connect)
+    print(f"    Terhubung. Mode: {vehicle.mode.name}")
+
+    try:
+        print("\n[2] Arm dan Takeoff ke 8m...")
+        arm_and_takeoff(vehicle, target_altitude=8)
+
+        print(f"\n[3] Eksekusi {len(MISSION_WAYPOINTS)} waypoint dengan variasi ketinggian...")
+
+        if args.auto:
+            # Jeda 2 detik per titik menjadi item LOITER_TIME di misi AUTO
+            run_auto_route(vehicle, route)
+        else:
+            try:
+                with BatteryMonitor(vehicle, ENERGY_MODEL, BATTERY_WH) as battery:
+                    for i, (d_north, d_east, altitude, label) in enumerate(MISSION_WAYPOINTS, start=1):
+                        print(f"\n  --- Waypoint {i}/{len(MISSION_WAYPOINTS)} ---")
+                        goto(vehicle, d_north, d_east, altitude, label, battery=battery)
+                        alt = vehicle.location.global_relative_frame.alt
+                        print(f"  Alt akhir: {alt:.2f}m (target {altitude}m) | "
+                              f"baterai {battery.remaining_wh:.1f} Wh, margin {battery.margin_wh:.1f} Wh")
+                        sleep(2, vehicle=vehicle)
+            except EnergyAbort as exc:
+                print(f"\n[ABORT] {exc}")
+                print("  RTL berjalan, menunggu drone mendarat...")
+                while vehicle.armed:
+                    sleep(1, vehicle=vehicle)
+                return
+
+        # Landing
+        print("\n[4] Landing...")
+        land(vehicle)
+
+        print("\n[DONE] Misi altitude change selesai.")
+        print("  Ketinggian yang dilalui:", " -> ".join(f"{wp[2]}m" for wp in MISSION_WAYPOINTS))
+    finally:
+        vehicle.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Deteksi tiba berbasis listener posisi (arrival.py)."""
+
+import threading
+import time
+
+from irc_mission.arrival import ArrivalWatcher
+from irc_mission.clock import MonotonicClock
+from irc_mission.geo import get_distance
+from irc_mission.sim import SimLocation, SimVehicle
+
+
+def _move_later(vehicle, location, delay):
+    def move():
+        time.sleep(delay)
+        vehicle.location.global_relative_frame = location
+        vehicle.location.notify_attribute_listeners("global_relative_frame", location)
+
+    thread = threading.Thread(target=move)
+    thread.start()
+    return thread
+
+
+def test_wakes_on_position_update_not_on_poll_tick():
+    vehicle = SimVehicle()
+    target = SimLocation(vehicle.home_lat + 0.001, vehicle.home_lon, 10.0)
+    watcher = ArrivalWatcher(vehicle, clock=MonotonicClock())
+    thread = _move_later(vehicle, SimLocation(target.lat, target.lon, 10.0), 0.05)
+    start = time.perf_counter()
+    # progress_interval besar: tanpa listener, tiba baru terlihat setelah 5 detik
+    assert watcher.wait_until_arrived(target, threshold=1.0, timeout=5.0,
+                                      on_progress=lambda *_: None, progress_interval=5.0)
+    elapsed = time.perf_counter() - start
+    thread.join()
+    assert elapsed < 1.0
+
+
+def test_already_at_target_returns_immediately():
+    vehicle = SimVehicle()
+    here = vehicle.location.global_relative_frame
+    target = SimLocation(here.lat, here.lon, 0.0)
+    assert ArrivalWatcher(vehicle, clock=MonotonicClock()).wait_until_arrived(target, timeout=0.5)
+
+
+def test_timeout_and_listener_removed():
+    vehicle = SimVehicle()
+    target = SimLocation(vehicle.home_lat + 0.01, vehicle.home_lon, 10.0)
+    before = len(vehicle.location._attribute_listeners.get("global_relative_frame", []))
+    watcher = ArrivalWatcher(vehicle, get_distance, clock=MonotonicClock())
+    assert not watcher.wait_until_arrived(target, timeout=0.1)
+    assert len(vehicle.location._attribute_listeners.get("global_relative_frame", [])) == before
+
+
+def test_async_wait_resolves_from_listener_thread():
+    import asyncio
+
+    vehicle = SimVehicle()
+    target = SimLocation(vehicle.home_lat + 0.001, vehicle.home_lon, 10.0)
+    watcher = ArrivalWatcher(vehicle)
+
+    async def run():
+        thread = _move_later(vehicle, SimLocation(target.lat, target.lon, 10.0), 0.05)
+        start = time.perf_counter()
+        arrived = await watcher.wait_until_arrived_async(target, threshold=1.0, timeout=5.0)
+        thread.join()
+        return arrived, time.perf_counter() - start
+
+    arrived, elapsed = asyncio.run(run())
+    assert arrived and elapsed < 1.0
+    assert not vehicle.location._attribute_listeners.get("global_relative_frame")
+
+
+def test_async_wait_timeout():
+    import asyncio
+
+    vehicle = SimVehicle()
+    target = SimLocation(vehicle.home_lat + 0.01, vehicle.home_lon, 10.0)
+    assert not asyncio.run(ArrivalWatcher(vehicle).wait_until_arrived_async(target, timeout=0.05))
@@ -0,0 +1,74 @@
+"""Target AsyncMissionExecutor dari resolve_targets() (frames.py)."""
+
+import asyncio
+
+import pytest
+
+from irc_mission.async_executor import AsyncMissionExecutor
+from irc_mission.clock import SimClock
+from irc_mission.distance import equirectangular_distance
+from irc_mission.frames import FRAME_HOME, resolve_targets
+from irc_mission.sim import SimVehicle
+
+pytest.importorskip("dronekit")
+
+ROUTE = [
+    {"name": "A", "d_north": 40, "d_east": 0, "altitude": 10, "threshold": 5},
+    {"name": "B", "d_north": 0, "d_east": 40, "altitude": 10, "threshold": 5},
+]
+
+
+def _fly(route, **kwargs):
+    from irc_mission.control import arm_and_takeoff
+
+    vehicle = SimVehicle()
+    vehicle.clock = SimClock(vehicle)
+    arm_and_takeoff(vehicle, 10, report=False)
+    pos = vehicle.location.global_relative_frame
+    home = (pos.lat, pos.lon, pos.alt)
+    targets = []
+    simple_goto = vehicle.simple_goto
+
+    def record_goto(location):
+        targets.append(location)
+        simple_goto(location)
+
+    vehicle.simple_goto = record_goto
+    executor = AsyncMissionExecutor(vehicle, route, **kwargs)
+    results = asyncio.run(executor.run())
+    return home, targets, results
+
+
+@pytest.mark.parametrize("frame", [None, FRAME_HOME])
+def test_targets_follow_frame_not_arrival_position(frame):
+    kwargs = {} if frame is None else {"frame": frame}
+    home, targets, results = _fly(ROUTE, **kwargs)
+    expected = resolve_targets(ROUTE, home, frame or "relative-to-previous")
+    assert [leg["status"] for leg in results] == ["arrived", "arrived"]
+    assert len(targets) == 2
+    for target, (lat, lon, alt) in zip(targets, expected):
+        assert equirectangular_distance(target, type(target)(lat, lon, alt)) < 0.01
+
+
+def test_leg_timeout_aborts_remaining_legs():
+    route = [dict(ROUTE[0], timeout=2), ROUTE[1]]
+    _, targets, results = _fly(route)
+    assert [leg["status"] for leg in results] == ["timeout"]
+    assert len(targets) == 1
+
+
+def test_failing_monitor_cancels_leg():
+    from irc_mission.control import arm_and_takeoff
+
+    vehicle = SimVehicle()
+    vehicle.clock = SimClock(vehicle)
+    arm_and_takeoff(vehicle, 10, report=False)
+
+    async def failing(executor):
+        await executor.sleep(3)
+        raise RuntimeError("sensor")
+
+    executor = AsyncMissionExecutor(vehicle, ROUTE)
+    results = asyncio.run(executor.run(monitors=[failing]))
+    assert [leg["status"] for leg in results] == ["cancelled"]
+    assert "sensor" in executor.abort_reason
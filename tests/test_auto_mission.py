@@ -0,0 +1,22 @@
+"""Helper misi AUTO yang tidak butuh dronekit (auto_mission.py)."""
+
+from types import SimpleNamespace
+
+from irc_mission.auto_mission import normalize_waypoints, wpnav_radius
+
+
+def test_wpnav_radius_in_meters():
+    vehicle = SimpleNamespace(parameters={"WPNAV_RADIUS": 200.0})
+    assert wpnav_radius(vehicle) == 2.0
+
+
+def test_wpnav_radius_missing():
+    assert wpnav_radius(SimpleNamespace(parameters={})) is None
+    assert wpnav_radius(SimpleNamespace()) is None
+
+
+def test_normalize_tuple_route():
+    waypoints = normalize_waypoints([(10, 0, 5), (0, 10, 8, "B"), {"name": "C", "d_north": 1,
+                                                                  "d_east": 1, "altitude": 3}])
+    assert [wp["name"] for wp in waypoints] == ["WP1", "B", "C"]
+    assert waypoints[1] == {"name": "B", "d_north": 0, "d_east": 10, "altitude": 8}
@@ -0,0 +1,53 @@
+"""Jam per vehicle (clock.py) dan jam di eksekutor asyncio."""
+
+import asyncio
+
+import pytest
+
+from irc_mission.async_executor import AsyncMissionExecutor
+from irc_mission.clock import MonotonicClock, SimClock, get_clock, sleep
+from irc_mission.sim import SimVehicle
+
+
+def test_get_clock_prefers_explicit_then_vehicle_clock():
+    vehicle = SimVehicle()
+    assert isinstance(get_clock(vehicle=vehicle), MonotonicClock)
+    vehicle.clock = SimClock(vehicle)
+    other = SimClock(SimVehicle())
+    assert get_clock(vehicle=vehicle) is vehicle.clock
+    assert get_clock(other, vehicle) is other
+
+
+def test_vehicle_clocks_are_independent():
+    first, second = SimVehicle(), SimVehicle()
+    first.clock, second.clock = SimClock(first), SimClock(second)
+    sleep(2, vehicle=first)
+    sleep(5, vehicle=second)
+    assert first.time == pytest.approx(2.0)
+    assert second.time == pytest.approx(5.0)
+    assert isinstance(get_clock(), MonotonicClock)
+
+
+def test_connect_sim_does_not_replace_default_clock():
+    pytest.importorskip("dronekit")
+    from irc_mission.control import connect_vehicle
+
+    vehicle = connect_vehicle("sim")
+    assert isinstance(vehicle.clock, SimClock)
+    assert isinstance(get_clock(), MonotonicClock)
+
+
+def test_async_executor_advances_sim_clock():
+    pytest.importorskip("dronekit")
+    from irc_mission.control import arm_and_takeoff
+
+    vehicle = SimVehicle()
+    vehicle.clock = SimClock(vehicle)
+    arm_and_takeoff(vehicle, 10, report=False)
+    route = [{"name": "A", "d_north": 30, "d_east": 0, "altitude": 10, "hover": 4}]
+    executor = AsyncMissionExecutor(vehicle, route, leg_timeout=60)
+    start = vehicle.time
+    results = asyncio.run(executor.run())
+    assert [leg["status"] for leg in results] == ["arrived"]
+    assert results[0]["duration"] == pytest.approx(vehicle.time - start, abs=0.2)
+    assert results[0]["duration"] > 4.0
@@ -0,0 +1,71 @@
+"""Reconnect ConnectionManager di tengah misi (connection.py)."""
+
+import pytest
+
+from irc_mission.clock import SimClock
+from irc_mission.connection import ConnectionManager
+from irc_mission.sim import SimVehicle
+from irc_mission.streams import StreamRateController
+
+pytest.importorskip("dronekit")
+
+ROUTE = [
+    {"name": "A", "d_north": 40, "d_east": 0, "altitude": 10},
+    {"name": "B", "d_north": 0, "d_east": 40, "altitude": 10},
+]
+
+
+class Link:
+    """Satu koneksi ke SimVehicle yang sama; objek baru per connect, seperti DroneKit."""
+
+    def __init__(self, sim):
+        object.__setattr__(self, "_sim", sim)
+        object.__setattr__(self, "closed", False)
+        object.__setattr__(self, "sent", [])
+
+    def __getattr__(self, name):
+        return getattr(self._sim, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._sim, name, value)
+
+    def send_mavlink(self, message):
+        self.sent.append(message)
+        self._sim.send_mavlink(message)
+
+    def close(self):
+        object.__setattr__(self, "closed", True)
+
+
+def test_reconnect_closes_old_link_and_moves_monitors():
+    from irc_mission.control import arm_and_takeoff
+
+    sim = SimVehicle()
+    sim.clock = SimClock(sim)
+    arm_and_takeoff(sim, 10, report=False)
+    links = []
+
+    def connect():
+        links.append(Link(sim))
+        return links[-1]
+
+    dropped = []
+
+    def drop(_locations, _name, location):
+        if not dropped and sim.time > 8:
+            dropped.append(sim.time)
+            sim.drop_link(6)
+
+    sim.location.add_attribute_listener("global_relative_frame", drop)
+    with ConnectionManager("sim", cache_dir=None, heartbeat_timeout=2, connect_fn=connect,
+                           clock=sim.clock) as manager:
+        manager.connect()
+        with StreamRateController(manager.vehicle, clock=sim.clock) as streams:
+            manager.execute_waypoints(ROUTE, streams=streams)
+            assert streams.vehicle is links[-1]
+
+    assert dropped and manager.reconnects >= 1
+    assert len(links) >= 2
+    assert all(link.closed for link in links[:-1])
+    # Rate fase dikirim ulang lewat koneksi baru
+    assert links[-1].sent
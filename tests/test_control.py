@@ -0,0 +1,109 @@
+"""Arm, takeoff, dan landing di SimVehicle (control.py)."""
+
+import pytest
+
+from irc_mission.clock import SimClock
+from irc_mission.sim import SimVehicle
+from irc_mission.telemetry import LEG_LAND
+
+pytest.importorskip("dronekit")
+
+
+class ListRecorder:
+    sample_interval = 0.2
+
+    def __init__(self):
+        self.samples = []
+
+    def record(self, t, leg, mode, location, dist=float("nan")):
+        self.samples.append((t, leg, mode, location.alt, dist))
+
+
+def test_land_distance_never_negative():
+    from irc_mission.control import arm_and_takeoff, land
+
+    vehicle = SimVehicle()
+    vehicle.clock = SimClock(vehicle)
+    arm_and_takeoff(vehicle, 5, report=False)
+    recorder = ListRecorder()
+    land(vehicle, telemetry=recorder)
+    dists = [s[4] for s in recorder.samples if s[1] == LEG_LAND]
+    assert dists and min(dists) >= 0.0
+    assert dists[-1] == 0.0
+    assert recorder.samples[-1][3] <= 0.2
+
+
+class RejectingVehicle(SimVehicle):
+    """SimVehicle yang mengabaikan `rejects` perintah mode pertama (-1 = selalu)."""
+
+    def __init__(self, rejects, **kwargs):
+        super().__init__(**kwargs)
+        self.rejects = rejects
+        self.sent = []
+
+    @property
+    def mode(self):
+        return SimVehicle.mode.fget(self)
+
+    @mode.setter
+    def mode(self, value):
+        self.sent.append(self.time)
+        if self.rejects:
+            self.rejects -= 1
+            return
+        SimVehicle.mode.fset(self, value)
+
+
+def _mode_vehicle(rejects):
+    vehicle = RejectingVehicle(rejects)
+    vehicle.clock = SimClock(vehicle)
+    return vehicle
+
+
+def test_switch_mode_rejected_once_then_accepted():
+    from irc_mission.control import switch_mode
+    from irc_mission.metrics import get_histogram
+
+    histogram = get_histogram("mode.LOITER")
+    count, errors = histogram.count, histogram.errors
+    vehicle = _mode_vehicle(1)
+    assert switch_mode(vehicle, "LOITER", timeout=10, retry_interval=1.0)
+    assert vehicle.mode.name == "LOITER"
+    assert vehicle.sent == pytest.approx([0.0, 1.0], abs=0.06)
+    assert histogram.count == count + 1
+    assert histogram.errors == errors
+    # Latensi dihitung dari perintah pertama: satu jeda retry + mode_delay
+    assert histogram.max >= 1.0 + vehicle.mode_delay - 0.06
+
+
+def test_switch_mode_repeated_timeouts_record_errors():
+    from irc_mission.control import switch_mode
+    from irc_mission.metrics import get_histogram
+
+    histogram = get_histogram("mode.BRAKE")
+    count, errors = histogram.count, histogram.errors
+    vehicle = _mode_vehicle(-1)
+    for attempt in range(1, 4):
+        start = vehicle.time
+        assert not switch_mode(vehicle, "BRAKE", timeout=3, retry_interval=1.0)
+        assert vehicle.time - start == pytest.approx(3.0, abs=0.06)
+        assert histogram.errors == errors + attempt
+    assert histogram.count == count
+    assert vehicle.mode.name != "BRAKE"
+
+
+@pytest.mark.parametrize("backoff,timeout,gaps", [
+    (2.0, 20, [1.0, 2.0, 4.0, 8.0]),
+    (1.0, 4.5, [1.0, 1.0, 1.0, 1.0]),
+    (3.0, 10, [0.5, 1.5, 4.5]),
+])
+def test_switch_mode_backoff_between_retries(backoff, timeout, gaps):
+    from irc_mission.control import switch_mode
+
+    vehicle = _mode_vehicle(-1)
+    retry = gaps[0]
+    assert not switch_mode(vehicle, "CIRCLE", timeout=timeout, retry_interval=retry, backoff=backoff)
+    # Tidak ada pengiriman ulang setelah deadline
+    assert len(vehicle.sent) == len(gaps) + 1
+    assert [b - a for a, b in zip(vehicle.sent, vehicle.sent[1:])] == pytest.approx(gaps, abs=0.06)
+    assert vehicle.sent[-1] < timeout
@@ -0,0 +1,115 @@
+"""Model energi, perkiraan rute, dan BatteryMonitor (energy.py)."""
+
+import pytest
+
+from irc_mission.clock import SimClock
+from irc_mission.energy import BatteryMonitor, EnergyModel, estimate_energy
+from irc_mission.sim import SimLocation, SimVehicle
+
+HOME = (-6.5569, 106.7308, 0.0)
+
+# Konstanta model default, dihitung manual (Wh)
+CRUISE_WH_PER_M = 230 / 5 / 3600            # 0.0638889
+CLIMB_WH_PER_M = (180 / 2.5 + 1.5 * 9.81 / 0.5) / 3600  # (72 + 29.43) / 3600 = 0.0281750
+DESCENT_WH_PER_M = 180 / 1.0 / 3600         # 0.05
+HOVER_WH_PER_S = 180 / 3600                 # 0.05
+
+
+def test_leg_energy_hand_computed():
+    model = EnergyModel()
+    assert model.leg_energy(100, 0) == pytest.approx(1.277778, abs=1e-6)
+    assert model.leg_energy(0, 10) == pytest.approx(0.281750, abs=1e-6)
+    assert model.leg_energy(0, -10) == pytest.approx(0.5, abs=1e-9)
+    assert model.leg_energy(100, 10, hover=60) == pytest.approx(1.277778 + 0.281750 + 3.0, abs=1e-6)
+    assert model.leg_energy(0, 0, hover=60) == pytest.approx(60 * HOVER_WH_PER_S)
+
+
+def test_return_energy_climbs_to_rtl_altitude():
+    model = EnergyModel(rtl_altitude=15.0)
+    # Di bawah RTL_ALT: naik 10 m, terbang 200 m, turun 15 m
+    expected = 10 * CLIMB_WH_PER_M + 200 * CRUISE_WH_PER_M + 15 * DESCENT_WH_PER_M
+    assert model.return_energy(200, 5) == pytest.approx(expected)
+    assert expected == pytest.approx(0.28175 + 2.555556 + 0.75, abs=1e-6)
+    # Di atas RTL_ALT: langsung pulang lalu turun dari ketinggian saat ini
+    assert model.return_energy(200, 20) == pytest.approx(200 * CRUISE_WH_PER_M + 20 * DESCENT_WH_PER_M)
+    assert model.return_energy(0, 15) == pytest.approx(15 * DESCENT_WH_PER_M)
+
+
+def test_estimate_energy_and_check():
+    waypoints = [
+        {"name": "A", "d_north": 100, "d_east": 0, "altitude": 10},
+        {"name": "B", "d_north": 0, "d_east": 100, "altitude": 20, "hover": 30},
+    ]
+    estimate = estimate_energy(waypoints, HOME)
+    assert estimate.names == ["A", "B"]
+    leg_a = 100 * CRUISE_WH_PER_M + 10 * CLIMB_WH_PER_M
+    leg_b = 100 * CRUISE_WH_PER_M + 10 * CLIMB_WH_PER_M + 30 * HOVER_WH_PER_S
+    assert list(estimate.legs_wh) == pytest.approx([leg_a, leg_b], rel=1e-5)
+    assert estimate.total_wh == pytest.approx(leg_a + leg_b, rel=1e-5)
+    back_a = 5 * CLIMB_WH_PER_M + 100 * CRUISE_WH_PER_M + 15 * DESCENT_WH_PER_M
+    back_b = 141.42136 * CRUISE_WH_PER_M + 20 * DESCENT_WH_PER_M
+    assert list(estimate.return_wh) == pytest.approx([back_a, back_b], rel=1e-5)
+    assert estimate.peak_wh() == pytest.approx(leg_a + leg_b + back_b, rel=1e-5)
+
+    assert estimate.check(100.0) == []
+    # Kapasitas pas di antara kebutuhan WP1 dan WP2 (dengan cadangan 20%)
+    capacity = (leg_a + back_a + leg_a + leg_b + back_b) / 2 / 0.8
+    errors = estimate.check(capacity, reserve=0.2)
+    assert len(errors) == 1 and errors[0].startswith("WP2 (B)")
+    assert len(estimate.check(capacity * 0.8, reserve=0.5)) == 2
+
+
+class ModeLog(SimVehicle):
+    """SimVehicle yang mencatat setiap perintah mode."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.commands = []
+
+    @property
+    def mode(self):
+        return SimVehicle.mode.fget(self)
+
+    @mode.setter
+    def mode(self, value):
+        self.commands.append(getattr(value, "name", value))
+        SimVehicle.mode.fset(self, value)
+
+
+def _far(vehicle):
+    return SimLocation(vehicle.home_lat + 0.01, vehicle.home_lon, 10.0)
+
+
+def test_battery_monitor_switches_to_rtl_once():
+    pytest.importorskip("dronekit")
+    vehicle = ModeLog()
+    vehicle.clock = SimClock(vehicle)
+    near = SimLocation(vehicle.home_lat, vehicle.home_lon, 10.0)
+    with BatteryMonitor(vehicle, EnergyModel(), capacity_wh=10.0, reserve=0.2) as battery:
+        vehicle.location.notify_attribute_listeners("global_relative_frame", near)
+        assert battery.margin_wh > 0 and not battery.breached.is_set()
+        assert vehicle.commands == []
+
+        for _ in range(3):
+            vehicle.location.notify_attribute_listeners("global_relative_frame", _far(vehicle))
+        assert battery.margin_wh < 0
+        assert battery.breached.is_set()
+        assert vehicle.commands == ["RTL"]
+        assert battery.status["action"] == "RTL"
+        assert battery.status["distance"] == pytest.approx(1105.7, abs=1.0)
+
+
+@pytest.mark.parametrize("mode", ["RTL", "LAND"])
+def test_battery_monitor_idle_when_already_returning(mode):
+    pytest.importorskip("dronekit")
+    vehicle = ModeLog()
+    vehicle.clock = SimClock(vehicle)
+    vehicle.mode = mode
+    vehicle.advance(1.0)
+    assert vehicle.mode.name == mode
+    vehicle.commands.clear()
+    with BatteryMonitor(vehicle, EnergyModel(), capacity_wh=1.0) as battery:
+        vehicle.location.notify_attribute_listeners("global_relative_frame", _far(vehicle))
+        assert battery.margin_wh < 0
+        assert not battery.breached.is_set()
+        assert vehicle.commands == []
@@ -0,0 +1,64 @@
+"""FleetRunner dengan SimVehicle berjam virtual (tanpa SITL)."""
+
+import os
+import threading
+
+import pytest
+
+from irc_mission.clock import SimClock
+from irc_mission.fleet import FleetRunner
+from irc_mission.sim import SimVehicle
+
+pytest.importorskip("dronekit")
+
+ROUTE_SHORT = [{"name": "A", "d_north": 20, "d_east": 0, "altitude": 10}]
+ROUTE_LONG = [
+    {"name": "A", "d_north": 40, "d_east": 0, "altitude": 10, "hover": 3},
+    {"name": "B", "d_north": 0, "d_east": 40, "altitude": 10},
+]
+
+
+def sim_connect(_conn):
+    vehicle = SimVehicle()
+    vehicle.clock = SimClock(vehicle)
+    return vehicle
+
+
+def test_reports_keep_assignment_order_and_duplicates():
+    runner = FleetRunner(connect_fn=sim_connect, takeoff_altitude=10, leg_timeout=120)
+    reports = runner.run_sync([("sim", ROUTE_LONG), ("sim", ROUTE_SHORT)])
+    assert [report["index"] for report in reports] == [0, 1]
+    assert [report["connection"] for report in reports] == ["sim", "sim"]
+    assert [len(report["results"]) for report in reports] == [2, 1]
+    for report in reports:
+        assert report["error"] is None
+        assert all(leg["status"] == "arrived" for leg in report["results"])
+    # Durasi dalam waktu simulasi: rute panjang jelas lebih lama
+    assert reports[0]["duration"] > reports[1]["duration"] > 0
+
+
+def test_telemetry_samples_per_assignment():
+    runner = FleetRunner(connect_fn=sim_connect, takeoff_altitude=10, leg_timeout=120,
+                         sample_interval=0.5)
+    runner.run_sync([("sim", ROUTE_SHORT), ("sim", ROUTE_SHORT)])
+    ids = {sample[1] for sample in runner.telemetry.samples}
+    assert ids == {0, 1}
+
+
+def test_blocking_steps_not_capped_by_default_pool():
+    # Semua connect harus berjalan bersamaan; pool yang lebih kecil dari
+    # armada akan membuat barrier ini timeout
+    size = (os.cpu_count() or 1) + 5
+    barrier = threading.Barrier(size, timeout=5)
+
+    def connect(conn):
+        barrier.wait()
+        return sim_connect(conn)
+
+    runner = FleetRunner(connect_fn=connect, leg_timeout=60)
+    reports = runner.run_sync([("sim", [])] * size)
+    assert [report["error"] for report in reports] == [None] * size
+
+
+def test_empty_fleet():
+    assert FleetRunner(connect_fn=sim_connect).run_sync([]) == []
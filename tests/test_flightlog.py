@@ -0,0 +1,114 @@
+"""Flight log memmap: penulisan, index, dan pencarian waktu (flightlog.py)."""
+
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from irc_mission.flightlog import (  # noqa: E402
+    INDEX_STRIDE, RECORD_DTYPE, FlightLog, FlightLogWriter, build_index, index_path, read_header,
+)
+
+COUNT = 3 * INDEX_STRIDE + 5
+
+
+def _samples(count=COUNT):
+    t = np.arange(count) * 0.1
+    # Stempel waktu kembar melintasi batas blok index
+    t[INDEX_STRIDE - 2:INDEX_STRIDE + 3] = t[INDEX_STRIDE - 2]
+    leg = np.repeat(np.arange(1, 8), -(-count // 7))[:count]
+    return {
+        "t": t, "leg": leg, "mode": (leg % 3).astype("u1"),
+        "lat": -6.5569 + np.arange(count) * 1e-6, "lon": 106.7308 - np.arange(count) * 1e-6,
+        "alt": np.linspace(0, 30, count), "dist": np.where(leg % 2 == 0, np.nan, np.arange(count) * 0.5),
+    }
+
+
+def _write(path, samples, chunk_size=100):
+    writer = FlightLogWriter(path, chunk_size=chunk_size)
+    for i in range(len(samples["t"])):
+        writer.append(*(samples[name][i] for name in RECORD_DTYPE.names))
+    return writer
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = str(tmp_path / "survey.flog")
+    _write(path, _samples()).close()
+    return path
+
+
+def test_round_trip_read_back(log_path):
+    samples = _samples()
+    with FlightLog(log_path) as log:
+        assert len(log) == COUNT
+        for name in RECORD_DTYPE.names:
+            expected = samples[name].astype(RECORD_DTYPE[name])
+            assert np.array_equal(log.records[name], expected, equal_nan=True), name
+        assert log.leg_numbers().tolist() == list(range(1, 8))
+        for number in range(1, 8):
+            assert np.array_equal(log.leg(number)["leg"], samples["leg"][samples["leg"] == number])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, INDEX_STRIDE, COUNT + 10])
+def test_chunk_boundaries_do_not_change_content(tmp_path, log_path, chunk_size):
+    path = str(tmp_path / f"chunk{chunk_size}.flog")
+    _write(path, _samples(), chunk_size=chunk_size).close()
+    header_size = read_header(path)[0]
+    with open(path, "rb") as a, open(log_path, "rb") as b:
+        assert a.read()[header_size:] == b.read()[header_size:]
+
+
+def test_locate_at_record_and_block_boundaries(log_path):
+    t = _samples()["t"]
+    with FlightLog(log_path) as log:
+        probes = [-1.0, t[0], t[1], t[INDEX_STRIDE - 2], t[INDEX_STRIDE + 3],
+                  t[2 * INDEX_STRIDE - 1], t[2 * INDEX_STRIDE], t[2 * INDEX_STRIDE] + 0.05,
+                  t[3 * INDEX_STRIDE], t[-1], t[-1] + 1.0]
+        for value in probes:
+            assert log._locate(value) == int(np.searchsorted(t, value, side="left")), value
+        sliced = log.time_slice(t[INDEX_STRIDE - 2], t[2 * INDEX_STRIDE])
+        mask = (t >= t[INDEX_STRIDE - 2]) & (t < t[2 * INDEX_STRIDE])
+        assert np.array_equal(sliced["t"], t[mask])
+        assert len(log.time_slice(t[-1] + 1.0, t[-1] + 2.0)) == 0
+
+
+def test_build_index_independent_of_block(log_path):
+    with FlightLog(log_path) as log:
+        legs = log.legs.copy()
+        time_index = log.time_index.copy()
+    for block in (1, 7, INDEX_STRIDE, 1 << 20):
+        rebuilt_time, rebuilt_legs = build_index(log_path, block=block, save=False)
+        assert np.array_equal(rebuilt_legs, legs)
+        assert np.array_equal(rebuilt_time, time_index)
+
+
+def test_rebuilds_index_after_partial_write(tmp_path, log_path):
+    # Log yang sama ditimpa, lalu program berhenti sebelum close(): sidecar
+    # lama tidak boleh dipakai, dan record terakhir yang setengah tertulis dibuang
+    samples = _samples(INDEX_STRIDE + 50)
+    samples["leg"][:] = 42
+    writer = _write(log_path, samples, chunk_size=64)
+    writer._file.flush()
+    assert not os.path.exists(index_path(log_path))
+    with open(log_path, "ab") as f:
+        f.write(b"\x01" * (RECORD_DTYPE.itemsize // 2))
+
+    flushed = (INDEX_STRIDE + 50) // 64 * 64
+    with FlightLog(log_path) as log:
+        assert len(log) == flushed
+        assert log.leg_numbers().tolist() == [42]
+        assert log.legs["stop"].tolist() == [flushed]
+        assert log.time_index.tolist() == samples["t"][:flushed:INDEX_STRIDE].tolist()
+    writer._file.close()
+
+
+def test_rebuilds_stale_index_after_truncation(log_path):
+    size = read_header(log_path)[0] + 100 * RECORD_DTYPE.itemsize
+    with open(log_path, "r+b") as f:
+        f.truncate(size)
+    with FlightLog(log_path) as log:
+        assert len(log) == 100
+        assert log.legs["stop"].max() == 100
+        assert np.array_equal(log.leg(1)["t"], _samples()["t"][:100])
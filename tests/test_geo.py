@@ -0,0 +1,49 @@
+"""Konversi offset meter <-> koordinat GPS memakai model yang sama (geo.py, distance.py)."""
+
+import math
+
+import pytest
+
+from irc_mission.distance import local_offset, offset_degrees
+from irc_mission.frames import FRAME_HOME, resolve_targets
+from irc_mission.geo import get_distance
+from irc_mission.sim import SimLocation, SimVehicle
+
+LATITUDES = [-6.5569, 0.0, 35.0, 60.0, 75.0]
+OFFSETS = [(1000.0, 0.0), (0.0, 1000.0), (700.0, -700.0), (-3000.0, 2500.0), (0.5, 0.2)]
+
+
+@pytest.mark.parametrize("lat", LATITUDES)
+def test_offset_then_distance_round_trip(lat):
+    pytest.importorskip("dronekit")
+    from irc_mission.geo import get_offset_location
+
+    origin = SimLocation(lat, 106.7308, 10.0)
+    for d_north, d_east in OFFSETS:
+        target = get_offset_location(origin, d_north, d_east, 10.0)
+        assert get_distance(origin, target) == pytest.approx(math.hypot(d_north, d_east), abs=0.01)
+
+
+@pytest.mark.parametrize("lat", LATITUDES)
+def test_local_offset_inverts_offset_degrees(lat):
+    for d_north, d_east in OFFSETS:
+        d_lat, d_lon = offset_degrees(lat, d_north, d_east)
+        north, east = local_offset(lat, 10.0, lat + d_lat, 10.0 + d_lon)
+        assert north == pytest.approx(d_north, abs=0.01)
+        assert east == pytest.approx(d_east, abs=0.01)
+
+
+@pytest.mark.parametrize("lat", LATITUDES)
+def test_resolve_targets_and_sim_use_same_model(lat):
+    home = (lat, 106.7308, 0.0)
+    waypoints = [{"d_north": dn, "d_east": de, "altitude": 10, "frame": FRAME_HOME} for dn, de in OFFSETS]
+    for (d_north, d_east), target in zip(OFFSETS, resolve_targets(waypoints, home)):
+        distance = get_distance(SimLocation(*home), SimLocation(*target))
+        assert distance == pytest.approx(math.hypot(d_north, d_east), abs=0.01)
+
+    vehicle = SimVehicle(home_lat=lat, home_lon=106.7308)
+    vehicle._north, vehicle._east = 700.0, -700.0
+    vehicle._publish()
+    location = vehicle.location.global_relative_frame
+    assert get_distance(SimLocation(*home), location) == pytest.approx(math.hypot(700.0, 700.0), abs=0.01)
+    assert vehicle._to_local(location.lat, location.lon) == pytest.approx((700.0, -700.0), abs=0.01)
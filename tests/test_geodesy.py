@@ -0,0 +1,63 @@
+"""Versi array geodesy.py dibanding versi skalar geo.py per elemen."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("dronekit")
+
+from irc_mission import geodesy  # noqa: E402
+from irc_mission.geo import get_distance, get_offset_location  # noqa: E402
+from irc_mission.sim import SimLocation  # noqa: E402
+
+
+@pytest.fixture
+def route():
+    rng = np.random.default_rng(7)
+    return rng.uniform(-500, 500, 200), rng.uniform(-500, 500, 200), rng.uniform(5, 40, 200)
+
+
+@pytest.mark.parametrize("lat0", [-6.5569, 45.0, 70.0])
+def test_offset_locations_matches_scalar(lat0, route):
+    d_north, d_east, _alt = route
+    lat = lat0 + np.linspace(-0.01, 0.01, d_north.size)
+    lon = 106.7308 + np.linspace(-0.01, 0.01, d_north.size)
+    new_lat, new_lon, new_alt = geodesy.offset_locations(lat, lon, 10.0, d_north, d_east, -5.0)
+    for i in range(d_north.size):
+        expected = get_offset_location(SimLocation(lat[i], lon[i], 10.0), d_north[i], d_east[i], 15.0)
+        assert new_lat[i] == pytest.approx(expected.lat, abs=1e-12)
+        assert new_lon[i] == pytest.approx(expected.lon, abs=1e-12)
+    assert np.all(new_alt == 15.0)
+
+
+@pytest.mark.parametrize("lat0", [-6.5569, 45.0, 70.0])
+def test_chain_offsets_and_legs_match_scalar(lat0, route):
+    d_north, d_east, altitude = route
+    lat, lon, alt = geodesy.chain_offsets(lat0, 106.7308, d_north, d_east, altitude)
+
+    current = SimLocation(lat0, 106.7308, 0.0)
+    points = []
+    for dn, de, a in zip(d_north, d_east, altitude):
+        current = get_offset_location(current, dn, de, a)
+        points.append(current)
+    # Selisih < 1e-8 derajat (~1 mm)
+    assert np.abs(lat - [p.lat for p in points]).max() < 1e-8
+    assert np.abs(lon - [p.lon for p in points]).max() < 1e-8
+    assert np.array_equal(alt, altitude)
+
+    legs = geodesy.leg_lengths(lat, lon)
+    expected = [get_distance(SimLocation(lat[i], lon[i], 0), SimLocation(lat[i + 1], lon[i + 1], 0))
+                for i in range(lat.size - 1)]
+    assert np.allclose(legs, expected, rtol=0, atol=1e-9)
+    assert geodesy.cumulative_distances(lat, lon)[-1] == pytest.approx(sum(expected))
+
+
+def test_distances_match_scalar():
+    rng = np.random.default_rng(3)
+    lat1, lat2 = rng.uniform(-70, 70, (2, 100))
+    lon1, lon2 = rng.uniform(-170, 170, (2, 100))
+    lat2 = lat1 + (lat2 - lat1) * 1e-3
+    lon2 = lon1 + (lon2 - lon1) * 1e-3
+    result = geodesy.distances(lat1, lon1, lat2, lon2)
+    expected = [get_distance(SimLocation(a, b, 0), SimLocation(c, d, 0))
+                for a, b, c, d in zip(lat1, lon1, lat2, lon2)]
+    assert np.allclose(result, expected, rtol=1e-12, atol=0)
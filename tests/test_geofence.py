@@ -0,0 +1,54 @@
+"""Pemantauan geofence di update posisi (geofence.py)."""
+
+import pytest
+
+from irc_mission.geofence import EXCLUDE, Fence, Geofence, GeofenceBreach, GeofenceMonitor
+from irc_mission.sim import SimLocation, SimVehicle
+
+
+def _square(lat, lon, half=0.0005):
+    return [(lat - half, lon - half), (lat - half, lon + half),
+            (lat + half, lon + half), (lat + half, lon - half)]
+
+
+def test_breach_with_unknown_altitude():
+    pytest.importorskip("dronekit")
+    vehicle = SimVehicle()
+    fence = Geofence([Fence(_square(vehicle.home_lat, vehicle.home_lon), kind=EXCLUDE, name="tiang")])
+    with GeofenceMonitor(vehicle, fence, action="LOITER") as monitor:
+        location = SimLocation(vehicle.home_lat, vehicle.home_lon, None)
+        vehicle.location.notify_attribute_listeners("global_relative_frame", location)
+        assert monitor.breached.is_set()
+        assert monitor.breaches[0]["alt"] == 0.0
+        with pytest.raises(GeofenceBreach):
+            monitor.raise_if_breached()
+
+
+def test_check_inside_exclusion_and_outside_inclusion():
+    fence = Geofence([Fence(_square(-6.5569, 106.7308), name="lapangan"),
+                      Fence(_square(-6.5569, 106.7308, 0.0001), kind=EXCLUDE, name="tiang")],
+                     ceiling=60)
+    assert fence.check(-6.5569, 106.7308, 10.0) is not None
+    assert fence.check(-6.5569 + 0.0003, 106.7308, 10.0) is None
+    assert fence.check(-6.5569 + 0.0003, 106.7308, 70.0) is not None
+    assert fence.check(-6.5569 + 0.002, 106.7308, 10.0) is not None
+
+
+def test_large_inclusion_is_not_rasterised():
+    import time
+
+    from irc_mission.geofence import MAX_FENCE_CELLS
+
+    lat, lon = -6.5569, 106.7308
+    # Satu inklusi 20 km dan banyak eksklusi kecil: sel grid mengikuti fence kecil
+    small = [Fence(_square(lat + 0.001 * i, lon, 0.0001), kind=EXCLUDE, name=f"tiang{i}")
+             for i in range(9)]
+    start = time.perf_counter()
+    fence = Geofence([Fence(_square(lat, lon, 0.1), name="wilayah")] + small)
+    assert time.perf_counter() - start < 0.5
+    assert sum(len(cell) for cell in fence._cells.values()) <= len(small) * MAX_FENCE_CELLS
+    assert [p.fence.name for p in fence._direct] == ["wilayah"]
+
+    assert fence.check(lat + 0.003, lon, 10.0) == ("exclusion", "tiang3")
+    assert fence.check(lat + 0.05, lon + 0.05, 10.0) is None
+    assert fence.check(lat + 0.2, lon, 10.0) == ("outside", None)
@@ -0,0 +1,21 @@
+"""Membaca file misi (missionfile.py)."""
+
+from irc_mission.missionfile import load_mission
+from irc_mission.plan import compile_plan
+
+WPL = """QGC WPL 110
+0\t1\t0\t16\t0\t0\t0\t0\t-6.5569000\t106.7308000\t552.900000\t1
+1\t0\t3\t16\t0\t0\t0\t0\t-6.5567000\t106.7308000\t20.000000\t1
+"""
+
+
+def test_wpl_home_altitude_is_relative_zero(tmp_path):
+    path = tmp_path / "misi.waypoints"
+    path.write_text(WPL)
+    mission = load_mission(path)
+    assert mission.home == (-6.5569, 106.7308, 0.0)
+    assert mission.home_msl == 552.9
+
+    plan = compile_plan(mission, home=mission.home, cache_dir=None)
+    # ~22 m ke utara dan naik 20 m, bukan turun dari 552.9 m MSL
+    assert 25.0 < plan.legs[0] < 35.0
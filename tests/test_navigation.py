@@ -0,0 +1,73 @@
+"""Look-ahead di sudut pada execute_waypoints() (navigation.py)."""
+
+import pytest
+
+from irc_mission.clock import SimClock
+from irc_mission.geo import get_distance
+from irc_mission.sim import SimVehicle
+
+pytest.importorskip("dronekit")
+
+
+class ListRecorder:
+    sample_interval = 0.2
+
+    def __init__(self):
+        self.samples = []
+
+    def record(self, t, leg, mode, location, dist=float("nan")):
+        self.samples.append((t, leg, dist))
+
+ROUTE = [
+    {"name": "A", "d_north": 40, "d_east": 0, "altitude": 10},
+    {"name": "B", "d_north": 0, "d_east": 40, "altitude": 10, "hover": 2},
+    {"name": "C", "d_north": -40, "d_east": 0, "altitude": 10},
+    {"name": "D", "d_north": 0, "d_east": -40, "altitude": 10},
+]
+
+
+def _fly(**options):
+    from irc_mission.control import arm_and_takeoff
+    from irc_mission.navigation import execute_waypoints
+
+    vehicle = SimVehicle()
+    vehicle.clock = SimClock(vehicle)
+    arm_and_takeoff(vehicle, 10, report=False)
+    switches = []  # (waktu, target baru, jarak ke target sebelumnya)
+    goto = vehicle.simple_goto
+
+    def simple_goto(location, *args, **kwargs):
+        previous = switches[-1][1] if switches else None
+        here = vehicle.location.global_relative_frame
+        switches.append((vehicle.time, location, None if previous is None else get_distance(here, previous)))
+        goto(location, *args, **kwargs)
+
+    vehicle.simple_goto = simple_goto
+    start = vehicle.time
+    recorder = ListRecorder()
+    execute_waypoints(vehicle, ROUTE, default_threshold=1.5, telemetry=recorder, **options)
+    final = get_distance(vehicle.location.global_relative_frame, switches[-1][1])
+    # Sampel terakhir leg B yang punya jarak = saat tiba, sebelum hover
+    arrived_b = max(t for t, leg, dist in recorder.samples if leg == 2 and dist == dist)
+    return switches, vehicle.time - start, final, arrived_b
+
+
+@pytest.mark.parametrize("options", [{"acceptance_radius": 6.0}, {"time_to_go": 1.0}])
+def test_lookahead_switches_early_but_honours_hover_and_last(options):
+    switches, duration, final, arrived_b = _fly(**options)
+    plain_duration = _fly()[1]
+    assert len(switches) == 4
+    dists = [dist for _t, _target, dist in switches[1:]]
+    # A -> B: target berikutnya dikirim jauh sebelum threshold 1.5 m
+    assert dists[0] > 1.5
+    # time_to_go 1 s pada max_speed 5 m/s setara radius 5 m
+    assert dists[0] <= options.get("acceptance_radius", 5.0) + 0.5
+    # B (hover): tiba dengan threshold biasa lalu diam 2 detik sebelum ke C
+    assert dists[1] <= 1.5
+    assert switches[2][0] - arrived_b >= 2.0 - 1e-6
+    # C -> D: sudut tanpa hover lagi
+    assert dists[2] > 1.5
+    # D (terakhir): tidak ada look-ahead
+    assert final <= 1.5
+    assert duration < plain_duration
+
@@ -0,0 +1,55 @@
+"""Impor paket dan argumen CLI skrip contoh."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from irc_mission.cli import parse_mission_args
+from irc_mission.control import DEFAULT_CONNECTION
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_import_does_not_load_asyncio():
+    code = "import sys, irc_mission; print('asyncio' in sys.modules, 'dronekit' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True,
+                         check=True).stdout.split()
+    assert out == ["False", "False"]
+
+
+def test_lazy_names_resolve():
+    import irc_mission
+
+    assert irc_mission.FleetRunner.__module__ == "irc_mission.fleet"
+    assert irc_mission.AsyncMissionExecutor.__module__ == "irc_mission.async_executor"
+    assert set(irc_mission.__all__) <= set(dir(irc_mission))
+    with pytest.raises(AttributeError):
+        irc_mission.not_a_name
+
+
+def test_parse_defaults():
+    args = parse_mission_args(argv=[])
+    assert args.connect == DEFAULT_CONNECTION
+    assert args.dry_run is False
+    assert not hasattr(args, "auto") and not hasattr(args, "mission")
+
+
+def test_parse_dry_run_with_optional_flags():
+    args = parse_mission_args(argv=["--dry-run", "--connect", "sim", "--auto", "--mission", "m.yaml"],
+                              allow_auto=True, allow_mission=True)
+    assert (args.dry_run, args.connect, args.auto, args.mission) == (True, "sim", True, "m.yaml")
+
+
+def test_auto_flag_rejected_when_not_allowed():
+    with pytest.raises(SystemExit):
+        parse_mission_args(argv=["--auto"])
+
+
+def test_example_dry_run_needs_no_dronekit():
+    script = ROOT / "modules" / "03-mission" / "examples" / "03_multi_waypoint.py"
+    result = subprocess.run([sys.executable, str(script), "--dry-run"], cwd=ROOT,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip()
@@ -0,0 +1,40 @@
+"""Compile dan bind rencana misi (plan.py)."""
+
+from irc_mission.distance import equirectangular_distance
+from irc_mission.frames import FRAME_HOME
+from irc_mission.plan import compile_plan
+from irc_mission.sim import SimLocation
+
+ROUTE = [
+    {"name": "timur", "d_north": 0, "d_east": 100, "altitude": 10},
+    {"name": "utara", "d_north": 50, "d_east": 0, "altitude": 10},
+]
+
+
+def _distance(a, b):
+    return equirectangular_distance(SimLocation(*a), SimLocation(*b))
+
+
+def test_bind_high_latitude_keeps_metric_offsets(tmp_path):
+    # Compile tanpa home (seperti --dry-run), dipakai di lintang 60
+    plan = compile_plan(ROUTE, cache_dir=str(tmp_path))
+    home = (60.0, 10.0, 0.0)
+    targets = plan.bind(home)
+    assert abs(_distance(home, targets[0]) - 100.0) < 1.0
+    assert abs(_distance(targets[0], targets[1]) - 50.0) < 1.0
+
+
+def test_cached_relative_plan_reused_at_other_latitude(tmp_path):
+    compile_plan(ROUTE, home=(-6.5, 106.7, 0.0), cache_dir=str(tmp_path))
+    home = (60.0, 10.0, 0.0)
+    plan = compile_plan(ROUTE, home=home, cache_dir=str(tmp_path))
+    assert plan.cached
+    assert abs(_distance(home, plan.targets[0]) - 100.0) < 1.0
+
+
+def test_bind_home_frame():
+    route = [dict(wp, frame=FRAME_HOME) for wp in ROUTE]
+    plan = compile_plan(route, cache_dir=None)
+    home = (45.0, 7.0, 0.0)
+    targets = plan.bind(home)
+    assert abs(_distance(home, targets[1]) - 50.0) < 1.0
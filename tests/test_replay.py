@@ -0,0 +1,61 @@
+"""Replay rekaman telemetri melalui helper misi (replay.py)."""
+
+import pytest
+
+from irc_mission.clock import SimClock
+from irc_mission.distance import offset_degrees
+from irc_mission.replay import ReplayVehicle, replay_mission
+from irc_mission.sim import SimVehicle
+from irc_mission.telemetry import TelemetryRecorder
+
+ROUTE = [
+    {"name": "A", "d_north": 40, "d_east": 0, "altitude": 10},
+    {"name": "B", "d_north": 0, "d_east": 30, "altitude": 10, "hover": 2},
+]
+
+
+def test_groundspeed_from_consecutive_samples():
+    lat0, lon0 = -6.5569, 106.7308
+    samples = []
+    for i in range(5):
+        d_lat, _d_lon = offset_degrees(lat0, 4.0 * i, 0.0)
+        samples.append((0.5 * i, 1, "GUIDED", lat0 + d_lat, lon0, 10.0, 20.0 - 4.0 * i))
+    vehicle = ReplayVehicle(samples)
+    assert vehicle.groundspeed == 0.0
+    vehicle.step()
+    assert vehicle.groundspeed == pytest.approx(8.0, abs=1e-3)
+    vehicle.step()
+    assert vehicle.groundspeed == pytest.approx(8.0, abs=1e-3)
+
+
+def test_replay_recorded_log_through_time_to_go(tmp_path):
+    pytest.importorskip("dronekit")
+    from irc_mission.control import arm_and_takeoff
+    from irc_mission.navigation import execute_waypoints
+
+    path = str(tmp_path / "misi.tlog")
+    vehicle = SimVehicle()
+    clock = SimClock(vehicle)
+    with TelemetryRecorder(path, console_interval=None, sample_interval=0.1) as log:
+        arm_and_takeoff(vehicle, 10, clock=clock, telemetry=log, report=False)
+        execute_waypoints(vehicle, ROUTE, clock=clock, telemetry=log)
+
+    speeds = []
+
+    def mission(replayed, replay_clock):
+        arm_and_takeoff(replayed, 10, report=False)
+        replayed.location.add_attribute_listener(
+            "global_relative_frame", lambda *_args: speeds.append(replayed.groundspeed))
+        execute_waypoints(replayed, ROUTE, default_threshold=0.5, time_to_go=1.0)
+
+    report = replay_mission(path, mission)
+    assert report["finished"], report["error"]
+    assert len(report["legs"]) == 2
+    assert max(speeds) == pytest.approx(vehicle.max_speed, rel=0.05)
+    first, last = report["legs"]
+    # Leg A: time_to_go memutuskan tiba lebih awal dari threshold 1.5 m rekaman
+    assert first["arrival_t"] < first["recorded_end"]
+    assert 1.5 < first["dist"] <= 1.0 * vehicle.max_speed * 1.05
+    # Leg B (hover): tetap menunggu threshold, selesai di sampel hover rekaman
+    assert last["dist"] <= 0.5
+    assert last["arrival_t"] > last["recorded_end"]
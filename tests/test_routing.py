@@ -0,0 +1,48 @@
+"""Frame waypoint di optimize_route() (routing.py)."""
+
+import pytest
+
+from irc_mission.distance import equirectangular_distance
+from irc_mission.frames import FRAME_ABSOLUTE, FRAME_HOME, FRAME_PREVIOUS, resolve_targets
+from irc_mission.routing import optimize_route
+from irc_mission.sim import SimLocation
+
+HOME = (-6.5569, 106.7308, 0.0)
+
+
+def _same_points(before, after, frame=FRAME_PREVIOUS):
+    """Titik absolut rute asli dan hasil optimasi sama, hanya urutannya berbeda."""
+    original = {name: point for name, point in zip(resolve_targets(before, HOME, frame).names,
+                                                   resolve_targets(before, HOME, frame))}
+    for name, point in zip(resolve_targets(after, HOME).names, resolve_targets(after, HOME)):
+        assert equirectangular_distance(SimLocation(*point), SimLocation(*original[name])) < 0.5
+
+
+def test_home_frame_points_are_not_chained():
+    route = [
+        {"name": "A", "d_north": 100, "d_east": 0, "altitude": 10},
+        {"name": "B", "d_north": 0, "d_east": 10, "altitude": 10},
+        {"name": "C", "d_north": 100, "d_east": 10, "altitude": 10},
+    ]
+    waypoints, report = optimize_route(route, frame=FRAME_HOME)
+    assert [wp["name"] for wp in waypoints] == ["B", "C", "A"]
+    assert all(wp["frame"] == FRAME_PREVIOUS for wp in waypoints)
+    assert report["original"] == pytest.approx(100 + 100.5 + 100, abs=0.1)
+    _same_points(route, waypoints, FRAME_HOME)
+
+
+def test_mixed_frames_with_absolute_points():
+    route = [
+        {"name": "A", "d_north": 80, "d_east": 0, "altitude": 10},
+        {"name": "B", "frame": FRAME_ABSOLUTE, "lat": HOME[0], "lon": HOME[1] + 0.0001, "altitude": 10},
+        {"name": "C", "d_north": 0, "d_east": 30, "altitude": 10, "frame": FRAME_HOME},
+    ]
+    waypoints, _ = optimize_route(route, home=HOME)
+    assert all("lat" not in wp and wp["frame"] == FRAME_PREVIOUS for wp in waypoints)
+    _same_points(route, waypoints)
+
+
+def test_absolute_frame_needs_home():
+    route = [{"name": "A", "lat": HOME[0], "lon": HOME[1], "altitude": 10}]
+    with pytest.raises(ValueError):
+        optimize_route(route, frame=FRAME_ABSOLUTE)
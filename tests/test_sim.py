@@ -0,0 +1,86 @@
+"""Model kinematik dan link SimVehicle (sim.py)."""
+
+import pytest
+
+from irc_mission.geo import get_distance
+from irc_mission.sim import SimLocation, SimVehicle
+
+
+def _airborne(altitude=10.0, **kwargs):
+    vehicle = SimVehicle(**kwargs)
+    vehicle.advance(vehicle.armable_after)
+    vehicle.mode = "GUIDED"
+    vehicle.advance(vehicle.mode_delay + vehicle.dt)
+    vehicle.armed = True
+    vehicle.simple_takeoff(altitude)
+    vehicle.advance(altitude / vehicle.climb_rate + 1.0)
+    return vehicle
+
+
+def _fly_to(vehicle, d_north, seconds):
+    home = vehicle.location.global_relative_frame
+    target = SimLocation(home.lat + d_north / 111195.0, home.lon, home.alt)
+    vehicle.simple_goto(target)
+    top = 0.0
+    for _ in range(int(seconds / vehicle.dt)):
+        vehicle.step()
+        top = max(top, vehicle.groundspeed)
+    return target, top
+
+
+def test_arm_rejected_until_armable():
+    vehicle = SimVehicle(armable_after=2.0)
+    vehicle.mode = "GUIDED"
+    vehicle.advance(0.5)
+    vehicle.armed = True
+    assert not vehicle.armed
+    vehicle.advance(2.0)
+    vehicle.armed = True
+    assert vehicle.armed
+
+
+def test_mode_change_confirmed_after_delay():
+    vehicle = SimVehicle(mode_delay=0.3)
+    vehicle.mode = "LOITER"
+    vehicle.advance(0.2)
+    assert vehicle.mode.name == "STABILIZE"
+    vehicle.advance(0.15)
+    assert vehicle.mode.name == "LOITER"
+
+
+def test_takeoff_and_goto_respect_limits():
+    vehicle = _airborne(10.0, max_speed=5.0)
+    assert vehicle.location.global_relative_frame.alt == pytest.approx(10.0, abs=0.05)
+    target, top = _fly_to(vehicle, 60.0, 25.0)
+    assert top <= 5.0 + 1e-9
+    assert get_distance(vehicle.location.global_relative_frame, target) < 0.5
+
+
+def test_same_commands_same_result():
+    first, second = _airborne(), _airborne()
+    _fly_to(first, 40.0, 7.0)
+    _fly_to(second, 40.0, 7.0)
+    a, b = first.location.global_relative_frame, second.location.global_relative_frame
+    assert (a.lat, a.lon, a.alt) == (b.lat, b.lon, b.alt)
+
+
+def test_position_rate_and_link_drop():
+    vehicle = SimVehicle(position_rate=10.0)
+    received = []
+    vehicle.add_message_listener("GLOBAL_POSITION_INT", lambda *_: received.append(vehicle.time))
+    vehicle.advance(2.0)
+    assert len(received) == pytest.approx(20, abs=1)
+    vehicle.drop_link(1.0)
+    count = len(received)
+    vehicle.advance(0.9)
+    assert len(received) == count
+    vehicle.advance(0.5)
+    assert len(received) > count
+
+
+def test_land_disarms_on_ground():
+    vehicle = _airborne(5.0)
+    vehicle.mode = "LAND"
+    vehicle.advance(5.0 / vehicle.land_speed + 2.0)
+    assert vehicle.location.global_relative_frame.alt == 0.0
+    assert not vehicle.armed
@@ -0,0 +1,95 @@
+"""Snapshot telemetri immutable dan TelemetryFeed (snapshot.py)."""
+
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from irc_mission.clock import SimClock
+from irc_mission.sim import SimMode, SimVehicle
+from irc_mission.snapshot import TelemetryFeed, TelemetrySnapshot
+
+
+def _snapshot():
+    return TelemetrySnapshot(3, 1.5, -6.5569, 106.7308, 10.0, 3.0, 4.0, "GUIDED", True)
+
+
+def test_snapshot_is_immutable():
+    snap = _snapshot()
+    with pytest.raises(AttributeError):
+        snap.alt = 20.0
+    with pytest.raises(AttributeError):
+        del snap.lat
+    with pytest.raises(AttributeError):
+        snap.extra = 1
+    assert not hasattr(snap, "__dict__")
+    assert (snap.seq, snap.alt, snap.mode) == (3, 10.0, "GUIDED")
+    assert snap.groundspeed == pytest.approx(5.0)
+
+
+def test_replace_returns_new_snapshot():
+    snap = _snapshot()
+    changed = snap.replace(4, 2.0, mode="RTL")
+    assert changed is not snap
+    assert (changed.seq, changed.t, changed.mode, changed.lat) == (4, 2.0, "RTL", snap.lat)
+    assert (snap.seq, snap.t, snap.mode) == (3, 1.5, "GUIDED")
+
+
+def _message(i):
+    # Semua field diturunkan dari i, jadi snapshot campuran dua update terdeteksi
+    return SimpleNamespace(lat=-65569000 + i, lon=1067308000 + i, relative_alt=i, vx=i, vy=-i)
+
+
+def test_consistent_view_under_concurrent_listener_updates():
+    vehicle = SimVehicle()
+    vehicle.clock = SimClock(vehicle)
+    positions, toggles = 20000, 5000
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with TelemetryFeed(vehicle) as feed:
+            start = feed.latest.seq
+            done = threading.Event()
+            errors = []
+
+            def reader():
+                last_seq = start
+                while not done.is_set():
+                    snap = feed.latest
+                    i = round(snap.lat * 1e7) + 65569000
+                    if snap.seq and not (round(snap.lon * 1e7) - 1067308000 == i
+                                         and snap.alt == i / 1000.0 and snap.vn == i / 100.0
+                                         and snap.ve == -i / 100.0):
+                        errors.append(snap)
+                    if snap.seq < last_seq:
+                        errors.append(("seq mundur", last_seq, snap.seq))
+                    last_seq = snap.seq
+
+            def positions_thread():
+                for i in range(1, positions + 1):
+                    feed._on_position(vehicle, "GLOBAL_POSITION_INT", _message(i))
+
+            def modes_thread():
+                for k in range(toggles):
+                    feed._on_mode(vehicle, "mode", SimMode("LOITER" if k % 2 else "GUIDED"))
+                    feed._on_armed(vehicle, "armed", k % 2 == 0)
+
+            # Posisi awal dari update pertama agar reader bisa memeriksa konsistensi
+            feed._on_position(vehicle, "GLOBAL_POSITION_INT", _message(0))
+            threads = [threading.Thread(target=f) for f in (reader, positions_thread, modes_thread)]
+            for thread in threads:
+                thread.start()
+            for thread in threads[1:]:
+                thread.join()
+            done.set()
+            threads[0].join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    final = feed.latest
+    # Tidak ada update yang hilang: setiap listener menaikkan seq tepat satu
+    assert final.seq == start + 1 + positions + 2 * toggles
+    assert round(final.lat * 1e7) == -65569000 + positions
+    assert final.mode == "LOITER" and final.armed is False
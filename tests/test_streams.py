@@ -0,0 +1,67 @@
+"""Rate stream per fase (streams.py) terhadap SimVehicle."""
+
+import pytest
+
+from irc_mission.clock import SimClock
+from irc_mission.sim import SimVehicle
+from irc_mission.streams import (
+    MAV_CMD_SET_MESSAGE_INTERVAL,
+    MESSAGE_IDS,
+    PHASE_APPROACH,
+    PHASE_HOVER,
+    StreamRateController,
+)
+
+
+def _recording_vehicle():
+    vehicle = SimVehicle(position_rate=10.0)
+    sent = []
+    send = vehicle.send_mavlink
+
+    def record(message):
+        sent.append(message)
+        send(message)
+
+    vehicle.send_mavlink = record
+    return vehicle, sent
+
+
+def test_phase_change_sends_only_changed_rates():
+    vehicle, sent = _recording_vehicle()
+    streams = StreamRateController(vehicle, clock=SimClock(vehicle)).start()
+    streams.set_phase(PHASE_APPROACH)
+    assert vehicle.position_period == pytest.approx(1 / 20.0)
+    count = len(sent)
+    streams.set_phase(PHASE_APPROACH)
+    assert len(sent) == count
+    streams.stop()
+
+
+def test_stop_restores_default_rates():
+    vehicle, sent = _recording_vehicle()
+    streams = StreamRateController(vehicle, clock=SimClock(vehicle)).start()
+    streams.set_phase(PHASE_APPROACH)
+    streams.set_phase(PHASE_HOVER)
+    del sent[:]
+    streams.stop()
+    assert streams.requested == {}
+    assert {(m.command, int(m.params[0]), m.params[1]) for m in sent} == {
+        (MAV_CMD_SET_MESSAGE_INTERVAL, MESSAGE_IDS["GLOBAL_POSITION_INT"], 0),
+        (MAV_CMD_SET_MESSAGE_INTERVAL, MESSAGE_IDS["HEARTBEAT"], 0),
+    }
+    assert vehicle.position_period == pytest.approx(0.1)
+    assert vehicle.heartbeat_period == pytest.approx(1.0)
+    # Stop kedua tidak mengirim apa-apa lagi
+    del sent[:]
+    streams.stop()
+    assert sent == []
+
+
+def test_observed_rate_follows_requested_rate():
+    vehicle = SimVehicle(position_rate=4.0)
+    clock = SimClock(vehicle)
+    with StreamRateController(vehicle, clock=clock) as streams:
+        streams.set_phase(PHASE_APPROACH)
+        clock.sleep(3.0)
+    rows = {(row["phase"], row["message"]): row for row in streams.report()}
+    assert rows[(PHASE_APPROACH, "GLOBAL_POSITION_INT")]["rate"] == pytest.approx(20.0, rel=0.05)
@@ -0,0 +1,85 @@
+"""Cakupan pola survey (survey.py)."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from irc_mission.frames import FRAME_HOME  # noqa: E402
+from irc_mission.survey import expanding_square, lawnmower, spiral, spiral_rings  # noqa: E402
+
+
+def _path(waypoints):
+    return np.array([(wp["d_north"], wp["d_east"]) for wp in waypoints])
+
+
+def _segment_distance(points, path):
+    """Jarak setiap titik (P, 2) ke polyline (K, 2)."""
+    path = np.vstack((path, path[-1:]))
+    a, b = path[:-1], path[1:]
+    ab = b - a
+    length_sq = np.maximum(np.einsum("ij,ij->i", ab, ab), 1e-12)
+    ap = points[:, None, :] - a[None, :, :]
+    t = np.clip(np.einsum("pij,ij->pi", ap, ab) / length_sq, 0.0, 1.0)
+    nearest = a[None] + t[..., None] * ab[None]
+    return np.min(np.hypot(*(points[:, None, :] - nearest).transpose(2, 0, 1)), axis=1)
+
+
+def _rectangle_samples(height, width, step=0.5):
+    north, east = np.meshgrid(np.arange(0, height + 1e-9, step), np.arange(0, width + 1e-9, step))
+    return np.column_stack((north.ravel(), east.ravel()))
+
+
+def _uncovered(path, samples, spacing):
+    # Footprint menutup spacing/2 ke kiri-kanan lintasan; sudut ring butuh sqrt(2) kali
+    return samples[_segment_distance(samples, path) > spacing / 2 * np.sqrt(2) + 1e-6]
+
+
+@pytest.mark.parametrize("height,width,spacing", [
+    (50, 100, 10), (37, 80, 10), (23, 60, 10), (7, 30, 10), (64, 64, 12),
+])
+def test_spiral_covers_rectangle(height, width, spacing):
+    field = [(0, 0), (0, width), (height, width), (height, 0)]
+    path = _path(spiral(field, 10, spacing=spacing, frame=FRAME_HOME))
+    assert len(_uncovered(path, _rectangle_samples(height, width), spacing)) == 0
+
+
+def test_spiral_center_strip_is_flown():
+    paths = spiral_rings([(0, 0), (0, 100), (50, 100), (50, 0)], 10)
+    # Dua ring (5 m dan 15 m dari tepi) lalu lintasan tengah di north = 25
+    assert len(paths) == 3
+    assert np.allclose(paths[-1][:, 0], 25.0)
+    assert paths[-1][:, 1].min() <= 20.0 + 1e-9 and paths[-1][:, 1].max() >= 80.0 - 1e-9
+    # Sisi lebar 50 m, tidak ada strip tengah yang lolos: setiap titik <= 5 m dari lintasan
+    samples = np.column_stack((np.full(121, 25.0), np.linspace(0, 100, 121)))
+    samples = np.vstack((samples, samples + (4.9, 0), samples - (4.9, 0)))
+    assert _segment_distance(samples, np.concatenate(paths)).max() <= 5.0 + 1e-6
+
+
+def test_spiral_exact_multiple_has_no_center_pass():
+    # Lebar 40 = 2 x 2 x spacing: ring terakhir sudah menutup tengah
+    paths = spiral_rings([(0, 0), (0, 100), (40, 100), (40, 0)], 10)
+    assert len(paths) == 2
+    assert all(np.allclose(path[0], path[-1]) for path in paths)
+
+
+def test_lawnmower_covers_rectangle():
+    field = [(0, 0), (0, 80), (37, 80), (37, 0)]
+    path = _path(lawnmower(field, 10, spacing=10, frame=FRAME_HOME))
+    assert len(_uncovered(path, _rectangle_samples(37, 80), 10)) == 0
+
+
+@pytest.mark.parametrize("radius,spacing,heading", [(30, 10, 0), (25, 10, 0), (100, 15, 30), (5, 10, 0)])
+def test_expanding_square_reaches_radius(radius, spacing, heading):
+    path = _path(expanding_square(10, radius, spacing=spacing, heading=heading, frame=FRAME_HOME))
+    theta = np.radians(heading)
+    a = path[:, 0] * np.cos(theta) + path[:, 1] * np.sin(theta)
+    b = -path[:, 0] * np.sin(theta) + path[:, 1] * np.cos(theta)
+    reach = min(a.max(), -a.min(), b.max(), -b.min())
+    assert reach >= radius - spacing / 2 - 1e-6
+    assert max(np.abs(a).max(), np.abs(b).max()) <= radius + spacing
+    # Seluruh kotak radius x radius tertutup footprint
+    grid = np.arange(-radius, radius + 1e-9, 1.0)
+    ga, gb = np.meshgrid(grid, grid)
+    samples = np.column_stack((ga.ravel() * np.cos(theta) - gb.ravel() * np.sin(theta),
+                               ga.ravel() * np.sin(theta) + gb.ravel() * np.cos(theta)))
+    assert len(_uncovered(path, samples, spacing)) == 0
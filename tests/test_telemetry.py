@@ -0,0 +1,55 @@
+"""Ring buffer dan file biner TelemetryRecorder (telemetry.py)."""
+
+from irc_mission.sim import SimLocation
+from irc_mission.telemetry import TelemetryRecorder, read_telemetry
+
+
+def _record(recorder, count, start=0):
+    for k in range(start, start + count):
+        recorder.record(float(k), 1, "GUIDED", SimLocation(-6.5 + k * 1e-6, 106.7, 10.0), float(k))
+
+
+def test_ring_buffer_wraparound_keeps_newest(tmp_path):
+    path = tmp_path / "tlm.bin"
+    # Tanpa start(): tidak ada thread flush, buffer pasti penuh
+    recorder = TelemetryRecorder(str(path), capacity=8, batch_size=100, console_interval=None)
+    _record(recorder, 20)
+    assert recorder.dropped == 12
+    recorder.start()
+    recorder.close()
+    samples = list(read_telemetry(str(path)))
+    assert [s[0] for s in samples] == [float(k) for k in range(12, 20)]
+    assert recorder.written == 8
+
+
+def test_flush_preserves_order_across_batches(tmp_path):
+    path = tmp_path / "tlm.bin"
+    with TelemetryRecorder(str(path), capacity=64, batch_size=16, console_interval=None) as recorder:
+        _record(recorder, 50)
+        recorder.flush()
+        _record(recorder, 30, start=50)
+    samples = list(read_telemetry(str(path)))
+    assert [s[0] for s in samples] == [float(k) for k in range(80)]
+    assert recorder.dropped == 0
+    assert samples[-1][2] == "GUIDED"
+
+
+def test_truncated_tail_is_ignored(tmp_path):
+    path = tmp_path / "tlm.bin"
+    with TelemetryRecorder(str(path), console_interval=None) as recorder:
+        _record(recorder, 5)
+    with open(path, "ab") as f:
+        f.write(b"\x00" * 7)
+    assert len(list(read_telemetry(str(path)))) == 5
+
+
+def test_telemetry_does_not_load_simulator():
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = ("import sys, irc_mission.telemetry as t; "
+            "print('irc_mission.sim' in sys.modules, t.mode_code('GUIDED'), t.MODE_NAMES[6])")
+    out = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).resolve().parents[1],
+                         capture_output=True, text=True, check=True).stdout.split()
+    assert out == ["False", "4", "RTL"]